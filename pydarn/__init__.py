@@ -13,49 +13,124 @@
 # Modifications:
 # 2022-03-10 MTS - removed radar_fov from the __init__ file
 # 2023-06-20 PXP - added TimeSeriesParams to the __init__ file
+# 2026-10-18 modules are imported on first use of their names (PEP 562)
 """
 Init file to setup the logging configuration and linking pyDARN's
 module, classes, and functions.
+
+The modules are only imported the first time one of their names is used,
+so `import pydarn` does not import matplotlib, cartopy, aacgmv2 or pydarnio
+until they are needed.
 """
 # KEEP THIS FILE AS MINIMAL AS POSSIBLE!
-# ruff: noqa: F401
+import importlib
+
 # version file
 from .version import __version__
 
-# Import io for pyDARN
-from .io.superdarn_io import SuperDARNRead
-
-# Importing pydarn exception classes
-from .exceptions import rtp_exceptions, plot_exceptions, radar_exceptions
-from .exceptions.warning_formatting import (standard_warning_format,
-    only_message_warning_format, partial_record_warning, nightshade_warning)
-
-# importing utils
-from .utils.constants import Re, EARTH_EQUATORIAL_RADIUS, C
-from .utils.citations import Citations
-from .utils.range_estimations import RangeEstimation
-from .utils.virtual_heights import VHModels
-from .utils.conversions import dmap2dict
-from .utils.plotting import (MapParams, TimeSeriesParams, check_data_type,
-    time2datetime, find_record, determine_embargo, add_embargo)
-from .utils.general_utils import GeneralUtils
-from .utils.superdarn_radars import RadarID, SuperDARNRadars
-from .utils.superdarn_cpid import SuperDARNCpids
-from .utils.superdarn_radars import Hemisphere, read_hdw_file, get_hdw_files
-from .utils.scan import find_records_by_datetime, find_records_by_scan
-from .utils.geo import geocentric_coordinates, calculate_azimuth
-from .utils.coordinates import Coords
-from .utils.terminator import terminator
-from .utils.recalculate_elevation import recalculate_elevation
-from .utils.filters import Boxcar
-
-# import plotting
-from .plotting.color_maps import PyDARNColormaps
-from .plotting.projections import Projs
-from .plotting.rtp import RTP
-from .plotting.fan import Fan
-from .plotting.grid import Grid
-from .plotting.acf import ACF
-from .plotting.power import Power
-from .plotting.maps import Maps
-from .plotting.iq import IQ
+# public name: (module, attribute), attribute None for the module itself
+_lazy_imports = {
+    # Import io for pyDARN
+    'SuperDARNRead': ('.io.superdarn_io', 'SuperDARNRead'),
+
+    # Importing pydarn exception classes
+    'rtp_exceptions': ('.exceptions.rtp_exceptions', None),
+    'plot_exceptions': ('.exceptions.plot_exceptions', None),
+    'radar_exceptions': ('.exceptions.radar_exceptions', None),
+    'standard_warning_format': ('.exceptions.warning_formatting',
+                                'standard_warning_format'),
+    'only_message_warning_format': ('.exceptions.warning_formatting',
+                                    'only_message_warning_format'),
+    'partial_record_warning': ('.exceptions.warning_formatting',
+                               'partial_record_warning'),
+    'nightshade_warning': ('.exceptions.warning_formatting',
+                           'nightshade_warning'),
+
+    # importing utils
+    'Re': ('.utils.constants', 'Re'),
+    'EARTH_EQUATORIAL_RADIUS': ('.utils.constants',
+                                'EARTH_EQUATORIAL_RADIUS'),
+    'C': ('.utils.constants', 'C'),
+    'Citations': ('.utils.citations', 'Citations'),
+    'RangeEstimation': ('.utils.range_estimations', 'RangeEstimation'),
+    'VHModels': ('.utils.virtual_heights', 'VHModels'),
+    'dmap2dict': ('.utils.conversions', 'dmap2dict'),
+    'MapParams': ('.utils.plotting', 'MapParams'),
+    'TimeSeriesParams': ('.utils.plotting', 'TimeSeriesParams'),
+    'check_data_type': ('.utils.plotting', 'check_data_type'),
+    'time2datetime': ('.utils.plotting', 'time2datetime'),
+    'find_record': ('.utils.plotting', 'find_record'),
+    'determine_embargo': ('.utils.plotting', 'determine_embargo'),
+    'add_embargo': ('.utils.plotting', 'add_embargo'),
+    'GeneralUtils': ('.utils.general_utils', 'GeneralUtils'),
+    'RadarID': ('.utils.superdarn_radars', 'RadarID'),
+    'SuperDARNRadars': ('.utils.superdarn_radars', 'SuperDARNRadars'),
+    'SuperDARNCpids': ('.utils.superdarn_cpid', 'SuperDARNCpids'),
+    'Hemisphere': ('.utils.superdarn_radars', 'Hemisphere'),
+    'HdwHistory': ('.utils.superdarn_radars', 'HdwHistory'),
+    'read_hdw_file': ('.utils.superdarn_radars', 'read_hdw_file'),
+    'read_hdw_history': ('.utils.superdarn_radars', 'read_hdw_history'),
+    'get_hdw_files': ('.utils.superdarn_radars', 'get_hdw_files'),
+    'find_records_by_datetime': ('.utils.scan', 'find_records_by_datetime'),
+    'find_records_by_scan': ('.utils.scan', 'find_records_by_scan'),
+    'build_scan': ('.utils.scan', 'build_scan'),
+    'build_scan_cube': ('.utils.scan', 'build_scan_cube'),
+    'geocentric_coordinates': ('.utils.geo', 'geocentric_coordinates'),
+    'calculate_azimuth': ('.utils.geo', 'calculate_azimuth'),
+    'calculate_declination': ('.utils.geo', 'calculate_declination'),
+    'Coords': ('.utils.coordinates', 'Coords'),
+    'FOVCache': ('.utils.coordinates', 'FOVCache'),
+    'FOVAtlas': ('.utils.coordinates', 'FOVAtlas'),
+    'AACGMCache': ('.utils.coordinates', 'AACGMCache'),
+    'geographic_fov': ('.utils.coordinates', 'geographic_fov'),
+    'fov_key': ('.utils.coordinates', 'fov_key'),
+    'aacgm_convert': ('.utils.coordinates', 'aacgm_convert'),
+    'gate_azimuth': ('.utils.coordinates', 'gate_azimuth'),
+    'terminator': ('.utils.terminator', 'terminator'),
+    'recalculate_elevation': ('.utils.recalculate_elevation',
+                              'recalculate_elevation'),
+    'calibrate_tdiff': ('.utils.recalculate_elevation', 'calibrate_tdiff'),
+    'Boxcar': ('.utils.filters', 'Boxcar'),
+    'FilterPipeline': ('.utils.filters', 'FilterPipeline'),
+    'FilterCube': ('.utils.filters', 'FilterCube'),
+    'ThresholdFilter': ('.utils.filters', 'ThresholdFilter'),
+    'GroundScatterFilter': ('.utils.filters', 'GroundScatterFilter'),
+    'BeamNoiseFilter': ('.utils.filters', 'BeamNoiseFilter'),
+
+    # import plotting
+    'PyDARNColormaps': ('.plotting.color_maps', 'PyDARNColormaps'),
+    'Projs': ('.plotting.projections', 'Projs'),
+    'RTP': ('.plotting.rtp', 'RTP'),
+    'Fan': ('.plotting.fan', 'Fan'),
+    'Grid': ('.plotting.grid', 'Grid'),
+    'ACF': ('.plotting.acf', 'ACF'),
+    'Power': ('.plotting.power', 'Power'),
+    'Maps': ('.plotting.maps', 'Maps'),
+    'IQ': ('.plotting.iq', 'IQ'),
+}
+
+# sub-packages, these import their modules on attribute access too
+_subpackages = ('exceptions', 'io', 'plotting', 'utils')
+
+__all__ = ['__version__'] + list(_lazy_imports)
+
+
+def __getattr__(name):
+    """
+    Imports the module of a public name the first time the name is used
+    """
+    if name in _lazy_imports:
+        module_name, attribute = _lazy_imports[name]
+        module = importlib.import_module(module_name, __name__)
+        value = module if attribute is None else getattr(module, attribute)
+    elif name in _subpackages:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             "".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports) | set(_subpackages))
@@ -5,6 +5,7 @@
 # 20210909: CJM - Added NoChannelError
 # 20220308 MTS - Added PartialRecordsError()
 # 2022-03-23 MTS - Added NotImplementedError() indicates when something is not implement in pyDARN
+# 2026-10-18 - Added scan_index to NoDataFoundError
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -85,11 +86,18 @@ class NoDataFoundError(Exception):
                  opt_beam_num: int = None,
                  opt_parameter_value: int = None,
                  start_time: datetime.datetime = None,
-                 end_time: datetime.datetime = None):
+                 end_time: datetime.datetime = None,
+                 scan_index: int = None):
         self.parameter = parameter
         self.beam_num = beam_num
         self.opt_beam_num = opt_beam_num
-        if start_time is None or end_time is None:
+        if scan_index is not None:
+            self.scan_index = scan_index
+            self.message = "There is no record with the scan index"\
+                " {scan_index} for the parameter {param}. Try another"\
+                " scan index".format(scan_index=self.scan_index,
+                                     param=self.parameter)
+        elif start_time is None or end_time is None:
             if start_time is not None and beam_num is None:
                 self.parameter = parameter
                 self.start_time = start_time
@@ -27,6 +27,14 @@
 # 2023-06-28: CJM - Refactored return values
 # 2023-10-14: CJM - Add embargoed data method
 # 2024-10-09: DDB - Control marker and its size in plot_radar_position()
+# 2026-10-18: Vectorised ball and stick plotting into single collections
+# 2026-10-18: Added animate for fan movies over many scans
+# 2026-10-18: Added plot_fan_composite for multi-radar fan plots
+# 2026-10-18: Scan arrays are built with build_scan_cube
+# 2026-10-18: AACGM conversions go through aacgm_convert
+# 2026-10-18: MLT conversions are cached in AACGMCache
+# 2026-10-18: get_gate_azm uses the shared gate_azimuth
+# 2026-10-18: the hardware of the plotted date is used
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -47,17 +55,19 @@ import matplotlib.pyplot as plt
 import numpy as np
 import warnings
 
-from matplotlib import ticker, cm, colors, axes
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib import ticker, cm, colors, axes, animation
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.transforms import Affine2D
 from typing import List
 
-# Third party libraries
-import aacgmv2
-
-from pydarn import (PyDARNColormaps, partial_record_warning,
+from pydarn import (PyDARNColormaps,
                     time2datetime, plot_exceptions, SuperDARNRadars, RadarID,
-                    calculate_azimuth, Projs, Coords,
+                    Projs, Coords, FOVCache, AACGMCache,
+                    geographic_fov, fov_key, aacgm_convert, gate_azimuth,
                     find_records_by_datetime, find_records_by_scan,
-                    determine_embargo, add_embargo)
+                    build_scan, build_scan_cube, determine_embargo,
+                    add_embargo)
 
 
 class Fan:
@@ -67,6 +77,8 @@ class Fan:
     Methods
     -------
     plot_fan
+    animate
+    plot_fan_composite
     plot_fov
     plot_radar_position
     plot_radar_label
@@ -260,11 +272,6 @@ class Fan:
         else:
             thetas = beam_corners_lons
 
-        # Get range-gate data and groundscatter array for given scan
-        # fan_shape has no -1 as when given ranges we want to include the
-        # both ends for the ranges given
-        scan = np.zeros((fan_shape[0], fan_shape[1]-1))
-        grndsct = np.zeros((fan_shape[0], fan_shape[1]-1))
         # Colour table and max value selection depending on parameter plotted
         # Load defaults if none given
         if cmap is None:
@@ -290,29 +297,12 @@ class Fan:
         norm = colors.Normalize
         norm = norm(zmin, zmax)
 
-        for rec in matching_records:
-            try:
-                # get a list of gates where there is data
-                slist = rec['slist']
-                # get the beam number for the record
-                beami = rec['bmnum']
-
-                # Exclude ranges larger than the expected maximum.
-                # This is a temporary fix to manage inconsistencies between the
-                # fitacf files and the hardware files. The issue will be
-                # fully resolved when the `rpos` code is committed.
-                good_data = np.where((slist >= ranges[0]) &
-                                     (slist < ranges[1]))
-                slist = slist[good_data]
-                temp_data = rec[parameter][good_data]
-                temp_ground = rec['gflg'][good_data]
-
-                scan[slist-ranges[0], beami] = temp_data
-                grndsct[slist-ranges[0], beami] = temp_ground
-            # if there is no slist field this means partial record
-            except KeyError:
-                partial_record_warning()
-                continue
+        # Get range-gate data and groundscatter array for given scan
+        # fan_shape has no -1 as when given ranges we want to include the
+        # both ends for the ranges given
+        scan, grndsct = Fan.__fill_scan__(matching_records, parameter,
+                                          ranges,
+                                          (fan_shape[0], fan_shape[1]-1))
 
         # Begin plotting by iterating over ranges and beams
         if beam is not None:
@@ -340,100 +330,99 @@ class Fan:
             else:
                 transform = ccrs.PlateCarree()
 
+        fan_mesh = None
+        ground_scatter_mesh = None
         if not ball_and_stick:
-            ax.pcolormesh(thetas, rs,
-                          np.ma.masked_array(scan, ~scan.astype(bool)),
-                          norm=norm, cmap=cmap, transform=transform,
-                          zorder=2)
+            fan_mesh = ax.pcolormesh(thetas, rs,
+                                     np.ma.masked_array(scan,
+                                                        ~scan.astype(bool)),
+                                     norm=norm, cmap=cmap,
+                                     transform=transform, zorder=2)
         else:
             # Get center of each gate instead of edges
-            fan_shape = thetas.shape
-            for i in range(0, fan_shape[0]-1):
-                for j in range(0, fan_shape[1]-1):
-                    t_center = (thetas[i, j] + thetas[i+1, j]
-                                + thetas[i, j+1] + thetas[i+1, j+1]) / 4
-                    r_center = (rs[i, j] + rs[i+1, j]
-                                + rs[i, j+1] + rs[i+1, j+1]) / 4
-                    if scan[i, j] != 0.0:
-                        col = cmap((scan[i, j] - zmin) / (zmax-zmin))
-                        # Plot balls!
-                        ax.scatter(t_center, r_center, color=col, s=1.0,
-                                   transform=transform, zorder=3.0)
-                        # Stick only needed for velocity data
-                        if parameter == 'v':
-                            # Get azimuth in correct coord system
-                            if projs == Projs.POLAR:
-                                lat = r_center
-                                lon = np.degrees(t_center)
-                            else:
-                                lat = r_center
-                                lon = t_center
-                            azm = Fan.get_gate_azm(lon, lat, stid,
-                                                   coords, date)
-
-                            # Make sure each coordinate is in correct
-                            # units again
-                            thetas_calc = np.radians(lon)
-                            rs_calc = lat
-
-                            hemisphere = SuperDARNRadars.radars[stid]\
-                                                        .hemisphere
-
-                            # Find the end point of the stick to plot
-                            # Angle to rotate each vector
-                            alpha = thetas_calc
-
-                            # Convert to Cartesian
-                            start_pos_x = (90 - abs(rs_calc)) \
-                                * np.cos(thetas_calc)
-                            start_pos_y = (90 - abs(rs_calc)) \
-                                * np.sin(thetas_calc)
-
-                            # Results LOS vector in x and y
-                            los_x = -scan[i, j] * np.cos(
-                                    np.radians(-azm * hemisphere.value))
-                            los_y = -scan[i, j] * np.sin(
-                                    np.radians(-azm * hemisphere.value))
-
-                            # Rotate vector into same ref frame
-                            vec_x = (los_x * np.cos(alpha)) \
-                                - (los_y * np.sin(alpha))
-                            vec_y = (los_x * np.sin(alpha)) \
-                                + (los_y * np.cos(alpha))
-
-                            # New vector end points
-                            end_pos_x = start_pos_x\
-                                + (vec_x * hemisphere.value / len_factor)
-                            end_pos_y = start_pos_y\
-                                + (vec_y * hemisphere.value / len_factor)
-                            # Convert back to polar for plotting
-                            end_rs = 90 - (np.sqrt(end_pos_x**2
-                                                   + end_pos_y**2))
-                            end_thetas = np.arctan2(end_pos_y, end_pos_x)
-                            end_rs = end_rs * hemisphere.value
-
-                            # Convert to degrees for geo/mag plots
-                            if projs != Projs.POLAR:
-                                end_thetas = np.degrees(end_thetas)
-                            # Plot sticks!
-                            ax.plot([t_center, end_thetas],
-                                     [r_center, end_rs],
-                                     color=col, zorder=3.0, linewidth=0.5,
-                                     transform=transform)
-
-                    # Plot ground scatter balls (no sticks)
-                    if groundscatter and grndsct[i, j] != 0.0:
-                        ax.scatter(t_center, r_center, c='grey', s=1.0,
-                                   transform=transform, zorder=3.0)
+            t_centers = (thetas[:-1, :-1] + thetas[1:, :-1]
+                         + thetas[:-1, 1:] + thetas[1:, 1:]) / 4
+            r_centers = (rs[:-1, :-1] + rs[1:, :-1]
+                         + rs[:-1, 1:] + rs[1:, 1:]) / 4
+            data_cells = scan != 0.0
+            t_center = t_centers[data_cells]
+            r_center = r_centers[data_cells]
+            values = scan[data_cells]
+            cols = cmap((values - zmin) / (zmax-zmin))
+            # Plot balls!
+            # All balls go in one collection rather than one artist per cell
+            if values.size > 0:
+                ax.scatter(t_center, r_center, color=cols, s=1.0,
+                           transform=transform, zorder=3.0)
+            # Stick only needed for velocity data
+            if parameter == 'v' and values.size > 0:
+                # Get azimuth in correct coord system
+                if projs == Projs.POLAR:
+                    lat = r_center
+                    lon = np.degrees(t_center)
+                else:
+                    lat = r_center
+                    lon = t_center
+                azm = Fan.get_gate_azm(lon, lat, stid, coords, date)
+
+                # Make sure each coordinate is in correct
+                # units again
+                thetas_calc = np.radians(lon)
+                rs_calc = lat
+
+                hemisphere = SuperDARNRadars.radars[stid].hemisphere
+
+                # Find the end point of the stick to plot
+                # Angle to rotate each vector
+                alpha = thetas_calc
+
+                # Convert to Cartesian
+                start_pos_x = (90 - abs(rs_calc)) * np.cos(thetas_calc)
+                start_pos_y = (90 - abs(rs_calc)) * np.sin(thetas_calc)
+
+                # Results LOS vector in x and y
+                los_x = -values * np.cos(np.radians(-azm * hemisphere.value))
+                los_y = -values * np.sin(np.radians(-azm * hemisphere.value))
+
+                # Rotate vector into same ref frame
+                vec_x = (los_x * np.cos(alpha)) - (los_y * np.sin(alpha))
+                vec_y = (los_x * np.sin(alpha)) + (los_y * np.cos(alpha))
+
+                # New vector end points
+                end_pos_x = start_pos_x\
+                    + (vec_x * hemisphere.value / len_factor)
+                end_pos_y = start_pos_y\
+                    + (vec_y * hemisphere.value / len_factor)
+                # Convert back to polar for plotting
+                end_rs = 90 - (np.sqrt(end_pos_x**2 + end_pos_y**2))
+                end_thetas = np.arctan2(end_pos_y, end_pos_x)
+                end_rs = end_rs * hemisphere.value
+
+                # Convert to degrees for geo/mag plots
+                if projs != Projs.POLAR:
+                    end_thetas = np.degrees(end_thetas)
+                # Plot sticks!
+                # segments are (n, 2, 2): start and end point of each stick
+                sticks = np.stack([np.column_stack([t_center, r_center]),
+                                   np.column_stack([end_thetas, end_rs])],
+                                  axis=1)
+                ax.add_collection(LineCollection(sticks, colors=cols,
+                                                 zorder=3.0, linewidth=0.5,
+                                                 transform=transform))
+
+            # Plot ground scatter balls (no sticks)
+            if groundscatter and np.any(grndsct != 0.0):
+                gs_cells = grndsct != 0.0
+                ax.scatter(t_centers[gs_cells], r_centers[gs_cells],
+                           c='grey', s=1.0, transform=transform, zorder=3.0)
 
         # plot the groundscatter as grey fill
         if groundscatter and not ball_and_stick:
             gs_color = colors.ListedColormap(['grey'])
-            ax.pcolormesh(thetas, rs,
-                          np.ma.masked_array(grndsct,
-                                             ~grndsct.astype(bool)),
-                          cmap=gs_color,
-                          transform=transform, zorder=3)
+            ground_scatter_mesh = ax.pcolormesh(
+                thetas, rs, np.ma.masked_array(grndsct,
+                                               ~grndsct.astype(bool)),
+                cmap=gs_color, transform=transform, zorder=3)
         if ccrs is None:
             azm = np.linspace(0, 2 * np.pi, 100)
             r, th = np.meshgrid(rs, azm)
@@ -487,9 +476,544 @@ class Fan:
                 'data': {'beam_corners_lats': beam_corners_lats,
                          'beam_corners_lons': beam_corners_lons,
                          'scan_data': scan,
-                         'ground_scatter': grndsct}
+                         'ground_scatter': grndsct,
+                         'plot_data': fan_mesh,
+                         'plot_ground_scatter': ground_scatter_mesh}
                 }
 
+    @staticmethod
+    def __fill_scan__(records: List[dict], parameter: str, ranges: List[int],
+                      shape: tuple):
+        """
+        Fills the gate x beam arrays of a scan with the given parameter
+        and ground scatter flag from the records, see build_scan_cube
+
+        Parameters
+        ----------
+            records: List[dict]
+                records of the scan
+            parameter: str
+                key name of the parameter to fill the scan with
+            ranges: List[int]
+                range bounds of the scan, as [lower_bound, upper_bound]
+            shape: tuple
+                shape of the scan arrays (gates, beams)
+
+        Returns
+        -------
+            scan: np.ndarray
+                gates x beams array of the parameter, 0 where no data
+            grndsct: np.ndarray
+                gates x beams array of the ground scatter flag
+        """
+        # Partial records are skipped with a single warning
+        cube, _ = build_scan_cube(records, (parameter, 'gflg'),
+                                  ranges=ranges, shape=shape, fill_value=0)
+        return cube[parameter], cube['gflg']
+
+    @staticmethod
+    def animate(dmap_data: List[dict], scan_indices: List[int] = None,
+                filename: str = None, writer=None, fps: float = 2,
+                dpi: float = None, ranges: List[int] = None,
+                parameter: str = 'v', groundscatter: bool = False,
+                projs: Projs = Projs.POLAR,
+                coords: Coords = Coords.AACGM_MLT, channel: int = 'all',
+                title: bool = True, **kwargs):
+        """
+        Animates a radar's fan plot over a sequence of scans. The
+        projection, base map, FOV geometry and colour bar are set up once
+        with plot_fan for the first scan, after that only the colours of
+        the fan are updated for each scan.
+
+        Parameters
+        -----------
+            dmap_data: List[dict]
+                Named list of dictionaries obtained from SDarn_read
+            scan_indices: List[int]
+                Scan numbers to animate, see scan_index in plot_fan
+                Default: every scan in the data
+            filename: str
+                file name to save the animation to, e.g. 'fan.mp4' or
+                'fan.gif'. If writer is 'frames' the file name is a format
+                string taking the frame number, e.g. 'fan_{:03d}.png',
+                and each frame is saved as an image.
+                Default: None, the animation is not saved
+            writer: str or matplotlib.animation.MovieWriter
+                matplotlib animation writer used to save the animation
+                or 'frames' to save individual frames
+                Default: 'pillow' for gif files else matplotlib's default
+            fps: float
+                frames per second of the animation
+                Default: 2
+            dpi: float
+                resolution of the saved animation or frames
+                Default: None, matplotlib's default
+            ranges: List[int]
+                Range bounds to plot, as [lower_bound, upper_bound].
+                Default: Plots all ranges out to max given in hardware file.
+            parameter: str
+                Key name indicating which parameter to plot.
+                Default: v (Velocity). Alternatives: 'p_l', 'w_l', 'elv'
+            groundscatter : bool
+                Set true to indicate if groundscatter should be plotted in grey
+                Default: False
+            projs: Enum
+                choice of projection for plot
+                default: Projs.POLAR (polar projection)
+            coords: Enum
+                choice of plotting coordinates
+                default: Coords.AACGM_MLT (Magnetic Lat and MLT)
+            channel : int or str
+                integer indicating which channel to plot or 'all' to
+                plot all channels
+                Default: 'all'
+            title: bool
+                if true then the title is updated with the time of each scan
+                default: true
+            kwargs: key = value
+                Additional keyword arguments passed to plot_fan, ball and
+                stick plots are not supported
+
+        Raises
+        ------
+            NoChannelError
+            NoDataFoundError: a scan index has no records
+            NotImplemented: AACGM_MLT coordinates on a non-polar projection
+
+        Returns
+        -----------
+        Dictionary of the plot_fan return values for the first scan with
+        the animation added under 'animation'
+
+        See Also
+        --------
+            plot_fan
+        """
+        if coords == Coords.AACGM_MLT and projs != Projs.POLAR:
+            raise plot_exceptions.NotImplemented("Animating AACGM_MLT "
+                                                 "coordinates is only "
+                                                 "implemented for the polar "
+                                                 "projection")
+        if channel != 'all':
+            opt_channel = dmap_data[0]['channel']
+            dmap_data = [rec for rec in dmap_data if rec['channel'] == channel]
+            if not dmap_data:
+                raise plot_exceptions.NoChannelError(channel, opt_channel)
+
+        # Group the records by scan once instead of searching the records
+        # for every frame
+        scan_numbers = build_scan(dmap_data)
+        if scan_indices is None:
+            scan_indices = np.unique(scan_numbers).astype(int)
+        frames = [[dmap_data[i] for i in np.nonzero(scan_numbers == scan)[0]]
+                  for scan in scan_indices]
+        for scan, records in zip(scan_indices, frames):
+            if not records:
+                raise plot_exceptions.NoDataFoundError(parameter,
+                                                       scan_index=scan)
+
+        stid = RadarID(dmap_data[0]['stid'])
+        if ranges is None or ranges == []:
+            try:
+                ranges = [0, dmap_data[0]['nrang']]
+            except KeyError:
+                ranges = [0, SuperDARNRadars.radars[stid].range_gate_45]
+        fan_plot = Fan.plot_fan(dmap_data, scan_index=scan_indices[0],
+                                ranges=list(ranges), parameter=parameter,
+                                groundscatter=groundscatter, projs=projs,
+                                coords=coords, title=title,
+                                ball_and_stick=False, **kwargs)
+        ax = fan_plot['ax']
+        fig = fan_plot['fig']
+        shape = fan_plot['data']['scan_data'].shape
+        # plot_fan may raise the lower range to fit the gates of the FOV,
+        # the scan array ends at the upper range
+        ranges = [ranges[1] - shape[0], ranges[1]]
+        fan_mesh = fan_plot['data']['plot_data']
+        ground_scatter_mesh = fan_plot['data']['plot_ground_scatter']
+
+        # In MLT the whole plot rotates with time, rather than
+        # recomputing the geometry each frame every artist is shifted
+        # in MLT from the first scan
+        mlt_shift = None
+        if coords == Coords.AACGM_MLT:
+            first_date = time2datetime(frames[0][0])
+            hdw = SuperDARNRadars.hardware(stid, first_date)
+            mlon = aacgm_convert(hdw.geographic.lat, hdw.geographic.lon,
+                                 250, first_date)[1]
+            first_mlt = np.squeeze(AACGMCache.convert_mlt(mlon, first_date))
+            mlt_shift = Affine2D()
+            for artist in ax.lines + ax.collections + ax.texts:
+                artist.set_transform(mlt_shift + artist.get_transform())
+
+        def update(frame):
+            records = frames[frame]
+            scan, grndsct = Fan.__fill_scan__(records, parameter, ranges,
+                                              shape)
+            fan_mesh.set_array(np.ma.masked_array(scan, ~scan.astype(bool)))
+            if ground_scatter_mesh is not None:
+                ground_scatter_mesh.set_array(
+                    np.ma.masked_array(grndsct, ~grndsct.astype(bool)))
+            if mlt_shift is not None:
+                mlt = np.squeeze(AACGMCache.convert_mlt(
+                    mlon, time2datetime(records[0])))
+                mlt_shift.clear().translate(
+                    np.radians((mlt - first_mlt) * 15), 0)
+            if title:
+                ax.set_title(Fan.__add_title__(time2datetime(records[0]),
+                                               time2datetime(records[-1])))
+            return [fan_mesh]
+
+        anim = animation.FuncAnimation(fig, update, frames=len(frames),
+                                       interval=1000 / fps, blit=False)
+        if filename is not None:
+            if writer == 'frames':
+                for frame in range(len(frames)):
+                    update(frame)
+                    fig.savefig(filename.format(frame), dpi=dpi)
+            else:
+                if writer is None and filename.lower().endswith('.gif'):
+                    writer = 'pillow'
+                anim.save(filename, writer=writer, fps=fps, dpi=dpi)
+
+        fan_plot['animation'] = anim
+        return fan_plot
+
+    @staticmethod
+    def plot_fan_composite(dmap_data: List[dict], scan_time: dt.datetime,
+                           scan_time_tolerance: dt.timedelta =
+                           dt.timedelta(seconds=60), ax=None,
+                           parameter: str = 'v', cmap: str = None,
+                           groundscatter: bool = False, zmin: int = None,
+                           zmax: int = None, colorbar: bool = True,
+                           colorbar_label: str = '', cax=None,
+                           title: bool = True, boundary: bool = True,
+                           radar_location: bool = True,
+                           radar_label: bool = False,
+                           line_color: str = 'black',
+                           projs: Projs = Projs.POLAR,
+                           coords: Coords = Coords.AACGM_MLT,
+                           channel: int = 'all', cpus: int = 1, **kwargs):
+        """
+        Plots the fans of many radars for a time window in one pass. The
+        FOV geometry of each radar is taken from FOVCache, or computed in
+        parallel when cpus > 1, and all fans are drawn into a single
+        collection.
+
+        Parameters
+        -----------
+            dmap_data: List[dict]
+                records from all the radars, either one list of records or
+                a list with a list of records for each radar
+            scan_time: dt.datetime
+                Datetime of the scans to plot
+            scan_time_tolerance: dt.timedelta
+                Search radius when filtering scans by datetime. All records
+                with a timestamp of scan_time +/- scan_time_tolerance will
+                be plotted.
+                Default: 60 seconds
+            ax: axes.Axes
+                Pre-defined axis object to pass in
+                Default: Generates a projection for the user
+            parameter: str
+                Key name indicating which parameter to plot.
+                Default: v (Velocity). Alternatives: 'p_l', 'w_l', 'elv'
+            cmap: matplotlib.cm
+                matplotlib colour map
+                Default: Official pyDARN colour map for given parameter
+            groundscatter : bool
+                Set true to indicate if groundscatter should be plotted in grey
+                Default: False
+            zmin: int
+                The minimum parameter value for coloring
+                Default: {'p_l': [0], 'v': [-200], 'w_l': [0], 'elv': [0]}
+            zmax: int
+                The maximum parameter value for  coloring
+                Default: {'p_l': [50], 'v': [200], 'w_l': [250], 'elv': [50]}
+            colorbar: bool
+                Draw a colourbar if True
+                Default: True
+            colorbar_label: str
+                the label that appears next to the colour bar.
+                Default: ''
+            cax: axes.Axes
+                Pre-defined axis for the colorbar.
+                Default: None
+            title: bool
+                if true then will create a title
+                default: true
+            boundary: bool
+                if true then plots the FOV boundaries
+                default: true
+            radar_location: bool
+                Add a dot where each radar is located if True
+                Default: True
+            radar_label: bool
+                Add a label with each radar abbreviation if True
+                Default: False
+            line_color: str
+                color of the boundaries, radar locations and labels
+                Default: black
+            projs: Enum
+                choice of projection for plot
+                default: Projs.POLAR (polar projection)
+            coords: Enum
+                choice of plotting coordinates
+                default: Coords.AACGM_MLT (Magnetic Lat and MLT)
+            channel : int or str
+                integer indicating which channel to plot or 'all' to
+                plot all channels
+                Default: 'all'
+            cpus: int
+                number of processes used to compute FOV geometries that are
+                not cached yet
+                Default: 1
+            kwargs: key = value
+                Additional keyword arguments to be used in projection plotting
+
+        Raises
+        ------
+            NotImplemented: AACGM coordinates on geographic projections
+            NoDataFoundError: no records in the time window
+
+        Returns
+        -----------
+        Dictionary of the axes, colour map and colour bar with the combined
+        collections under data, along with the geometry and scan arrays of
+        each radar under data['radars'] keyed by RadarID
+
+        See Also
+        --------
+            plot_fan
+        """
+        if coords != Coords.GEOGRAPHIC and projs == Projs.GEO:
+            raise plot_exceptions.NotImplemented("AACGM coordinates are"
+                                                 " not implemented for "
+                                                 " geographic projections"
+                                                 " right now, if you would"
+                                                 " like to see it sooner"
+                                                 " please help out at "
+                                                 "https://github.com"
+                                                 "/SuperDARN/pyDARN")
+        if len(dmap_data) > 0 and isinstance(dmap_data[0], list):
+            dmap_data = [rec for records in dmap_data for rec in records]
+        if channel != 'all':
+            dmap_data = [rec for rec in dmap_data if rec['channel'] == channel]
+
+        # Group the records of the time window by radar
+        radar_records = {}
+        for rec in find_records_by_datetime(dmap_data, scan_time,
+                                            scan_time_tolerance):
+            radar_records.setdefault(RadarID(rec['stid']), []).append(rec)
+        if not radar_records:
+            raise plot_exceptions.NoDataFoundError(parameter,
+                                                   start_time=scan_time)
+
+        # Work out the geometry each radar needs, radars with the same
+        # settings share one entry in the cache
+        settings = {}
+        for stid, records in radar_records.items():
+            try:
+                ranges = [0, records[0]['nrang']]
+            except KeyError:
+                ranges = [0, SuperDARNRadars.radars[stid].range_gate_45]
+            settings[stid] = (records[0].get('frang', 180),
+                              records[0].get('rsep', 45), ranges)
+        geometry = Fan.__fov_geometries__(settings, coords, scan_time, cpus,
+                                          **kwargs)
+
+        if cmap is None:
+            cmap = {'p_l': PyDARNColormaps.PYDARN_PLASMA,
+                    'v': PyDARNColormaps.PYDARN_VELOCITY,
+                    'w_l': PyDARNColormaps.PYDARN_VIRIDIS,
+                    'elv': PyDARNColormaps.PYDARN_INFERNO}
+            cmap = cmap[parameter]
+        else:
+            cmap = cm.get_cmap(cmap)
+        defaultzminmax = {'p_l': [0, 50], 'v': [-200, 200],
+                          'w_l': [0, 250], 'elv': [0, 50]}
+        if zmin is None:
+            zmin = defaultzminmax[parameter][0]
+        if zmax is None:
+            zmax = defaultzminmax[parameter][1]
+        norm = colors.Normalize(zmin, zmax)
+
+        # The hemisphere with the most radars sets up the axes
+        hemispheres = [SuperDARNRadars.radars[stid].hemisphere
+                       for stid in radar_records]
+        kwargs['hemisphere'] = max(set(hemispheres), key=hemispheres.count)
+        ax, ccrs = projs(date=scan_time, ax=ax, **kwargs)
+        if ccrs is None:
+            transform = ax.transData
+        else:
+            transform = ccrs.Geodetic()
+
+        def to_axes(lons, lats):
+            # Cartopy would clip every polygon on its own, projecting the
+            # corners once is much faster and matches pcolormesh
+            if ccrs is None:
+                if projs == Projs.POLAR:
+                    return np.radians(lons), lats
+                return lons, lats
+            points = ax.projection.transform_points(ccrs.PlateCarree(),
+                                                    lons, lats)
+            return points[..., 0], points[..., 1]
+
+        cells = []
+        values = []
+        gs_cells = []
+        outlines = []
+        radars = {}
+        for stid, records in radar_records.items():
+            frang, rsep, ranges = settings[stid]
+            lats, lons = geometry[stid]
+            fan_shape = lons.shape
+            if ranges[0] < ranges[1] - fan_shape[0]:
+                ranges[0] = ranges[1] - fan_shape[0] + 1
+            scan, grndsct = Fan.__fill_scan__(records, parameter, ranges,
+                                              (fan_shape[0],
+                                               fan_shape[1]-1))
+            n_gates = ranges[1] - ranges[0]
+            scan = scan[0:n_gates]
+            grndsct = grndsct[0:n_gates]
+            x, y = to_axes(lons[0:n_gates+1], lats[0:n_gates+1])
+            # Corners of every cell in drawing order (gates, beams, 4, 2)
+            quads = np.stack([np.stack([x[:-1, :-1], y[:-1, :-1]], -1),
+                              np.stack([x[1:, :-1], y[1:, :-1]], -1),
+                              np.stack([x[1:, 1:], y[1:, 1:]], -1),
+                              np.stack([x[:-1, 1:], y[:-1, 1:]], -1)],
+                             axis=2)
+            drawable = np.all(np.isfinite(quads), axis=(2, 3))
+            data_cells = (scan != 0) & drawable
+            cells.append(quads[data_cells])
+            values.append(scan[data_cells])
+            if groundscatter:
+                gs_cells.append(quads[(grndsct != 0) & drawable])
+            if boundary:
+                outline = np.concatenate([
+                    np.stack([x[:, 0], y[:, 0]], -1),
+                    np.stack([x[-1, :], y[-1, :]], -1),
+                    np.stack([x[::-1, -1], y[::-1, -1]], -1),
+                    np.stack([x[0, ::-1], y[0, ::-1]], -1)])
+                outlines.append(outline[np.all(np.isfinite(outline),
+                                               axis=1)])
+            if radar_location:
+                Fan.plot_radar_position(stid, ax, date=scan_time,
+                                        line_color=line_color,
+                                        transform=transform, projs=projs,
+                                        coords=coords, ccrs=ccrs, **kwargs)
+            if radar_label:
+                Fan.plot_radar_label(stid, ax, date=scan_time,
+                                     line_color=line_color,
+                                     transform=transform, projs=projs,
+                                     coords=coords, ccrs=ccrs, **kwargs)
+            radars[stid] = {'beam_corners_lats': lats,
+                            'beam_corners_lons': lons,
+                            'scan_data': scan,
+                            'ground_scatter': grndsct}
+
+        fan_collection = PolyCollection(np.concatenate(cells),
+                                        array=np.concatenate(values),
+                                        cmap=cmap, norm=norm,
+                                        edgecolors='none', antialiased=False,
+                                        transform=ax.transData, zorder=2)
+        ax.add_collection(fan_collection)
+        ground_scatter_collection = None
+        if groundscatter:
+            ground_scatter_collection = \
+                PolyCollection(np.concatenate(gs_cells), facecolors='grey',
+                               edgecolors='none', antialiased=False,
+                               transform=ax.transData, zorder=3)
+            ax.add_collection(ground_scatter_collection)
+        if boundary:
+            ax.add_collection(LineCollection(outlines, colors=line_color,
+                                             linewidth=0.5, alpha=0.5,
+                                             transform=ax.transData,
+                                             zorder=3))
+
+        if colorbar is True:
+            mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
+            locator = ticker.MaxNLocator(symmetric=True, min_n_ticks=3,
+                                         integer=True, nbins='auto')
+            ticks = locator.tick_values(vmin=zmin, vmax=zmax)
+            if zmin == 0:
+                extend = 'max'
+            else:
+                extend = 'both'
+            if cax is None:
+                cax = ax.inset_axes([1.1, 0.0, 0.05, 1.0])
+            cb = ax.figure.colorbar(mappable, ax=ax, cax=cax, extend=extend,
+                                    ticks=ticks)
+            if colorbar_label != '':
+                cb.set_label(colorbar_label)
+        else:
+            cb = None
+
+        records = [rec for records in radar_records.values()
+                   for rec in records]
+        timestamps = [time2datetime(rec) for rec in records]
+        if title:
+            ax.set_title(Fan.__add_title__(min(timestamps), max(timestamps)))
+        if any(determine_embargo(time2datetime(recs[0]), recs[0]['cp'],
+                                 SuperDARNRadars.radars[stid].name)
+               for stid, recs in radar_records.items()):
+            add_embargo(plt.gcf())
+
+        return {'ax': ax,
+                'ccrs': ccrs,
+                'cm': cmap,
+                'cb': cb,
+                'fig': plt.gcf(),
+                'data': {'plot_data': fan_collection,
+                         'plot_ground_scatter': ground_scatter_collection,
+                         'radars': radars}
+                }
+
+    @staticmethod
+    def __fov_geometries__(settings: dict, coords: Coords,
+                           date: dt.datetime, cpus: int = 1, **kwargs):
+        """
+        Gets the FOV corner coordinates of several radars, the geographic
+        geometries missing from FOVCache are computed in parallel when
+        cpus > 1
+
+        Parameters
+        ----------
+            settings: dict
+                (frang, rsep, ranges) for each RadarID
+            coords: Coords
+                coordinate system of the geometry
+            date: datetime
+                date of the geometry
+            cpus: int
+                number of processes used for missing geometries
+                Default: 1
+
+        Returns
+        -------
+            geometry: dict
+                (beam_corners_lats, beam_corners_lons) for each RadarID
+        """
+        arguments = {stid: dict(stid=stid, rsep=rsep, frang=frang,
+                                gates=list(ranges), **kwargs)
+                     for stid, (frang, rsep, ranges) in settings.items()}
+        if cpus > 1:
+            missing = {}
+            for stid, args in arguments.items():
+                # the same key geographic_fov reads the geometry with
+                key = fov_key(date=date, **args)
+                if FOVCache.get(key) is None:
+                    missing[key] = args
+            if len(missing) > 1:
+                with ProcessPoolExecutor(max_workers=cpus) as pool:
+                    futures = {key: pool.submit(geographic_fov, date=date,
+                                                **args)
+                               for key, args in missing.items()}
+                    for key, future in futures.items():
+                        FOVCache.put(key, *future.result())
+        # Geographic geometries now come from the cache
+        return {stid: coords(date=date, **args)
+                for stid, args in arguments.items()}
 
     @staticmethod
     def plot_fan_input(data_array: list = [], data_datetime: dt.datetime = [],
@@ -786,7 +1310,7 @@ class Fan:
 
         # This section corrects winding order for cartopy plots on a sphere
         # so that the outline is always anti-clockwise and will fill inside
-        bmsep = SuperDARNRadars.radars[stid].hardware_info.beam_separation
+        bmsep = SuperDARNRadars.hardware(stid, date).beam_separation
         if projs != Projs.POLAR and bmsep < 0:
             beam_corners_lons = beam_corners_lons[::-1]
             beam_corners_lats = beam_corners_lats[::-1]
@@ -915,9 +1439,9 @@ class Fan:
 
         Parameters
         ----------
-            theta: float
-                longitude
-            r: float
+            theta: float or np.ndarray
+                longitude, arrays give the azimuths of many gates at once
+            r: float or np.ndarray
                 latitude
             stid: RadarID
                 station id of radar
@@ -928,25 +1452,15 @@ class Fan:
 
         Returns
         -------
-            azm: float
+            azm: float or np.ndarray
                 azimuth direction of radar from gate in coordinate system
                 given
+
+        See Also
+        --------
+            gate_azimuth in coordinates module
         """
-        # Get position of radar in geographic from hdw files
-        radlat = SuperDARNRadars.radars[stid].hardware_info.geographic.lat
-        radlon = SuperDARNRadars.radars[stid].hardware_info.geographic.lon
-        # Convert radar position to correct coordinate system
-        if coords == Coords.AACGM_MLT or coords == Coords.AACGM:
-            geomag_radar = aacgmv2.get_aacgm_coord(radlat, radlon, 250, date)
-            radlat = geomag_radar[0]
-            radlon = geomag_radar[1]
-            if coords == Coords.AACGM_MLT:
-                mltshift = geomag_radar[1] -\
-                        (aacgmv2.convert_mlt(geomag_radar[1], date) * 15)
-                radlon = geomag_radar[1] - mltshift[0]
-        # Call calculate azimuth function from geo
-        azm = calculate_azimuth(r, theta, 300, radlat, radlon, 300)
-        return azm
+        return gate_azimuth(r, theta, stid, coords, date)
 
     @staticmethod
     def plot_radar_position(stid: RadarID, ax: axes.Axes,
@@ -989,16 +1503,15 @@ class Fan:
             No variables returned
         """
         # Get location of radar
-        lat = SuperDARNRadars.radars[stid].hardware_info.geographic.lat
-        lon = SuperDARNRadars.radars[stid].hardware_info.geographic.lon
+        lat, lon, _ = SuperDARNRadars.hardware(stid, date).geographic
         # Convert to geomag coords
         if coords == Coords.AACGM_MLT or coords == Coords.AACGM:
-            geomag_radar = aacgmv2.get_aacgm_coord(lat, lon, 250, date)
+            geomag_radar = aacgm_convert(lat, lon, 250, date)
             lat = geomag_radar[0]
             lon = geomag_radar[1]
             if coords == Coords.AACGM_MLT:
                 mltshift = geomag_radar[1] -\
-                        (aacgmv2.convert_mlt(geomag_radar[1], date) * 15)
+                        (AACGMCache.convert_mlt(geomag_radar[1], date) * 15)
                 lon = geomag_radar[1] - mltshift
         if projs == Projs.POLAR:
             lon = np.radians(lon)
@@ -1048,7 +1561,7 @@ class Fan:
         # Convert to geomag coords
         if coords == Coords.AACGM_MLT:
             mltshift = lon -\
-                    (aacgmv2.convert_mlt(lon, date) * 15)
+                    (AACGMCache.convert_mlt(lon, date) * 15)
             lon = lon - mltshift
         if projs == Projs.POLAR:
             lon = np.radians(lon)
@@ -5,6 +5,8 @@
 #   20220308 MTS added partial record exception
 #   20230628 CJM refactored return values
 #   20230713 CJM corrected geographic quivers
+#   20261018 MLT conversions are cached in AACGMCache
+#   20261018 declination of the vectors is calculated in one call
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -32,7 +34,8 @@ from typing import List
 import aacgmv2
 
 from pydarn import (PyDARNColormaps, Fan, plot_exceptions, Hemisphere, RadarID,
-                    standard_warning_format, Projs, Coords, GeneralUtils)
+                    standard_warning_format, Projs, Coords,
+                    calculate_declination, AACGMCache)
 
 warnings.formatwarning = standard_warning_format
 
@@ -217,7 +220,7 @@ class Grid():
             # vectors later, called them theta_calc and rs_calc
             # for later use
             shifted_mlts = coord_lons[0, 0] - \
-                (aacgmv2.convert_mlt(coord_lons[0, 0], date) * 15)
+                (AACGMCache.convert_mlt(coord_lons[0, 0], date) * 15)
             shifted_lons = data_lons - shifted_mlts
 
             if projs == Projs.POLAR:
@@ -288,31 +291,11 @@ class Grid():
                         aacgmv2.convert_latlon(gpole_lat, gpole_lon, 300,
                                                date, method_code='A2G')
 
-                    # Flatten array to work on
-                    a_m_flat = []
-                    b_m_flat = []
-                    thetas_flat = thetas.flatten()
-                    rs_flat = rs.flatten()
-                    for i in range(len(rs_flat)):
-                        a_m_flat.append(
-                            GeneralUtils.great_circle(thetas_flat[i],
-                                                      rs_flat[i],
-                                                      gpole_lon,
-                                                      gpole_lat))
-                        b_m_flat.append(
-                            GeneralUtils.great_circle(thetas_flat[i],
-                                                      rs_flat[i],
-                                                      mpole_lon,
-                                                      mpole_lat))
-                    a_m = np.reshape(a_m_flat, rs.shape)
-                    b_m = np.reshape(b_m_flat, rs.shape)
-                    c_m_flat = np.ones(len(rs_flat)) * \
-                        GeneralUtils.great_circle(gpole_lon, gpole_lat,
-                                                  mpole_lon, mpole_lat)
-                    c_m = np.reshape(c_m_flat, rs.shape)
-                    declination = np.arccos((np.cos(c_m) - np.cos(a_m)
-                                             * np.cos(b_m)) /
-                                            (np.sin(a_m) * np.sin(b_m)))
+                    # Angle between geographic and magnetic north at
+                    # every vector at once
+                    declination = calculate_declination(rs, thetas,
+                                                        mpole_lat, mpole_lon,
+                                                        gpole_lat)
 
                     azm_v = azm_v + np.degrees(declination) * hemisphere.value
 
@@ -13,6 +13,8 @@
 # 2022-12-13: CJM - Limited reference vectors to only velocity use
 # 2023-06-28: CJM - Refactored return values
 # 2024-07-11: CJM - Added potential time series plot
+# 2026-10-18: MLT conversions are cached in AACGMCache
+# 2026-10-18: Legendre polynomials are evaluated for all points at once
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -37,17 +39,12 @@ import warnings
 
 from enum import Enum
 from matplotlib import ticker, cm, colors
-from scipy import special
 from typing import List
 
-
-# Third party libraries
-import aacgmv2
-
 from pydarn import (PyDARNColormaps, plot_exceptions, RadarID,
                     standard_warning_format, Re, Hemisphere,
                     time2datetime, find_record, Fan, Projs,
-                    MapParams, TimeSeriesParams)
+                    MapParams, TimeSeriesParams, AACGMCache)
 warnings.formatwarning = standard_warning_format
 
 
@@ -58,6 +55,7 @@ class Maps:
     Methods
     -------
     plot_maps
+    legendre_basis
     calculated_fitted_velocities
     """
 
@@ -239,7 +237,7 @@ class Maps:
                 raise plot_exceptions.PartialRecordsError('model.mlat')
 
         # Arbitrary lon used to calculate the shift required
-        shifted_mlts = 0 - (aacgmv2.convert_mlt(0, date) * 15)
+        shifted_mlts = 0 - (AACGMCache.convert_mlt(0, date) * 15)
         shifted_lons = data_lons - shifted_mlts
         # Note that this "mlons" is adjusted for MLT
         mlons = np.radians(shifted_lons)
@@ -318,19 +316,20 @@ class Maps:
 
             end_mlats = end_mlats * hemisphere.value
 
+            if parameter == MapParams.FITTED_VELOCITY:
+                # Shift HMB lons to MLT, the same for every vector
+                shifted_mlts = \
+                    dmap_data[record]['boundary.mlon'][0] - \
+                    (AACGMCache.convert_mlt(
+                        dmap_data[record]['boundary.mlon'][0], date) * 15)
+                hmblons = (dmap_data[record]['boundary.mlon'] -
+                           shifted_mlts) % 360
+
             # Plot the vector socks (final vector is the reference
             # vector to be plotted later if required)
             if color_vectors is True:
                 for i in range(len(v_mag) - 1):
                     if parameter == MapParams.FITTED_VELOCITY:
-                        # Shift HMB lons to MLT
-                        shifted_mlts = \
-                            dmap_data[record]['boundary.mlon'][0] - \
-                            (aacgmv2.convert_mlt(
-                                dmap_data[record]['boundary.mlon'][0],
-                                date) * 15)
-                        hmblons = (dmap_data[record]['boundary.mlon'] -
-                                   shifted_mlts) % 360
                         # Find where the closest HMB value is, set equivalent
                         # latitude as the lat limit for plotting
                         rounded_mlon = np.degrees(mlons[i]) % 360
@@ -349,14 +348,6 @@ class Maps:
             else:
                 for i in range(len(v_mag) - 1):
                     if parameter == MapParams.FITTED_VELOCITY:
-                        # Shift HMB lons to MLT
-                        shifted_mlts = \
-                            dmap_data[record]['boundary.mlon'][0] - \
-                            (aacgmv2.convert_mlt(
-                                dmap_data[record]['boundary.mlon'][0],
-                                date) * 15)
-                        hmblons = (dmap_data[record]['boundary.mlon'] -
-                                   shifted_mlts) % 360
                         # Find where the closest HMB value is, set equivalent
                         # latitude as the lat limit for plotting
                         rounded_mlon = np.degrees(mlons[i]) % 360
@@ -394,7 +385,7 @@ class Maps:
             elif parameter is MapParams.FITTED_VELOCITY:
                 # Shift HMB lons to MLT
                 shifted_mlts = dmap_data[record]['boundary.mlon'][0] - \
-                        (aacgmv2.convert_mlt(
+                        (AACGMCache.convert_mlt(
                             dmap_data[record]['boundary.mlon'][0], date) * 15)
                 hmblons = (dmap_data[record]['boundary.mlon'] -
                            shifted_mlts) % 360
@@ -446,7 +437,7 @@ class Maps:
             elif parameter is MapParams.FITTED_VELOCITY:
                 # Shift HMB lons to MLT
                 shifted_mlts = dmap_data[record]['boundary.mlon'][0] - \
-                        (aacgmv2.convert_mlt(
+                        (AACGMCache.convert_mlt(
                             dmap_data[record]['boundary.mlon'][0], date) * 15)
                 hmblons = (dmap_data[record]['boundary.mlon'] -
                            shifted_mlts) % 360
@@ -597,6 +588,41 @@ class Maps:
         return (m == 0 and el**2) or ((el != 0)
                                       and (m != 0) and el**2 + 2 * m - 1) or 0
 
+    @classmethod
+    def legendre_basis(cls, x: np.array, fit_order: int):
+        """
+        Associated Legendre polynomials of all degrees and orders up to
+        fit_order for all points at once, the same values and layout as
+        scipy.special.lpmn (including the Condon-Shortley phase)
+
+        Parameters
+        ----------
+            x: Array[float]
+                points to evaluate the polynomials at, -1 <= x <= 1
+            fit_order: int
+                order of the fit
+
+        Returns
+        -------
+            plm: Array[float]
+                polynomials as [point, m, el], 0 where m > el
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        plm = np.zeros((len(x), fit_order + 1, fit_order + 1))
+        # sqrt(1 - x^2)
+        somx2 = np.sqrt((1.0 - x) * (1.0 + x))
+        plm[:, 0, 0] = 1.0
+        for m in range(fit_order + 1):
+            if m > 0:
+                plm[:, m, m] = -(2 * m - 1) * somx2 * plm[:, m - 1, m - 1]
+            if m < fit_order:
+                plm[:, m, m + 1] = (2 * m + 1) * x * plm[:, m, m]
+            # recurrence over the degree
+            for el in range(m + 2, fit_order + 1):
+                plm[:, m, el] = ((2 * el - 1) * x * plm[:, m, el - 1] -
+                                 (el + m - 1) * plm[:, m, el - 2]) / (el - m)
+        return plm
+
     @classmethod
     def calculated_fitted_velocities(cls, mlats: np.array, mlons: np.array,
                                      fit_coefficient: np.array,
@@ -635,17 +661,7 @@ class Maps:
         thetas_prime = alpha * thetas
         x = np.cos(thetas_prime)
 
-        # i is the index of the list
-        # x_i is the element of x at ith index
-        for i, x_i in enumerate(x):
-            temp_poly = special.lpmn(fit_order, fit_order, x_i)
-            if i == 0:
-                legendre_poly = np.append([temp_poly[0]], [temp_poly[0]],
-                                          axis=0)
-            else:
-                legendre_poly = np.append(legendre_poly, [temp_poly[0]],
-                                          axis=0)
-        legendre_poly = np.delete(legendre_poly, 0, 0)
+        legendre_poly = cls.legendre_basis(x, fit_order)
         phi = mlons
 
         # now do the index legender part,
@@ -668,6 +684,10 @@ class Maps:
         q_prime = q_prime[0]
         q = np.array(np.where(thetas != 0.0))
         q = q[0]
+        # the same for all the coefficients
+        cos_prime = np.cos(thetas_prime[q_prime])
+        sin_prime = np.sin(thetas_prime[q_prime])
+        sin_thetas = np.sin(thetas[q])
 
         # finally get to converting coefficients for the potential into
         # coefficients for elec. Field
@@ -681,14 +701,13 @@ class Maps:
                     thetas_ecoeffs[k4, q_prime] =\
                             thetas_ecoeffs[k4, q_prime] -\
                             fit_coefficient_flat[k3] * alpha * el *\
-                            np.cos(thetas_prime[q_prime]) / \
-                            np.sin(thetas_prime[q_prime]) / Re_meters
+                            cos_prime / sin_prime / Re_meters
                     phi_ecoeffs[k4, q] = phi_ecoeffs[k4, q] - \
                         fit_coefficient_flat[k3 + 1] * m /\
-                        np.sin(thetas[q]) / Re_meters
+                        sin_thetas / Re_meters
                     phi_ecoeffs[k4 + 1, q] = phi_ecoeffs[k4 + 1, q] + \
                         fit_coefficient_flat[k3] * m /\
-                        np.sin(thetas[q]) / Re_meters
+                        sin_thetas / Re_meters
 
                 if el < fit_order:
                     k1 = cls.index_legendre(el+1, m)
@@ -701,7 +720,7 @@ class Maps:
                     thetas_ecoeffs[k2, q_prime] =\
                         thetas_ecoeffs[k2, q_prime] + \
                         fit_coefficient_flat[k1] * alpha * (el + 1 + m) / \
-                        np.sin(thetas_prime[q_prime]) / Re_meters
+                        sin_prime / Re_meters
 
                 if m > 0:
                     if k3 >= 0:
@@ -716,21 +735,21 @@ class Maps:
                         thetas_ecoeffs[k4, q_prime] =\
                                 thetas_ecoeffs[k4, q_prime] \
                                 - fit_coefficient_flat[k3] * alpha * el * \
-                                np.cos(thetas_prime[q_prime]) / \
-                                np.sin(thetas_prime[q_prime]) / Re_meters
+                                cos_prime / sin_prime / Re_meters
 
                     if k1 >= 0:
                         thetas_ecoeffs[k2, q_prime] = \
                             thetas_ecoeffs[k2, q_prime] \
                             + fit_coefficient_flat[k1] * alpha *\
-                            (el + 1 + m) / np.sin(thetas_prime[q_prime]) /\
-                            Re_meters
+                            (el + 1 + m) / sin_prime / Re_meters
 
         # Calculate the Electric field positions
         thetas_ecomp = np.zeros(thetas.shape)
         phi_ecomp = np.zeros(thetas.shape)
 
         for m in range(fit_order + 1):
+            cos_mphi = np.cos(m * phi)
+            sin_mphi = np.sin(m * phi)
             for el in range(m, fit_order + 1):
                 k = cls.index_legendre(el, m)
                 # Now in the IDL code we use
@@ -738,7 +757,7 @@ class Maps:
                 # legendre_poly[:,m,l] like here, this is
                 # because we have a different
                 # organization of legendre_poly due to the
-                # way scipy.special.lpmn
+                # way scipy.special.lpmn (and legendre_basis)
                 # stores values in arrays...
                 if m == 0:
                     thetas_ecomp = thetas_ecomp + thetas_ecoeffs[k, :] * \
@@ -747,13 +766,13 @@ class Maps:
                         legendre_poly[:, m, el]
                 else:
                     thetas_ecomp = thetas_ecomp + thetas_ecoeffs[k, :] * \
-                        legendre_poly[:, m, el] * np.cos(m * phi) + \
+                        legendre_poly[:, m, el] * cos_mphi + \
                         thetas_ecoeffs[k+1, :] * legendre_poly[:, m, el] * \
-                        np.sin(m * phi)
+                        sin_mphi
                     phi_ecomp = phi_ecomp + phi_ecoeffs[k, :] * \
-                        legendre_poly[:, m, el] * np.cos(m * phi) + \
+                        legendre_poly[:, m, el] * cos_mphi + \
                         phi_ecoeffs[k+1, :] * legendre_poly[:, m, el] * \
-                        np.sin(m * phi)
+                        sin_mphi
 
         # Store the two components of Efield into a single array
         E_field_fit = np.append([thetas_ecomp], [phi_ecomp], axis=0)
@@ -847,7 +866,7 @@ class Maps:
         """
         # Shift mlon to MLT
         shifted_mlts = mlons[0] - \
-            (aacgmv2.convert_mlt(mlons[0], date) * 15)
+            (AACGMCache.convert_mlt(mlons[0], date) * 15)
         shifted_lons = mlons - shifted_mlts
         mlon = np.radians(shifted_lons)
 
@@ -972,14 +991,7 @@ class Maps:
         alpha = np.pi / theta_max
         x = np.cos(alpha*theta)
         # Legendre Polys
-        for j, xj in enumerate(x):
-            plm_tmp = special.lpmn(fit_order, fit_order, xj)
-            if j == 0:
-                plm_fit = np.append([plm_tmp[0]], [plm_tmp[0]], axis=0)
-            else:
-                plm_fit = np.append(plm_fit, [plm_tmp[0]], axis=0)
-        # Remove first element as it is duplicated to start off the array
-        plm_fit = np.delete(plm_fit, 0, 0)
+        plm_fit = cls.legendre_basis(x, fit_order)
 
         # Eval the potential
         lmax = plm_fit.shape
@@ -988,14 +1000,16 @@ class Maps:
 
         coeff_fit_flat = fit_coefficient.flatten()
         for m in range(lmax):
+            cos_mphi = np.cos(m * phi)
+            sin_mphi = np.sin(m * phi)
             for el in range(m, lmax):
                 k = cls.index_legendre(el, m)
                 if m == 0:
                     v = v + coeff_fit_flat[k] * plm_fit[:, 0, el]
                 else:
-                    v = v + coeff_fit_flat[k] * np.cos(m * phi) \
+                    v = v + coeff_fit_flat[k] * cos_mphi \
                           * plm_fit[:, m, el] + coeff_fit_flat[k+1] \
-                          * np.sin(m * phi) * plm_fit[:, m, el]
+                          * sin_mphi * plm_fit[:, m, el]
 
         pot_arr = np.zeros((num_lons, num_lats))
         pot_arr = np.reshape(v, pot_arr.shape) / 1000.0
@@ -1074,14 +1088,7 @@ class Maps:
         x = np.cos(alpha * theta)
 
         # Legendre Polys
-        for j, xj in enumerate(x):
-            plm_tmp = special.lpmn(fit_order, fit_order, xj)
-            if j == 0:
-                plm_fit = np.append([plm_tmp[0]], [plm_tmp[0]], axis=0)
-            else:
-                plm_fit = np.append(plm_fit, [plm_tmp[0]], axis=0)
-        # Remove first element as it is duplicated to start off the array
-        plm_fit = np.delete(plm_fit, 0, 0)
+        plm_fit = cls.legendre_basis(x, fit_order)
 
         # Eval the potential
         lmax = plm_fit.shape
@@ -1090,14 +1097,16 @@ class Maps:
 
         coeff_fit_flat = fit_coefficient.flatten()
         for m in range(lmax):
+            cos_mphi = np.cos(m * phi)
+            sin_mphi = np.sin(m * phi)
             for el in range(m, lmax):
                 k = cls.index_legendre(el, m)
                 if m == 0:
                     v = v + coeff_fit_flat[k] * plm_fit[:, 0, el]
                 else:
-                    v = v + coeff_fit_flat[k] * np.cos(m * phi) \
+                    v = v + coeff_fit_flat[k] * cos_mphi \
                         * plm_fit[:, m, el] + coeff_fit_flat[k + 1] \
-                        * np.sin(m * phi) * plm_fit[:, m, el]
+                        * sin_mphi * plm_fit[:, m, el]
 
         # Convert from V to kV
         v /= 1000
@@ -1211,7 +1220,7 @@ class Maps:
 
         # Shift mlon to MLT
         shifted_mlts = mlon_u[0, 0] - \
-            (aacgmv2.convert_mlt(mlon_u[0, 0], date) * 15)
+            (AACGMCache.convert_mlt(mlon_u[0, 0], date) * 15)
         shifted_lons = mlon_u - shifted_mlts
         mlon = shifted_lons
 
@@ -12,6 +12,7 @@
 # 2024-05-15 CJM refactored geographic axes to add plot zoom and center, 
 #            and added the geomagnetic version to do the same
 # 2024-07-10 CJM removed cartopy logic to allow full dependency
+# 2026-10-18 coastlines are converted to AACGM in one batched call
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -24,7 +25,6 @@
 """
 Code which generates axis objects for use in plotting functions
 """
-import aacgmv2
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.feature.nightshade import Nightshade
@@ -34,7 +34,8 @@ from matplotlib import axes
 import matplotlib.ticker as mticker
 import numpy as np
 
-from pydarn import (Hemisphere, Re, nightshade_warning)
+from pydarn import (Hemisphere, Re, nightshade_warning, aacgm_convert,
+                    AACGMCache)
 
 
 def convert_geo_coastline_to_mag(geom, date, alt: float = 0.0, mag_lon: bool = False):
@@ -55,27 +56,85 @@ def convert_geo_coastline_to_mag(geom, date, alt: float = 0.0, mag_lon: bool = F
     mag_lon: bool
         Set true to return magnetic longitude, not MLT
     """
-    [mlats, lon_mag, _] = \
-        aacgmv2.convert_latlon_arr(geom.coords.xy[1], geom.coords.xy[0], alt,
-                                       date, method_code='G2A')
+    return convert_geo_coastlines_to_mag([geom], date, alt, mag_lon)[0]
 
-    # Finds the first not nan value to calculate the mlt shift
-    # Substitutes NaN if not found which results in no data to plot
+
+def convert_geo_coastlines_to_mag(geoms: list, date, alt: float = 0.0,
+                                  mag_lon: bool = False):
+    """
+    Converts the coordinates of many coastline geometry objects into
+    AACGM_MLT with a single batched AACGM conversion
+
+    Parameters
+    ----------
+    geoms: List[Shapely Geometry object]
+        line geometries of the coastlines
+    date: datetime object
+        Date of required plot
+    alt: float
+        Altitude in km
+        Default 0 (sea level) for coastlines
+    mag_lon: bool
+        Set true to return magnetic longitude, not MLT
+
+    Returns
+    -------
+    geoms_mag: List[Shapely Geometry object]
+        the geometries in magnetic coordinates
+    """
+    if len(geoms) == 0:
+        return []
+    lons = [np.asarray(geom.coords.xy[0]) for geom in geoms]
+    lats = [np.asarray(geom.coords.xy[1]) for geom in geoms]
+    mlats, lon_mag = aacgm_convert(np.concatenate(lats), np.concatenate(lons),
+                                   alt, date, method_code='G2A')
+    splits = np.cumsum([len(lon) for lon in lons])[:-1]
+    mlats = np.split(np.atleast_1d(mlats), splits)
+    lon_mag = np.split(np.atleast_1d(lon_mag), splits)
+
+    # Finds the first not nan value of each geometry to calculate the mlt
+    # shift. Substitutes NaN if not found which results in no data to plot
     # aacgmv2 will return NaNs as there are some lat/lon combinations that
     # do not correspond to a geomagnetic position.
-    notnan_lon = next((x for x in lon_mag if x == x), float('NaN'))
+    notnan_lons = np.array([next((x for x in lon if x == x), float('NaN'))
+                            for lon in lon_mag])
 
     # Shift to MLT
-    shifted_mlts = notnan_lon - \
-                    (aacgmv2.convert_mlt(notnan_lon, date) * 15)
-    shifted_lons = lon_mag - shifted_mlts
+    shifted_mlts = notnan_lons - \
+        (AACGMCache.convert_mlt(notnan_lons, date) * 15)
+
+    geoms_mag = []
+    for geom, mlat, mlon, shift in zip(geoms, mlats, lon_mag, shifted_mlts):
+        shifted_lons = mlon - shift
+        if mag_lon:
+            mlons = shifted_lons
+        else:
+            mlons = np.radians(shifted_lons)
+        # Return geometry object
+        geoms_mag.append(type(geom)(list(zip(mlons, mlat))))
+    return geoms_mag
 
-    if mag_lon:
-        mlons = shifted_lons
-    else:
-        mlons = np.radians(shifted_lons)
-    # Return geometry object
-    return type(geom)(list(zip(mlons, mlats)))
+
+def coastline_lines(cc) -> list:
+    """
+    Splits the geometries of a cartopy feature into single lines
+
+    Parameters
+    ----------
+    cc: cartopy.feature.Feature
+        coastline feature
+
+    Returns
+    -------
+    lines: List[Shapely Geometry object]
+    """
+    lines = []
+    for geom in cc.geometries():
+        if geom.__class__.__name__ == 'MultiLineString':
+            lines.extend(geom.geoms)
+        else:
+            lines.append(geom)
+    return lines
 
 
 def axis_geomagnetic(date, ax: axes.Axes = None, lowlat: int = 30,
@@ -178,7 +237,7 @@ def axis_geomagnetic(date, ax: axes.Axes = None, lowlat: int = 30,
             for a FuncFormatter operation
         '''
         # Calculate MLT from the mlon values (already shifted)
-        MLT = aacgmv2.convert_mlt(x, date)
+        MLT = AACGMCache.convert_mlt(x, date)
         # Undo the original shift done to the MLT values to get back to 0-23
         unshiftedMLT = MLT + shift
         # Make sure it is cyclical from 0-24
@@ -194,10 +253,10 @@ def axis_geomagnetic(date, ax: axes.Axes = None, lowlat: int = 30,
         # Positions of gridl ines required in MLT
         MLT = [0, 3, 6, 9, 12, 15, 18, 21]
         # Shift MLT to plotting position
-        MLT_gridlines = MLT - (MLT[0] - aacgmv2.convert_mlt(MLT[0], date))
-        shift = MLT[0] - aacgmv2.convert_mlt(MLT[0], date)
+        MLT_gridlines = MLT - (MLT[0] - AACGMCache.convert_mlt(MLT[0], date))
+        shift = MLT[0] - AACGMCache.convert_mlt(MLT[0], date)
         # Convert shifted MLT to mlon
-        mlon_gridlines = aacgmv2.convert_mlt(MLT_gridlines, date, m2a=True)
+        mlon_gridlines = AACGMCache.convert_mlt(MLT_gridlines, date, m2a=True)
         # Put grid lines on the MLT positions
         gl.xlocator = mticker.FixedLocator(mlon_gridlines)
         # format the labels to show MLT values
@@ -209,13 +268,8 @@ def axis_geomagnetic(date, ax: axes.Axes = None, lowlat: int = 30,
                                           cartopy_scale, color='k',
                                           zorder=2.0)
         # Convert geometry object coordinates to MLT
-        geom_mag = []
-        for geom in cc.geometries():
-            if geom.__class__.__name__ == 'MultiLineString':
-                for g in geom.geoms:
-                    geom_mag.append(convert_geo_coastline_to_mag(g, date, mag_lon=True))
-            else:
-                geom_mag.append(convert_geo_coastline_to_mag(geom, date, mag_lon=True))
+        geom_mag = convert_geo_coastlines_to_mag(coastline_lines(cc), date,
+                                                 mag_lon=True)
         cc_mag = cfeature.ShapelyFeature(geom_mag, ccrs.Geodetic(),
                                          color='k', zorder=2.0)
 
@@ -316,13 +370,7 @@ def axis_geomagnetic_polar(date, ax: axes.Axes = None, lowlat: int = 30,
                                           cartopy_scale, color='k',
                                           zorder=2.0)
         # Convert geometry object coordinates to MLT
-        geom_mag = []
-        for geom in cc.geometries():
-            if geom.__class__.__name__ == 'MultiLineString':
-                for g in geom.geoms:
-                    geom_mag.append(convert_geo_coastline_to_mag(g, date))
-            else:
-                geom_mag.append(convert_geo_coastline_to_mag(geom, date))
+        geom_mag = convert_geo_coastlines_to_mag(coastline_lines(cc), date)
         cc_mag = cfeature.ShapelyFeature(geom_mag, ccrs.PlateCarree(),
                                          color='k', zorder=2.0)
         # Plot each geometry object
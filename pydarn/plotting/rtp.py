@@ -12,6 +12,9 @@
 # 2023-06-12 Carley Martin added coordinate plotting method
 # 2023-06-28 Carley Martin refactored return values
 # 2023-10-14 Carley Martin added embargoed data method
+# 2026-10-18 added raster fast path for regular time grids in plot_range_time
+# 2026-10-18 range-time plots are drawn per mode when frang/rsep change
+# 2026-10-18 the rx rise time is taken from the hardware of the start time
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -88,7 +91,8 @@ class RTP:
                         norm=colors.Normalize, cmap: str = None,
                         filter_settings: dict = {},
                         date_fmt: str = '%y/%m/%d\n %H:%M',
-                        round_start: bool = True, **kwargs):
+                        round_start: bool = True, raster: bool = True,
+                        **kwargs):
         """
         Plots a range-time parameter plot of the given
         field name in the dmap_data
@@ -195,6 +199,12 @@ class RTP:
                 option to round the start time to give tick at start of xaxis
                 Set True to round, set False to plot from start of data.
                 Default: True
+        raster: bool=True
+                option to draw the data as an image when the records are
+                on a regular cadence. Images are much cheaper to render and
+                save than a pcolormesh with one quad per cell. Irregular
+                time axes are always drawn with pcolormesh.
+                Default: True
         kwargs:
             used for other methods in pyDARN
                 - reflection_height
@@ -207,8 +217,9 @@ class RTP:
 
         Returns
         -------
-        im: matplotlib.pyplot.pcolormesh
-            matplotlib object from pcolormesh
+        im: matplotlib.pyplot.pcolormesh or matplotlib.image.AxesImage
+            matplotlib object from pcolormesh, or from pcolorfast
+            if the data was drawn as an image
         cb: matplotlib.colorbar
             matplotlib color bar
         cmap: matplotlib.colormaps
@@ -219,6 +230,10 @@ class RTP:
             list representing the y-axis range gates
         z_data: 2D numpy array
             2D array of the parameters values at the given time and range gate
+        segments: list
+            dict of plot_data, x, y, z, frang and rsep for each run of
+            records in the same mode, y and z above are the ones of the
+            first mode
 
         See Also
         ---------
@@ -276,6 +291,8 @@ class RTP:
 
         # x: time date data
         x = []
+        # (frang, rsep) of each column, a file can change modes
+        x_modes = []
 
         # We cannot simply use numpy's built in min and max function
         # because of the groundscatter value :(
@@ -322,6 +339,7 @@ class RTP:
                 # then fill it in with white space
                 for _ in range(0, int(np.floor(diff_time/2.0))):
                     x.append(x[-1] + timedelta(0, 120))
+                    x_modes.append(x_modes[-1])
                     i = len(x) - 1  # offset since we start at 0 not 1
                     if i > 0:
                         z = np.insert(z, len(z), np.zeros([1, y_max]) * np.nan,
@@ -335,6 +353,8 @@ class RTP:
                     # Numpy datetime is used because it properly formats on the
                     # x-axis
                     x.append(rec_time)
+                    x_modes.append((dmap_record.get('frang', 180),
+                                    dmap_record.get('rsep', 45)))
                     # I do this to avoid having an extra loop to just count how
                     # many records contain the beam number
                     i = len(x) - 1  # offset since we start at 0 not 1
@@ -384,21 +404,25 @@ class RTP:
                                      start_time=start_time,
                                      end_time=end_time,
                                      opt_beam_num=cls.dmap_data[0]['bmnum'])
+        # Columns are split into segments of the same mode, each drawn
+        # with the range edges of its mode
+        segments = cls.__mode_segments(x_modes)
         if range_estimation != RangeEstimation.RANGE_GATE:
             # Get rxrise from hardware files (consistent with RST)
-            rxrise = SuperDARNRadars.radars[RadarID(cls.dmap_data[0]['stid'])]\
-                                    .hardware_info.rx_rise_time
-            frang = int(cls.dmap_data[0]['frang'])
-            rsep = int(cls.dmap_data[0]['rsep'])
-
-            y = range_estimation(frang=frang, rxrise=rxrise,
-                                 rsep=rsep, nrang=y_max, **kwargs)
-
-            y0inx = np.min(np.where(np.isfinite(y))[0])
-            y = y[y0inx:]
-            z = z[:, y0inx:]
+            rxrise = SuperDARNRadars.hardware(
+                RadarID(cls.dmap_data[0]['stid']), start_time).rx_rise_time
+            # range edges are calculated once for each mode
+            mode_ranges = {}
+            for _, _, (frang, rsep) in segments:
+                if (frang, rsep) not in mode_ranges:
+                    y_mode = range_estimation(frang=int(frang), rxrise=rxrise,
+                                              rsep=int(rsep), nrang=y_max,
+                                              **kwargs)
+                    y0inx = np.min(np.where(np.isfinite(y_mode))[0])
+                    mode_ranges[(frang, rsep)] = (y_mode[y0inx:], y0inx)
+        else:
+            mode_ranges = {mode: (y, 0) for _, _, mode in segments}
 
-        time_axis, y_axis = np.meshgrid(x, y)
         z_data = np.ma.masked_where(np.isnan(z.T), z.T)
         Default = {'noise.sky': (1e0, 1e5),
                    'tfreq': (8, 22),
@@ -431,28 +455,44 @@ class RTP:
         # set the background color, this needs to happen to avoid
         # the overlapping problem that occurs
         cmap.set_bad(color=background, alpha=background_alpha)
-        # plot!
-        im = ax.pcolormesh(time_axis, y_axis, z_data, lw=0.01,
-                           cmap=cmap, norm=norm, **kwargs)
-
         if isinstance(groundscatter, str):
-            ground_scatter = np.ma.masked_where(z_data != -1000000, z_data)
             gs_color = colors.ListedColormap([groundscatter])
-            ax.pcolormesh(time_axis, y_axis, ground_scatter, lw=0.01,
-                          cmap=gs_color, norm=norm, **kwargs)
-
         elif groundscatter:
-            ground_scatter = np.ma.masked_where(z_data != -1000000, z_data)
             gs_color = colors.ListedColormap(['grey'])
-            ax.pcolormesh(time_axis, y_axis, ground_scatter, lw=0.01,
-                          cmap=gs_color, norm=norm, **kwargs)
+
+        segment_data = []
+        for start, stop, mode in segments:
+            y, y0inx = mode_ranges[mode]
+            # the cell edges of the segment, the last edge is the start
+            # of the next segment or the end time
+            x_segment = x[start:stop + 1]
+            z_segment = z_data[y0inx:, start:stop]
+            # Records on a regular cadence can be drawn as an image instead
+            # of one quad per cell
+            raster_segment = raster and cls.__regular_time_axis(x_segment)
+            # plot!
+            im = cls.__plot_mesh(ax, x_segment, y, z_segment, raster_segment,
+                                 cmap=cmap, norm=norm, **kwargs)
+
+            if groundscatter:
+                ground_scatter = np.ma.masked_where(z_segment != -1000000,
+                                                    z_segment)
+                cls.__plot_mesh(ax, x_segment, y, ground_scatter,
+                                raster_segment, cmap=gs_color, norm=norm,
+                                **kwargs)
+            segment_data.append({'plot_data': im,
+                                 'x': x_segment,
+                                 'y': y,
+                                 'z': z_segment,
+                                 'frang': mode[0],
+                                 'rsep': mode[1]})
 
         # setup some standard axis information
         if ymax is None:
-            ymax = np.max(y)
+            ymax = np.max([np.max(segment['y']) for segment in segment_data])
 
         if ymin is None:
-            ymin = np.min(y)
+            ymin = np.min([np.min(segment['y']) for segment in segment_data])
 
         ax.set_ylim(ymin, ymax)
 
@@ -554,10 +594,11 @@ class RTP:
                 'cm': cmap,
                 'cb': cb,
                 'fig': plt.gcf(),
-                'data': {'plot_data': im,
+                'data': {'plot_data': segment_data[0]['plot_data'],
                          'x': x,
-                         'y': y,
-                         'z': z_data}
+                         'y': segment_data[0]['y'],
+                         'z': segment_data[0]['z'],
+                         'segments': segment_data}
                 }
 
     @classmethod
@@ -1441,7 +1482,95 @@ class RTP:
 
         return pass_flg
 
+    @classmethod
+    def __regular_time_axis(cls, x: List[datetime],
+                            tolerance: float = 0.05) -> bool:
+        """
+        Checks if the time axis of a range-time plot is on a near-uniform
+        cadence so it can be drawn as an image
+
+        Parameters
+        ----------
+        x : List[datetime]
+            cell edges of the time axis, the last edge is the end time of
+            the plot
+        tolerance : float
+            maximum spread of the cell widths relative to the median cell
+            width to still be considered uniform
+            Default: 0.05 (5%)
+
+        Returns
+        -------
+        regular : bool
+            True if the time axis is strictly increasing and near-uniform
+        """
+        widths = np.diff(dates.date2num(x))
+        if len(widths) == 0 or np.any(widths <= 0):
+            return False
+        # The last cell is closed by the end time of the plot so it is
+        # not part of the record cadence
+        cadence = widths[:-1]
+        if len(cadence) == 0:
+            return True
+        return np.ptp(cadence) <= tolerance * np.median(cadence)
+
+    @classmethod
+    def __mode_segments(cls, x_modes: list) -> list:
+        """
+        Splits the columns of a range-time plot into runs of the same
+        mode (frang, rsep)
 
+        Parameters
+        ----------
+        x_modes: List[tuple]
+            (frang, rsep) of each column
+
+        Returns
+        -------
+        segments: List[tuple]
+            (first column, last column + 1, (frang, rsep)) of each run
+        """
+        modes = np.asarray(x_modes).reshape(len(x_modes), -1)
+        starts = np.concatenate(([0], np.flatnonzero(
+            np.any(modes[1:] != modes[:-1], axis=1)) + 1))
+        stops = np.append(starts[1:], len(x_modes))
+        return [(start, stop, x_modes[start])
+                for start, stop in zip(starts, stops)]
+
+    @classmethod
+    def __plot_mesh(cls, ax, x: List[datetime], y: np.ndarray,
+                    z_data: np.ma.MaskedArray, raster: bool, **kwargs):
+        """
+        Draws the range-time cells either with pcolormesh or, for regular
+        time axes, as an image with pcolorfast which picks a plain image
+        when the y-axis is uniform and a non-uniform image otherwise
+
+        Parameters
+        ----------
+        ax : matplotlib.axes
+            axes object to draw on
+        x : List[datetime]
+            cell edges of the time axis
+        y : np.ndarray
+            cell edges of the range axis
+        z_data : np.ma.MaskedArray
+            cell values in shape (len(y)-1, len(x)-1)
+        raster : bool
+            draw the cells as an image
+        kwargs
+            passed to pcolormesh or pcolorfast
+
+        Returns
+        -------
+        im : matplotlib artist
+        """
+        if raster:
+            # pcolorfast only takes numeric axes so the time axis is
+            # set up as a date axis before drawing
+            ax.xaxis_date()
+            return ax.pcolorfast(dates.date2num(x), y, z_data, **kwargs)
+        time_axis, y_axis = np.meshgrid(x, y)
+        return ax.pcolormesh(time_axis, y_axis, z_data, lw=0.01, **kwargs)
 
     @classmethod
     def plot_coord_time(cls, dmap_data: List[dict], parameter: str = 'v',
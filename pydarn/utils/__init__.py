@@ -0,0 +1,13 @@
+# The modules of this sub-package are imported the first time they are
+# used as attributes, see pydarn/__init__.py
+import importlib
+
+
+def __getattr__(name):
+    try:
+        return importlib.import_module('.' + name, __name__)
+    except ModuleNotFoundError as err:
+        if err.name != '{}.{}'.format(__name__, name):
+            raise
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             "".format(__name__, name)) from None
@@ -14,6 +14,17 @@
 # 2022-03-10 MTS added 4 new methods to generate coordinates for the various
 #                enums
 # 2023-08-26 CJM corrected calculations to use bmoff and removed abs()
+# 2026-10-18 added FOVCache, an LRU and optional on-disk cache of the
+#            FOV geometry
+# 2026-10-18 FOV corners are located with one array call instead of a
+#            call per beam and gate
+# 2026-10-18 added aacgm_convert, batched AACGM conversions
+# 2026-10-18 added FOVAtlas, precomputed FOVs of every radar and hardware
+#            epoch in one memory-mappable file
+# 2026-10-18 added AACGMCache, AACGM and MLT conversions cached by time
+# 2026-10-18 added gate_azimuth for whole grids of gates
+# 2026-10-18 added fov_key, the FOVCache key of a geographic_fov call
+# 2026-10-18 the FOV is calculated with the hardware in use on the date
 #
 
 """
@@ -22,70 +33,710 @@ plotting
 """
 import datetime as dt
 import enum
+import hashlib
+import json
 import numpy as np
+import os
+
+from collections import OrderedDict
 
 import aacgmv2
 
 import pydarn
-from pydarn import (geocentric_coordinates, SuperDARNRadars, RangeEstimation,
-                    radar_exceptions, Re, RadarID)
+from pydarn import (geocentric_coordinates, calculate_azimuth,
+                    SuperDARNRadars, RangeEstimation,
+                    radar_exceptions, Re, RadarID, read_hdw_history)
 
 
-def geo_coordinates(stid: RadarID, beams: int = None,
-                    gates: tuple = None, **kwargs):
+class FOVCache:
     """
-    geographic_coordinates calculates the geographic coordinate for a given
-    set of gates and beams
+    Cache of the geographic corner coordinates of radar FOVs.
+
+    The geometry only depends on the radar hardware, the range settings and
+    the range estimation and virtual height models, so it is kept in an in
+    process least recently used (LRU) cache and, optionally, in a directory
+    of .npz files shared between sessions.
+
+    Attributes
+    ----------
+        maxsize: int
+            number of geometries kept in memory
+            Default: 64
+        directory: str
+            directory of the persistent store, None to only cache in memory
+            Default: None
+
+    Methods
+    -------
+        set_directory
+        get
+        put
+        clear
+        key
+    """
+    maxsize = 64
+    directory = None
+    # keyword arguments of the plotting methods that are passed on to the
+    # coordinate methods but do not change the geometry, every other
+    # keyword argument is part of the key
+    plot_keywords = ('alpha', 'ax', 'ball_and_stick', 'beam', 'boundary',
+                     'cartopy_scale', 'ccrs', 'channel', 'cmap',
+                     'coastline', 'coastline_color', 'coastline_linewidth',
+                     'colorbar', 'colorbar_label', 'coords', 'cpus',
+                     'fov_color', 'grid', 'grid_lines', 'groundscatter',
+                     'hemisphere', 'len_factor', 'line_alpha', 'line_color',
+                     'lowlat', 'marker', 'markersize', 'nightshade',
+                     'parameter', 'plot_center', 'plot_extent', 'projs',
+                     'radar_label', 'radar_location', 'scan_time_tolerance',
+                     'title', 'transform', 'zmax', 'zmin')
+    _cache = OrderedDict()
+
+    @classmethod
+    def set_directory(cls, directory: str = None):
+        """
+        Sets the directory of the persistent store, None turns it off
+
+        Parameters
+        ----------
+            directory: str
+                path of the directory, created if it does not exist
+                Default: None
+        """
+        if directory is not None:
+            directory = os.path.expanduser(directory)
+            os.makedirs(directory, exist_ok=True)
+        cls.directory = directory
+
+    @classmethod
+    def clear(cls):
+        """
+        Empties the in memory cache, the persistent store is left as it is
+        """
+        cls._cache.clear()
+
+    @classmethod
+    def key(cls, stid: RadarID, beams: int, gates: tuple, height: float,
+            hardware_info=None, date: dt.datetime = None, **kwargs):
+        """
+        Builds the cache key of a FOV geometry
+
+        Parameters
+        ----------
+            stid: RadarID
+                station id of the radar
+            beams: int
+                number of beams
+            gates: tuple
+                first and last range gate
+            height: float
+                transmutation height [km]
+            hardware_info: _HdwInfo
+                hardware of the radar
+                Default: hardware of the radar on the date
+            date: datetime
+                date of the data, only the hardware in use on the date is
+                part of the key
+                Default: None, current hardware in SuperDARNRadars
+            kwargs:
+                keyword arguments passed to gate2geographic_location, all
+                but the ones in plot_keywords are used
+
+        Returns
+        -------
+            key: tuple
+        """
+        hdw = hardware_info
+        if hdw is None:
+            hdw = SuperDARNRadars.hardware(stid, date)
+        settings = [(keyword, cls._setting(value))
+                    for keyword, value in sorted(kwargs.items())
+                    if keyword not in cls.plot_keywords]
+        return (hdw.stid, hdw.geographic, hdw.boresight, hdw.beam_separation,
+                hdw.rx_rise_time, hdw.beams, beams, tuple(gates), height,
+                tuple(settings))
+
+    @staticmethod
+    def _setting(value):
+        """
+        Hashable value of a keyword argument that is the same in every
+        session
+        """
+        if isinstance(value, enum.Enum):
+            return value.name
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return tuple(FOVCache._setting(item) for item in value)
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+        return value
+
+    @classmethod
+    def _filename(cls, key: tuple):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(cls.directory, 'fov_{}.npz'.format(digest))
+
+    @classmethod
+    def get(cls, key: tuple):
+        """
+        Returns the cached (lats, lons) of the key or None if it is not
+        cached in memory or in the persistent store
+        """
+        if key in cls._cache:
+            cls._cache.move_to_end(key)
+            lats, lons = cls._cache[key]
+            return lats.copy(), lons.copy()
+        if cls.directory is not None and os.path.exists(cls._filename(key)):
+            with np.load(cls._filename(key)) as fov:
+                lats, lons = fov['lats'], fov['lons']
+            cls.put(key, lats, lons, store=False)
+            return lats.copy(), lons.copy()
+        return None
+
+    @classmethod
+    def put(cls, key: tuple, lats: np.ndarray, lons: np.ndarray,
+            store: bool = True):
+        """
+        Adds the (lats, lons) of the key to the cache, evicting the least
+        recently used geometry when full, and to the persistent store if
+        one is set and store is True
+        """
+        cls._cache[key] = (lats.copy(), lons.copy())
+        cls._cache.move_to_end(key)
+        while len(cls._cache) > cls.maxsize:
+            cls._cache.popitem(last=False)
+        if store and cls.directory is not None:
+            # write to a temporary file first so other processes never
+            # read a partial file
+            filename = cls._filename(key)
+            temp = '{}.{}.tmp.npz'.format(filename[:-4], os.getpid())
+            np.savez(temp, lats=lats, lons=lons)
+            os.replace(temp, filename)
+
+
+class FOVAtlas:
+    """
+    Precomputed geographic corner and centre grids of radar FOVs, for
+    every radar and hardware epoch, stored in one memory-mappable file.
+
+    The atlas holds the full grid (all beams of the hardware file and
+    gates 0 to at least the maximum number of range gates in the hardware
+    file) of each geometry, smaller FOVs of the same radar and settings are read as
+    a slice of it. Once an atlas is loaded, geographic_fov reads matching
+    geometries from it instead of calculating them.
+
+    File layout: an 8 byte magic string, the length of the JSON header as
+    an 8 byte little-endian integer, the JSON header, padding to
+    a multiple of 64 bytes and then the float64 grids.
+
+    Attributes
+    ----------
+        filename: str
+            path of the loaded atlas, None if no atlas is loaded
+        modes: tuple
+            (frang, rsep) pairs built by default, the standard mode and
+            the common high resolution modes
+
+    Methods
+    -------
+        build
+        load
+        unload
+        get
+    """
+    filename = None
+    modes = ((180, 45), (180, 30), (180, 15))
+    _magic = b'PYDFOV01'
+    _alignment = 64
+    _entries = {}
+    _data = None
+
+    @staticmethod
+    def geometry_key(key: tuple):
+        """
+        The FOVCache key without the number of beams and gates, the
+        geometries in the atlas are looked up by it
+        """
+        return repr(key[:6] + key[8:])
+
+    @classmethod
+    def build(cls, filename: str, stids: list = None, modes: tuple = None,
+              height: float = 300, gates: int = 225, epochs: bool = True):
+        """
+        Calculates the FOV of every radar, hardware epoch and mode and
+        writes them to an atlas file
+
+        Parameters
+        ----------
+            filename: str
+                path of the atlas file
+            stids: List[RadarID]
+                radars to include
+                Default: every radar in SuperDARNRadars
+            modes: tuple
+                (frang, rsep) pairs to include
+                Default: FOVAtlas.modes
+            height: float
+                transmutation height [km]
+                Default: 300
+            gates: int
+                last range gate of every geometry, the number of gates in
+                the hardware file is used if it is larger
+                Default: 225
+            epochs: bool
+                include every hardware epoch of the hardware files, if
+                False only the current hardware is included
+                Default: True
+
+        Returns
+        -------
+            entries: int
+                number of geometries in the atlas
+        """
+        filename = os.path.expanduser(filename)
+        if stids is None:
+            stids = list(SuperDARNRadars.radars.keys())
+        if modes is None:
+            modes = cls.modes
+        # collect the geometries first, epochs that only differ in
+        # settings that do not change the FOV share one geometry which
+        # covers the largest number of gates
+        geometries = {}
+        for stid in stids:
+            radar = SuperDARNRadars.radars[stid]
+            if epochs:
+                hdws = read_hdw_history(radar.hardware_info.abbrev)
+            else:
+                hdws = [radar.hardware_info]
+            for hdw in hdws:
+                for frang, rsep in modes:
+                    for center in (False, True):
+                        kwargs = {'frang': frang, 'rsep': rsep}
+                        if center:
+                            kwargs['center'] = True
+                        key = FOVCache.key(stid, hdw.beams, (0, 0), height,
+                                           hardware_info=hdw, **kwargs)
+                        name = cls.geometry_key(key)
+                        max_gate = max(gates, hdw.gates)
+                        if name not in geometries or \
+                                geometries[name][1] < max_gate:
+                            geometries[name] = (stid, max_gate, hdw, kwargs)
+
+        entries = {}
+        grids = []
+        offset = 0
+        for name, (stid, max_gate, hdw, kwargs) in geometries.items():
+            lats, lons = _calculate_fov(stid, hdw.beams, (0, max_gate),
+                                        height, hardware_info=hdw, **kwargs)
+            entries[name] = {'offset': offset, 'shape': list(lats.shape)}
+            grids.extend([lats.ravel(), lons.ravel()])
+            offset += 2 * lats.size
+
+        header = json.dumps({'dtype': '<f8', 'entries': entries}).encode()
+        data_offset = len(cls._magic) + 8 + len(header)
+        padding = -data_offset % cls._alignment
+        # write to a temporary file first so other processes never read a
+        # partial atlas
+        temp = '{}.{}.tmp'.format(filename, os.getpid())
+        with open(temp, 'wb') as writer:
+            writer.write(cls._magic)
+            writer.write(len(header).to_bytes(8, 'little'))
+            writer.write(header)
+            writer.write(b' ' * padding)
+            if len(grids) > 0:
+                writer.write(np.concatenate(grids).astype('<f8').tobytes())
+        os.replace(temp, filename)
+        return len(entries)
+
+    @classmethod
+    def load(cls, filename: str):
+        """
+        Memory maps an atlas file, geometries are then read from it
+
+        Parameters
+        ----------
+            filename: str
+                path of the atlas file
+        """
+        filename = os.path.expanduser(filename)
+        with open(filename, 'rb') as reader:
+            if reader.read(len(cls._magic)) != cls._magic:
+                raise ValueError("{} is not a FOV atlas file"
+                                 "".format(filename))
+            header_size = int.from_bytes(reader.read(8), 'little')
+            header = json.loads(reader.read(header_size).decode())
+        data_offset = len(cls._magic) + 8 + header_size
+        data_offset += -data_offset % cls._alignment
+        if len(header['entries']) > 0:
+            cls._data = np.memmap(filename, dtype=header['dtype'], mode='r',
+                                  offset=data_offset)
+        else:
+            cls._data = np.zeros(0)
+        cls._entries = header['entries']
+        cls.filename = filename
+
+    @classmethod
+    def unload(cls):
+        """
+        Closes the loaded atlas
+        """
+        cls._entries = {}
+        cls._data = None
+        cls.filename = None
+
+    @classmethod
+    def get(cls, key: tuple):
+        """
+        Returns the (lats, lons) of a FOVCache key from the loaded atlas or
+        None if there is no atlas or no matching geometry in it
+        """
+        entry = cls._entries.get(cls.geometry_key(key)) \
+            if cls._data is not None else None
+        if entry is None:
+            return None
+        beams, gates = key[6], key[7]
+        shape = entry['shape']
+        # the atlas grid starts at gate 0 and beam 0
+        if gates[0] < 0 or gates[1] + 1 > shape[0] or beams + 1 > shape[1]:
+            return None
+        size = shape[0] * shape[1]
+        offset = entry['offset']
+        lats = cls._data[offset:offset + size].reshape(shape)
+        lons = cls._data[offset + size:offset + 2 * size].reshape(shape)
+        return (np.array(lats[gates[0]:gates[1] + 1, :beams + 1]),
+                np.array(lons[gates[0]:gates[1] + 1, :beams + 1]))
+
+
+class AACGMCache:
+    """
+    Cache of AACGM-v2 conversions and magnetic local time (MLT)
+    conversions by time.
+
+    aacgmv2 sets up (and, when the date moves, reloads) its coefficients
+    for every conversion, so conversions of the same positions or magnetic
+    longitudes at the same time are only done once. Times are floored to
+    buckets of quantisation (counted from 1970-01-01) and the conversion is
+    done at the start of the bucket. aacgmv2 resolves times to the second,
+    so with the default quantisation of one second cached results are
+    identical to uncached ones, larger quantisations trade accuracy for
+    more cache hits.
+
+    Attributes
+    ----------
+        quantisation: datetime.timedelta
+            width of the time buckets
+            Default: 1 second
+        mlt_maxsize: int
+            number of MLT conversions kept
+            Default: 4096
+        convert_maxsize: int
+            number of position conversions (arrays) kept
+            Default: 64
+
+    Methods
+    -------
+        bucket
+        convert_mlt
+        mlt_shift
+        clear
+    """
+    quantisation = dt.timedelta(seconds=1)
+    mlt_maxsize = 4096
+    convert_maxsize = 64
+    _mlt = OrderedDict()
+    _convert = OrderedDict()
+
+    @classmethod
+    def clear(cls):
+        """
+        Empties the cache
+        """
+        cls._mlt.clear()
+        cls._convert.clear()
+
+    @classmethod
+    def bucket(cls, date: dt.datetime):
+        """
+        Start of the time bucket of the date, the time conversions are
+        done at
+        """
+        origin = dt.datetime(1970, 1, 1, tzinfo=date.tzinfo)
+        return origin + ((date - origin) // cls.quantisation) * \
+            cls.quantisation
+
+    @staticmethod
+    def _put(cache: OrderedDict, maxsize: int, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    @classmethod
+    def convert_mlt(cls, arr, date: dt.datetime, m2a: bool = False):
+        """
+        Cached aacgmv2.convert_mlt, converts magnetic longitudes to MLT or
+        MLT to magnetic longitudes
+
+        Parameters
+        ----------
+            arr: float or np.ndarray
+                magnetic longitudes [deg] or MLTs [hours]
+            date: datetime
+                date and time of the conversion
+            m2a: bool
+                convert MLT to magnetic longitude
+                Default: False
+
+        Returns
+        -------
+            out: np.ndarray
+                1D array of the converted values like aacgmv2.convert_mlt
+        """
+        arr = np.atleast_1d(np.asarray(arr, dtype=float))
+        if arr.ndim > 1:
+            raise ValueError("unable to process multi-dimensional arrays")
+        bucket = cls.bucket(date)
+        keys = [(bucket, m2a, value) for value in arr.tolist()]
+        out = np.empty(len(arr))
+        missing = []
+        for i, key in enumerate(keys):
+            if key in cls._mlt:
+                cls._mlt.move_to_end(key)
+                out[i] = cls._mlt[key]
+            else:
+                missing.append(i)
+        if len(missing) > 0:
+            converted = aacgmv2.convert_mlt(arr[missing], bucket, m2a=m2a)
+            out[missing] = converted
+            for i, value in zip(missing, converted):
+                # NaN keys never match, so they are not kept
+                if keys[i][2] == keys[i][2]:
+                    cls._put(cls._mlt, cls.mlt_maxsize, keys[i], value)
+        return out
+
+    @classmethod
+    def mlt_shift(cls, mlon: float, date: dt.datetime):
+        """
+        Shift [deg] from magnetic longitude to MLT in degrees
+        (mlon - MLT * 15) at the date, calculated at mlon
+        """
+        return mlon - cls.convert_mlt(mlon, date)[0] * 15
+
+    @classmethod
+    def convert_latlon(cls, lats: np.ndarray, lons: np.ndarray,
+                       heights: np.ndarray, date: dt.datetime,
+                       method_code: str):
+        """
+        Cached aacgmv2.convert_latlon_arr of 1D arrays, returns
+        (lats, lons)
+        """
+        bucket = cls.bucket(date)
+        points = np.ascontiguousarray(np.column_stack([lats, lons, heights]))
+        key = (bucket, method_code, points.shape,
+               hashlib.sha1(points.tobytes()).digest())
+        if key in cls._convert:
+            cls._convert.move_to_end(key)
+            mlats, mlons = cls._convert[key]
+        else:
+            mlats, mlons, _ = aacgmv2.convert_latlon_arr(lats, lons, heights,
+                                                         bucket,
+                                                         method_code=
+                                                         method_code)
+            cls._put(cls._convert, cls.convert_maxsize, key, (mlats, mlons))
+        return mlats.copy(), mlons.copy()
+
+
+def aacgm_convert(lats: np.ndarray, lons: np.ndarray, height: float,
+                  date: dt.datetime, method_code: str = 'G2A|ALLOWTRACE'):
+    """
+    Converts geographic positions to AACGM-v2 in one
+    aacgmv2.convert_latlon_arr call, identical positions are only
+    converted once and conversions are cached in AACGMCache
+
+    parameters
+    ----------
+        lats: float or np.ndarray
+            geographic latitudes [deg]
+        lons: float or np.ndarray
+            geographic longitudes [deg]
+        height: float or np.ndarray
+            altitude [km], broadcast against the positions
+        date: datetime
+            date and time of the conversion
+        method_code: str
+            aacgmv2 conversion method
+            default: 'G2A|ALLOWTRACE' as used by aacgmv2.get_aacgm_coord
+
+    returns
+    -------
+        mlats: float or np.ndarray
+            AACGM latitudes [deg] in the shape of the input, NaN where the
+            position is not finite or has no AACGM position
+        mlons: float or np.ndarray
+            AACGM longitudes [deg]
+    """
+    lats, lons, heights = np.broadcast_arrays(np.asarray(lats, dtype=float),
+                                              np.asarray(lons, dtype=float),
+                                              np.asarray(height, dtype=float))
+    shape = lats.shape
+    points = np.column_stack([lats.ravel(), lons.ravel(), heights.ravel()])
+    mlats = np.full(len(points), np.nan)
+    mlons = np.full(len(points), np.nan)
+    finite = np.all(np.isfinite(points), axis=1)
+    if np.any(finite):
+        unique, inverse = np.unique(points[finite], axis=0,
+                                    return_inverse=True)
+        inverse = inverse.ravel()
+        unique_mlats, unique_mlons = \
+            AACGMCache.convert_latlon(unique[:, 0], unique[:, 1],
+                                      unique[:, 2], date, method_code)
+        mlats[finite] = unique_mlats[inverse]
+        mlons[finite] = unique_mlons[inverse]
+    return mlats.reshape(shape)[()], mlons.reshape(shape)[()]
+
+
+def geographic_fov(stid: RadarID, beams: int = None, gates: tuple = None,
+                   height: float = 300, date: dt.datetime = None, **kwargs):
+    """
+    Geographic corner coordinates of every beam and gate of a FOV,
+    taken from FOVCache or the loaded FOVAtlas when possible
+
     parameters
     -----------
+        stid: RadarID
+            station id of the radar
+        beams: int
+            number of beams
+            Default: number of beams in the hardware file
+        gates: tuple
+            first and last range gate
+            Default: 0 to the 45 km range gate of the radar
+        height: float
+            transmutation height [km]
+            Default: 300
+        date: datetime
+            date of the data, the hardware in use on the date is used
+            Default: None, current hardware
+        kwargs:
+            passed to gate2geographic_location
 
+    returns
+    -------
+        beam_corners_lats: np.ndarray
+            (gates, beams) geographic latitudes [deg], the rows of gates
+            that do not map to the ground are NaN
+        beam_corners_lons: np.ndarray
+            (gates, beams) geographic longitudes [deg]
     """
+    hdw = SuperDARNRadars.hardware(stid, date)
     if gates is None:
         gates = [0, SuperDARNRadars.radars[stid].range_gate_45]
     if beams is None:
-        beams = SuperDARNRadars.radars[stid].hardware_info.beams
+        beams = hdw.beams
+    key = fov_key(stid, beams, gates, height, hardware_info=hdw, **kwargs)
+    fov = FOVCache.get(key)
+    if fov is not None:
+        return fov
+    fov = FOVAtlas.get(key)
+    if fov is not None:
+        FOVCache.put(key, *fov, store=False)
+        return fov
 
-    # Plus 1 is due to the fact fov files index at 1 so in the plotting
-    # of the boundary there is a subtraction of 1 to offset this as python
-    # converts to index of 0 which my code already accounts for
-    beam_corners_lats = np.zeros((gates[1]-gates[0]+1, beams+1))
-    beam_corners_lons = np.zeros((gates[1]-gates[0]+1, beams+1))
-
-    for beam in range(0, beams+1):
-        for gate in range(gates[0], gates[1]+1):
-            lat, lon = gate2geographic_location(stid=stid, beam=beam,
-                                                range_gate=gate, height=300,
-                                                **kwargs)
-            beam_corners_lats[gate-gates[0], beam] = lat
-            beam_corners_lons[gate-gates[0], beam] = lon
-    y0inx = np.min(np.where(np.isfinite(beam_corners_lats[:,0]))[0])
-    return beam_corners_lats[y0inx:], beam_corners_lons[y0inx:]
+    beam_corners_lats, beam_corners_lons = \
+        _calculate_fov(stid, beams, gates, height, hardware_info=hdw,
+                       **kwargs)
+    FOVCache.put(key, beam_corners_lats, beam_corners_lons)
+    return beam_corners_lats, beam_corners_lons
 
 
-def aacgm_coordinates(stid: pydarn.RadarID, beams: int = None, gates: tuple = None,
-                      date: dt.datetime = dt.datetime.now, **kwargs):
+def fov_key(stid: RadarID, beams: int = None, gates: tuple = None,
+            height: float = 300, date: dt.datetime = None,
+            hardware_info=None, **kwargs):
+    """
+    FOVCache key of the FOV geographic_fov returns for the same
+    arguments, with the same defaults
+
+    parameters
+    -----------
+        stid: RadarID
+            station id of the radar
+        beams: int
+            number of beams
+            Default: number of beams in the hardware file
+        gates: tuple
+            first and last range gate
+            Default: 0 to the 45 km range gate of the radar
+        height: float
+            transmutation height [km]
+            Default: 300
+        date: datetime
+            date of the data, the hardware in use on the date is used
+            Default: None, current hardware
+        hardware_info: _HdwInfo
+            hardware of the radar
+            Default: hardware of the radar on the date
+        kwargs:
+            passed to gate2geographic_location
+
+    returns
+    -------
+        key: tuple
+    """
+    if hardware_info is None:
+        hardware_info = SuperDARNRadars.hardware(stid, date)
     if gates is None:
         gates = [0, SuperDARNRadars.radars[stid].range_gate_45]
     if beams is None:
-        beams = SuperDARNRadars.radars[stid].hardware_info.beams
+        beams = hardware_info.beams
+    return FOVCache.key(stid, beams, gates, height,
+                        hardware_info=hardware_info, **kwargs)
 
+
+def _calculate_fov(stid: RadarID, beams: int, gates: tuple, height: float,
+                   hardware_info=None, **kwargs):
+    """
+    Calculates the geographic corner coordinates of a FOV with the
+    hardware_info (default: current hardware), see geographic_fov
+    """
     # Plus 1 is due to the fact fov files index at 1 so in the plotting
     # of the boundary there is a subtraction of 1 to offset this as python
     # converts to index of 0 which my code already accounts for
-    beam_corners_lats = np.zeros((gates[1]-gates[0]+1, beams+1))
-    beam_corners_lons = np.zeros((gates[1]-gates[0]+1, beams+1))
-
-    for beam in range(0, beams+1):
-        for gate in range(gates[0], gates[1]+1):
-            lat, lon = gate2geographic_location(stid=stid, beam=beam,
-                                                range_gate=gate, height=300,
-                                                **kwargs)
-            geomag = np.array(aacgmv2.get_aacgm_coord(glat=lat,
-                                                      glon=lon,
-                                                      height=250,
-                                                      dtime=date))
-            beam_corners_lats[gate-gates[0], beam] = geomag[0]
-            beam_corners_lons[gate-gates[0], beam] = geomag[1]
+    # All corners are solved together as (gates, beams) grids
+    beam_grid, gate_grid = np.meshgrid(np.arange(0, beams+1),
+                                       np.arange(gates[0], gates[1]+1))
+    beam_corners_lats, beam_corners_lons = \
+        gate2geographic_location(stid=stid, beam=beam_grid,
+                                 range_gate=gate_grid, height=height,
+                                 hardware_info=hardware_info, **kwargs)
+    return beam_corners_lats, beam_corners_lons
+
+
+def geo_coordinates(stid: RadarID, beams: int = None,
+                    gates: tuple = None, **kwargs):
+    """
+    geographic_coordinates calculates the geographic coordinate for a given
+    set of gates and beams
+    parameters
+    -----------
+
+    """
+    beam_corners_lats, beam_corners_lons = \
+        geographic_fov(stid=stid, beams=beams, gates=gates, **kwargs)
+    y0inx = np.min(np.where(np.isfinite(beam_corners_lats[:,0]))[0])
+    return beam_corners_lats[y0inx:], beam_corners_lons[y0inx:]
+
+
+def aacgm_coordinates(stid: pydarn.RadarID, beams: int = None, gates: tuple = None,
+                      date: dt.datetime = dt.datetime.now, **kwargs):
+    if callable(date):
+        date = date()
+    beam_corners_lats, beam_corners_lons = \
+        geographic_fov(stid=stid, beams=beams, gates=gates, date=date,
+                       **kwargs)
+    beam_corners_lats, beam_corners_lons = \
+        aacgm_convert(beam_corners_lats, beam_corners_lons, 250, date)
     y0inx = np.min(np.where(np.isfinite(beam_corners_lats[:,0]))[0])
     return beam_corners_lats[y0inx:], beam_corners_lons[y0inx:]
 
@@ -100,15 +751,56 @@ def convert2MLT(lons: float, date: object, **kwargs):
     fan_shape = lons.shape
     # Work out shift due in MLT
     beam_corners_mlts = np.zeros((fan_shape[0], fan_shape[1]))
-    mltshift = lons[0, 0] - (aacgmv2.convert_mlt(lons[0, 0], date) * 15)
+    mltshift = AACGMCache.mlt_shift(lons[0, 0], date)
     beam_corners_mlts = lons - mltshift
     return beam_corners_mlts
 
 
+def gate_azimuth(lats: np.ndarray, lons: np.ndarray, stid: RadarID,
+                 coords, date: dt.datetime, height: float = 300):
+    """
+    Azimuth from each gate towards the radar in the coordinate system the
+    gate positions are given in, for a whole beam x gate grid in one call
+
+    parameters
+    ----------
+        lats: float or np.ndarray
+            latitudes of the gates [deg]
+        lons: float or np.ndarray
+            longitudes of the gates [deg], MLT in degrees for
+            Coords.AACGM_MLT
+        stid: RadarID
+            station id of the radar
+        coords: Coords
+            coordinate system of the gate positions
+        date: datetime
+            date of the data, used for the hardware and the AACGM
+            coordinate systems
+        height: float
+            altitude of the gates and the radar [km]
+            default: 300
+
+    returns
+    -------
+        azm: float or np.ndarray
+            azimuth of the radar from each gate [deg] in reference to
+            North of the coordinate system
+    """
+    # Get position of radar in geographic from hdw files
+    radlat, radlon, _ = SuperDARNRadars.hardware(stid, date).geographic
+    # Convert radar position to correct coordinate system
+    if coords == Coords.AACGM_MLT or coords == Coords.AACGM:
+        radlat, radlon = aacgm_convert(radlat, radlon, 250, date)
+        if coords == Coords.AACGM_MLT:
+            radlon = radlon - AACGMCache.mlt_shift(radlon, date)
+    return calculate_azimuth(lats, lons, height, radlat, radlon, height)
+
+
 def gate2geographic_location(stid: pydarn.RadarID, beam: int, height: float = None,
                              elv_angle: float = 0.0, center: bool = False,
                              range_estimation: RangeEstimation =
-                             RangeEstimation.SLANT_RANGE, **kwargs):
+                             RangeEstimation.SLANT_RANGE,
+                             hardware_info=None, **kwargs):
     """
     determines the geographic cell position for a given range gate and beam
     Notes: From RPosGeo line 335
@@ -117,8 +809,10 @@ def gate2geographic_location(stid: pydarn.RadarID, beam: int, height: float = No
     ----------
         stid: pydarn.RadarID
             station id of the radar to use
-        beam: int
-            beam number (indexing at 0)
+        beam: int or np.ndarray
+            beam number (indexing at 0), an array of beams is broadcast
+            against the range gates (range_gate keyword) to locate many
+            cells at once
         height: float
             transmutation height [km]
             default: none
@@ -131,32 +825,33 @@ def gate2geographic_location(stid: pydarn.RadarID, beam: int, height: float = No
             False obtains the near-left corner of the range gates.
             See also: gate2slant in range_estimation module
             default: False (return corner values)
+        hardware_info: _HdwInfo
+            hardware of the radar, e.g. of an earlier hardware epoch
+            default: current hardware in SuperDARNRadars
 
     returns
     -------
-        lat: float
+        lat: float or np.ndarray
             latitude of the range gate in geographic coordinates [deg]
-        lon: float
+        lon: float or np.ndarray
             longitude of the range gate in geographic coordinates [deg]
     """
+    hdw = hardware_info
+    if hdw is None:
+        hdw = SuperDARNRadars.radars[stid].hardware_info
     # centre of the field of view
-    offset = SuperDARNRadars.radars[stid].hardware_info.beams / 2.0 - 0.5
+    offset = hdw.beams / 2.0 - 0.5
 
     # Obtain radar information from hardware files all converted to [rad]
     # radians are needed for numpy geometry calculations and to reduce
     # too much converting back and forth.
-    boresight = np.radians(SuperDARNRadars.
-                           radars[stid].hardware_info.boresight.physical)
-    bmoff = np.radians(SuperDARNRadars.
-                       radars[stid].hardware_info.boresight.electronic)
-    radar_lat = np.radians(SuperDARNRadars.
-                           radars[stid].hardware_info.geographic.lat)
-    radar_lon = np.radians(SuperDARNRadars.
-                           radars[stid].hardware_info.geographic.lon)
+    boresight = np.radians(hdw.boresight.physical)
+    bmoff = np.radians(hdw.boresight.electronic)
+    radar_lat = np.radians(hdw.geographic.lat)
+    radar_lon = np.radians(hdw.geographic.lon)
     # Note that some beam separations are negative
-    beam_sep = np.radians(SuperDARNRadars.
-                          radars[stid].hardware_info.beam_separation)
-    rxrise = SuperDARNRadars.radars[stid].hardware_info.rx_rise_time
+    beam_sep = np.radians(hdw.beam_separation)
+    rxrise = hdw.rx_rise_time
 
     # If the user wants the edge corner of the range gate:
     # Radar outwards direction center value is corrected in
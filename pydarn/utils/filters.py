@@ -3,6 +3,13 @@
 #
 # Modifications:
 # 20230202 - CJM: Integrate code into pyDARN
+# 20261018 - boxcar median is calculated on dense (scan, beam, gate) arrays
+# 20261018 - scans are filtered in a process pool when cpus > 1
+# 20261018 - filtered data is merged by time into shallow copies
+# 20261018 - added stream_filter for iterables of records
+# 20261018 - Beam and Scan use __slots__
+# 20261018 - removed the unused Gate class, gflg_type is deprecated
+# 20261018 - added FilterPipeline with stages over a shared FilterCube
 #
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
@@ -16,48 +23,19 @@
 
 """filters.py: Module is dedicated to filters used on FITACF SuperDARN data."""
 
-import copy
 import datetime as dt
 import numpy as np
+import time
 import warnings
 
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from pydarn import standard_warning_format
 
 warnings.formatwarning = standard_warning_format
 
-class Gate(object):
-    """Class object to hold each range cell value
-
-    Methods
-    -------
-    NA
-    """
-    def __init__(self, bm, i, params=["v", "w_l", "gflg", "p_l", "v_e", "elv"],
-                 gflg_type=-1):
-        """
-        Initialize the parameters which will be stored in Gate
-        Parameters
-        ----------
-        bm : beam object
-            A collection of data from the filtering process
-        i : int
-            Index to store in collection
-        params :
-            Parameters to store in collection
-        Returns
-        -------
-        NA
-        """
-        for p in params:
-            if len(getattr(bm, p)) > i:
-                setattr(self, p, getattr(bm, p)[i])
-            else:
-                setattr(self, p, np.nan)
-        if gflg_type >= 0 and len(getattr(bm, "gsflg")[gflg_type]) > 0:
-            setattr(self, "gflg", getattr(bm, "gsflg")[gflg_type][i])
-        return
-
-
 class Beam(object):
     """Class to hold one radar beam
 
@@ -65,9 +43,19 @@ class Beam(object):
     -------
     set
     copy
+    fields
+    items
     """
+    # The parameters used by the filters are slots, other scalar
+    # parameters (some with dotted names like "noise.sky") are kept
+    # in __dict__. _fields keeps the order the parameters were set in.
+    __slots__ = ("time", "bmnum", "scan", "nrang", "channel", "slist",
+                 "v", "w_l", "gflg", "p_l", "v_e", "elv", "_fields",
+                 "__dict__")
+
     def __init__(self):
         """ Initialize the instance """
+        self._fields = ()
         return
 
     def set(self, time, d,
@@ -100,14 +88,24 @@ class Beam(object):
             else:
                 setattr(self, p, [])
         self.time = time
+        self._fields = tuple(dict.fromkeys([*s_params, *v_params, "time"]))
         return
 
     def copy(self, bm):
         """Copy all parameters"""
-        for p in bm.__dict__.keys():
+        for p in bm._fields:
             setattr(self, p, getattr(bm, p))
+        self._fields = bm._fields
         return
 
+    def fields(self):
+        """Names of the parameters in the order they were set"""
+        return self._fields
+
+    def items(self):
+        """(name, value) pairs of the parameters"""
+        return [(p, getattr(self, p)) for p in self._fields]
+
 
 class Scan(object):
     """Class to hold one radar scans
@@ -116,6 +114,8 @@ class Scan(object):
     -------
     update_time
     """
+    __slots__ = ("beams", "stime", "etime", "scan_time")
+
     def __init__(self):
         """ Initialize the instance """
         self.beams = []
@@ -138,6 +138,7 @@ class FetchData(object):
 
     Methods
     -------
+    record_beam
     parse_data
     """
     def __init__(self, beam_sounds):
@@ -175,6 +176,33 @@ class FetchData(object):
         self.scans, self.beams = [], []
         return
 
+    def record_beam(self, d):
+        """
+        Converts a fitacf record to a Beam object
+
+        Parameters
+        ----------
+        d: Dict
+            SuperDARN fitacf record
+
+        Returns
+        -------
+        bm: Object
+            Beam of the record
+        """
+        time = dt.datetime(
+            d["time.yr"],
+            d["time.mo"],
+            d["time.dy"],
+            d["time.hr"],
+            d["time.mt"],
+            d["time.sc"],
+            d["time.us"]
+        )
+        bm = Beam()
+        bm.set(time, d, self.s_params, self.v_params)
+        return bm
+
     def parse_data(self, by="scan"):
         """
         Parse data by data type
@@ -189,18 +217,7 @@ class FetchData(object):
         NA
         """
         for d in self.beam_sounds:
-            time = dt.datetime(
-                d["time.yr"],
-                d["time.mo"],
-                d["time.dy"],
-                d["time.hr"],
-                d["time.mt"],
-                d["time.sc"],
-                d["time.us"]
-            )
-            bm = Beam()
-            bm.set(time, d, self.s_params, self.v_params)
-            self.beams.append(bm)
+            self.beams.append(self.record_beam(d))
         if by == "scan":
             sc = Scan()
             sc.beams.append(self.beams[0])
@@ -224,9 +241,22 @@ class Boxcar(object):
     -------
     format_data_for_pydarn
     run_filter
+    stream_filter
+    filter_cube
+    __index_beam_sounds__
+    __merge_record__
+    __beam_sounds__
+    __stream_window__
+    __parallel_filter__
     __discard_repeating_beams__
+    __stack_cube__
     __do_filter__
+    __filtered_scan__
     """
+    # FilterPipeline stage
+    name = 'boxcar'
+    fusable = False
+
     def __init__(self, thresh=0.7, w=None, gflg_type=-1):
         """
         Initialize variables
@@ -241,11 +271,18 @@ class Boxcar(object):
             Lower and upper bounds of IS / GS probability
         pth: float
             Probability of the threshold
+        gflg_type: int
+            Deprecated, the gflg of the records is always used
 
         Returns
         -------
         NA
         """
+        if gflg_type != -1:
+            # gflg_type selected a gsflg array that the records read by
+            # Boxcar never have
+            warnings.warn("gflg_type is deprecated and ignored, the gflg"
+                          " of the records is used", DeprecationWarning)
         self.thresh = thresh
         if w is None:
             w = np.array(
@@ -272,48 +309,98 @@ class Boxcar(object):
         Returns
         -------
         NA
+
+        Notes
+        -----
+        The records are shallow copies, the fields the filter does not
+        change are the arrays of original_data
         """
-        # Deep copy original fitacf data
-        self.copied_data = copy.deepcopy(original_data)
+        filtered_records = self.__index_beam_sounds__(
+            self.filtered_data["beam_sounds"])
         # For each record in the fitacf data, find matching time in
         # filtered data, replace with the new filtered data
-        for r, record in enumerate(original_data):
-            # Track to see if match is found or not
-            match_found = False
-            record_time = dt.datetime(record["time.yr"], record["time.mo"],
-                                      record["time.dy"], record["time.hr"],
-                                      record["time.mt"], record["time.sc"],
-                                      record["time.us"])
-            for frec in self.filtered_data["beam_sounds"]:
-                if record_time == frec['time']:
-                    match_found = True
-                    if not bool(frec['slist']):
-                        # If new data is empty remove it from dictionary
-                        self.copied_data[r].pop('slist', None)
-                        self.copied_data[r].pop('v', None)
-                        self.copied_data[r].pop('w_l', None)
-                        self.copied_data[r].pop('p_l', None)
-                        self.copied_data[r].pop('elv', None)
-                        self.copied_data[r].pop('gflg', None)
-                    else:
-                        # Replace the data with new filtered data if there is
-                        # new data to replace it
-                        self.copied_data[r]['slist'] = np.array(frec['slist'])
-                        self.copied_data[r]['v'] = np.array(frec['v'])
-                        self.copied_data[r]['w_l'] = np.array(frec['w_l'])
-                        self.copied_data[r]['p_l'] = np.array(frec['p_l'])
-                        self.copied_data[r]['elv'] = np.array(frec['elv'])
-                        self.copied_data[r]['gflg'] = np.array(frec['gflg'])
-            # If no match is found for the record, then
-            # empty the fields, new data needs to be empty
-            if not match_found:
-                self.copied_data[r].pop('slist', None)
-                self.copied_data[r].pop('v', None)
-                self.copied_data[r].pop('w_l', None)
-                self.copied_data[r].pop('elv', None)
-                self.copied_data[r].pop('gflg', None)
+        self.copied_data = [self.__merge_record__(record, filtered_records)
+                            for record in original_data]
         return
 
+    @staticmethod
+    def __index_beam_sounds__(beam_sounds):
+        """
+        Filtered beam sounds by time, beam and channel, several beam
+        sounds can have the same time (e.g. from different channels)
+
+        Parameters
+        ----------
+        beam_sounds: List[Dict]
+            filtered beam sounds
+
+        Returns
+        -------
+        filtered_records: dict
+            beam sound for each (time, bmnum, channel)
+        """
+        return {(frec['time'], frec['bmnum'], frec['channel']): frec
+                for frec in beam_sounds}
+
+    @staticmethod
+    def __merge_record__(record, filtered_records):
+        """
+        Shallow copy of a fitacf record with the filtered data of the
+        filtered beam sound of the same time, beam and channel
+
+        Parameters
+        ----------
+        record: Dict
+            SuperDARN fitacf record
+        filtered_records: dict
+            filtered beam sounds, see __index_beam_sounds__
+
+        Returns
+        -------
+        copied_record: Dict
+            record with the filtered fields
+        """
+        filtered_fields = ('slist', 'v', 'w_l', 'p_l', 'elv', 'gflg')
+        copied_record = dict(record)
+        record_time = dt.datetime(record["time.yr"], record["time.mo"],
+                                  record["time.dy"], record["time.hr"],
+                                  record["time.mt"], record["time.sc"],
+                                  record["time.us"])
+        frec = filtered_records.get((record_time, record.get('bmnum'),
+                                     record.get('channel')))
+        # If no match is found for the record, then
+        # empty the fields, new data needs to be empty
+        if frec is None:
+            for field in ('slist', 'v', 'w_l', 'elv', 'gflg'):
+                copied_record.pop(field, None)
+        elif len(frec['slist']) == 0:
+            # If new data is empty remove it from dictionary
+            for field in filtered_fields:
+                copied_record.pop(field, None)
+        else:
+            # Replace the data with new filtered data if there is
+            # new data to replace it
+            for field in filtered_fields:
+                copied_record[field] = np.asarray(frec[field])
+        return copied_record
+
+    @staticmethod
+    def __beam_sounds__(beams):
+        """
+        Converts filtered Beam objects to dictionaries
+
+        Parameters
+        ----------
+        beams: List[Object]
+            filtered beams
+
+        Returns
+        -------
+        beam_sounds: List[Dict]
+            attributes of each beam
+        """
+        return [OrderedDict(b.items()) for b in beams]
+
     def run_filter(self, beam_sounds, cpus=1):
         """
         Set data and convert to scan objects
@@ -323,8 +410,9 @@ class Boxcar(object):
         beam_sounds: List[Dict]
             List of SuperDARN fitacf data
         cpus: int
-            Number of cpus available/rdesired
-            to run in parallel (UNUSED)
+            Number of processes used to filter the scans, the stacks
+            of three scans are filtered in parallel when cpus > 1
+            Default: 1
 
         Returns
         -------
@@ -332,7 +420,7 @@ class Boxcar(object):
             List of dictionaries that contain
             the new filtered data
         """
-        warnings.warn('The boxcar filter may take 5-10 minutes to filter a ' +
+        warnings.warn('The boxcar filter may take a few seconds to filter a ' +
                       'two hour FITACF file. For more information on this ' +
                       'filter see the documentation at ' +
                       'https://pydarn.readthedocs.io/en/main/') 
@@ -344,36 +432,213 @@ class Boxcar(object):
         self.scan_stacks = [fd.scans[i - 1: i + 2]
                             for i in range(1, len(fd.scans) - 1)]
         self.filtered_data = {"scans": [], "beams": [], "beam_sounds": []}
-        if cpus > 1:
-            # TODO: Parallel processing options
-            # ray.init(num_cpus=cpus)
-            # futures = [
-            #    self.bx.doFilter.remote(scan_stack, comb=comb,
-            #                            gflg_type=gflg_type)
-            #    for scan_stack in scan_stacks
-            # ]
-            # self.filtered_data["scans"] = ray.get(futures)
-            pass
+        if cpus > 1 and len(self.scan_stacks) > 1:
+            scans = self.__parallel_filter__(self.scan_stacks, cpus)
         else:
-            from collections import OrderedDict
             scans = [
                 self.__do_filter__(scan_stack)
                 for scan_stack in self.scan_stacks
             ]
-            beams = []
-            for s in scans:
-                beams.extend(s.beams)
-            self.filtered_data["scans"] = scans
-            self.filtered_data["beams"] = beams
-            self.filtered_data["beam_sounds"] = [
-                OrderedDict([(k, getattr(b, k)) for k in b.__dict__.keys()])
-                for b in beams
-            ]
-            # Format the data for pyDARN plotting and return the new
-            # filtered version of the fitacf data
-            self.format_data_for_pydarn(beam_sounds)
+        beams = []
+        for s in scans:
+            beams.extend(s.beams)
+        self.filtered_data["scans"] = scans
+        self.filtered_data["beams"] = beams
+        self.filtered_data["beam_sounds"] = self.__beam_sounds__(beams)
+        # Format the data for pyDARN plotting and return the new
+        # filtered version of the fitacf data
+        self.format_data_for_pydarn(beam_sounds)
         return self.copied_data
 
+    def stream_filter(self, beam_sounds):
+        """
+        Filters an iterable of records scan by scan, keeping only three
+        scans in memory. Each record is yielded as soon as its scan and
+        the next scan are complete.
+
+        Parameters
+        ----------
+        beam_sounds: Iterable[Dict]
+            SuperDARN fitacf records, e.g. a generator reading files
+
+        Yields
+        ------
+        record: Dict
+            records in input order with the filtered data, the same as the
+            records returned by run_filter
+
+        See Also
+        --------
+        run_filter : filters a list of records
+        """
+        warnings.warn('The boxcar filter may not be applicable to all data, '+
+                      'for example, the boxcar filter should not be applied '+
+                      'to twofsound data.')
+        fd = FetchData([])
+        # (scan, records) of the last three complete scans
+        window = deque(maxlen=3)
+        scan, records = None, []
+        for record in beam_sounds:
+            beam = fd.record_beam(record)
+            if scan is not None and beam.scan == 1:
+                scan.update_time()
+                window.append((scan, records))
+                yield from self.__stream_window__(window)
+                scan, records = None, []
+            if scan is None:
+                scan = Scan()
+            scan.beams.append(beam)
+            records.append(record)
+        if scan is not None:
+            window.append((scan, records))
+            yield from self.__stream_window__(window)
+            # the last scan is never at the centre of a stack
+            if len(window) > 1:
+                for record in records:
+                    yield self.__merge_record__(record, {})
+
+    def filter_cube(self, cube):
+        """
+        Boxcar filter of a FilterCube as a stage of a FilterPipeline,
+        filters the same stacks of three scans as run_filter
+
+        Parameters
+        ----------
+        cube: Object
+            FilterCube of the records, the gates and values of the
+            parameters are replaced by the filtered ones
+        """
+        params_to_run_filter = [p for p in cube.params if p != 'gflg']
+        nrecords, ngates = cube.gates.shape
+        candidates = np.flatnonzero(cube.kept & cube.gates.any(axis=1))
+        kept = np.zeros(nrecords, dtype=bool)
+        results = []
+        if len(candidates) > 0:
+            # (scan, beam) grid of the first record of each beam with
+            # data in each scan, see __discard_repeating_beams__
+            first_beam = cube.bmnum[candidates].min() - 1
+            nbeams = cube.bmnum[candidates].max() - first_beam + 2
+            nscans = cube.scan[-1] + 1
+            grid = np.full((nscans, nbeams), nrecords)
+            np.minimum.at(grid, (cube.scan[candidates],
+                                 cube.bmnum[candidates] - first_beam),
+                          candidates)
+            beams = grid < nrecords
+            # dense (scan, beam, gate) arrays with an empty gate on
+            # either side, sliced into the stack cubes
+            dense = {'gates': np.zeros((nscans, nbeams, ngates + 2),
+                                       dtype=bool), 'missing': {}}
+            dense['gates'][beams, 1:-1] = cube.gates[grid[beams]]
+            for p in cube.params:
+                dense[p] = np.zeros((nscans, nbeams, ngates + 2),
+                                    dtype=cube.values[p].dtype)
+                dense[p][beams, 1:-1] = cube.values[p][grid[beams]]
+                dense['missing'][p] = np.zeros((nscans, nbeams, ngates + 2),
+                                               dtype=bool)
+                dense['missing'][p][beams, 1:-1] =\
+                    cube.missing[p][grid[beams]]
+            for j in range(1, nscans - 1):
+                centre = np.flatnonzero(beams[j])
+                if len(centre) == 0:
+                    continue
+                rows = grid[j, centre]
+                nrang = cube.nrang[rows]
+                stack = slice(j - 1, j + 2)
+                columns = slice(0, nrang.max() + 2)
+                stack_cube = {'beams': beams[stack],
+                              'gates': dense['gates'][stack, :, columns],
+                              'centre': centre, 'nrang': nrang,
+                              'missing': {p: dense['missing'][p][stack, :,
+                                                                 columns]
+                                          for p in cube.params}}
+                for p in cube.params:
+                    stack_cube[p] = dense[p][stack, :, columns]
+                results.append((rows, _filter_cube(stack_cube, self.w,
+                                                   self.thresh,
+                                                   params_to_run_filter)))
+                kept[rows] = True
+        gates = np.zeros((nrecords, ngates), dtype=bool)
+        values = {}
+        for p in cube.params:
+            dtypes = [filtered[p].dtype for _, filtered in results]
+            values[p] = np.zeros((nrecords, ngates), dtype=np.result_type(
+                *dtypes) if dtypes else cube.values[p].dtype)
+            cube.missing[p] = np.zeros((nrecords, ngates), dtype=bool)
+        for rows, filtered in results:
+            for q, slist in enumerate(filtered['slist']):
+                gates[rows[q], slist] = True
+            columns = filtered['gflg'].shape[1]
+            for p in cube.params:
+                values[p][rows, :columns] = filtered[p]
+                cube.missing[p][rows, :columns] = filtered['missing'][p]
+        cube.gates = gates
+        cube.values = values
+        cube.kept = kept
+
+    def __stream_window__(self, window):
+        """
+        Yields the records that can be filtered after a scan is added to
+        the window of stream_filter
+
+        Parameters
+        ----------
+        window: deque
+            (scan, records) of the last complete scans
+
+        Yields
+        ------
+        record: Dict
+            records with the filtered data
+        """
+        if len(window) == 1:
+            # the first scan is never at the centre of a stack
+            filtered_records = {}
+        elif len(window) == 3:
+            oscan = self.__do_filter__([scan for scan, _ in window])
+            filtered_records = self.__index_beam_sounds__(
+                self.__beam_sounds__(oscan.beams))
+        else:
+            return
+        centre = 1 if len(window) == 3 else 0
+        for record in window[centre][1]:
+            yield self.__merge_record__(record, filtered_records)
+
+    def __parallel_filter__(self, scan_stacks, cpus,
+                            params_to_run_filter=["v", "w_l", "p_l", "elv"]):
+        """
+        Filters the stacks of three scans in a pool of processes, only the
+        dense arrays of each stack are sent to the processes
+
+        Parameters
+        ----------
+        scan_stacks: List[List[Object]]
+            stacks of three scans
+        cpus: int
+            number of processes
+        params_to_run_filter: list
+            List of parameters to run boxcar filter
+
+        Returns
+        -------
+        scans: List[Object]
+            filtered centre scan of each stack, in the order of the stacks
+        """
+        stacks = [[self.__discard_repeating_beams__(s) for s in scan_stack]
+                  for scan_stack in scan_stacks]
+        cubes = [self.__stack_cube__(stack, params_to_run_filter)
+                 for stack in stacks if len(stack[1].beams) > 0]
+        filter_cube = partial(_filter_cube, w=self.w, thresh=self.thresh,
+                              params_to_run_filter=params_to_run_filter)
+        # a few chunks per process to balance the load
+        chunksize = max(1, len(cubes) // (4 * cpus))
+        with ProcessPoolExecutor(max_workers=cpus) as pool:
+            results = iter(list(pool.map(filter_cube, cubes,
+                                         chunksize=chunksize)))
+        return [self.__filtered_scan__(stack[1], next(results),
+                                       params_to_run_filter)
+                if len(stack[1].beams) > 0 else Scan()
+                for stack in stacks]
+
     def __discard_repeating_beams__(self, scan, ch=True):
         """
         Discard all more than one repeating beams
@@ -405,6 +670,66 @@ class Boxcar(object):
         oscan.beams = sorted(oscan.beams, key=lambda bm: bm.bmnum)
         return oscan
 
+    def __stack_cube__(self, scans, params_to_run_filter):
+        """
+        Places the three scans of a stack into dense (scan, beam, gate)
+        arrays, with an empty beam and gate on either side so every
+        3x3x3 box of the centre scan lies inside the arrays
+
+        Parameters
+        ----------
+        scans: List[Object]
+            three Scan objects without repeating beams
+        params_to_run_filter: list
+            List of parameters to run boxcar filter
+
+        Returns
+        -------
+        cube: dict
+            'beams': (scan, beam) bool array of the beams with data
+            'gates': (scan, beam, gate) bool array of the gates with data
+            'centre': beam axis index of each beam of the centre scan
+            'nrang': number of range gates of each beam of the centre scan
+            'missing': (scan, beam, gate) bool array for each parameter
+            of the gates with data but without a value of the parameter
+            and a (scan, beam, gate) array for each parameter and gflg
+        """
+        bmnums = [bm.bmnum for s in scans for bm in s.beams]
+        first_beam = min(bmnums) - 1
+        nbeams = max(bmnums) - first_beam + 2
+        nrang = [bm.nrang for bm in scans[1].beams]
+        # gates -1 to the largest nrang of the centre scan
+        ngates = max(nrang) + 2
+        cube = {'beams': np.zeros((3, nbeams), dtype=bool),
+                'gates': np.zeros((3, nbeams, ngates), dtype=bool),
+                'centre': np.array([bm.bmnum - first_beam
+                                    for bm in scans[1].beams]),
+                'nrang': np.array(nrang)}
+        cells = []
+        for j, s in enumerate(scans):
+            for bm in s.beams:
+                i = bm.bmnum - first_beam
+                # a gate listed twice uses the first value
+                gates, first = np.unique(np.asarray(bm.slist, dtype=int),
+                                         return_index=True)
+                keep = gates < ngates - 1
+                cube['beams'][j, i] = True
+                cube['gates'][j, i, gates[keep] + 1] = True
+                cells.append((j, i, gates[keep] + 1, first[keep], bm))
+        cube['missing'] = {}
+        for p in [*params_to_run_filter, 'gflg']:
+            values = [np.asarray(getattr(bm, p)) for *_, bm in cells]
+            dtypes = [value.dtype for value in values if len(value) > 0]
+            dtype = np.result_type(*dtypes) if dtypes else np.float64
+            cube[p] = np.zeros((3, nbeams, ngates), dtype=dtype)
+            # gates without a value, these are NaN in Gate
+            cube['missing'][p] = np.zeros((3, nbeams, ngates), dtype=bool)
+            for value, (j, i, gates, first, _) in zip(values, cells):
+                found = first < len(value)
+                cube[p][j, i, gates[found]] = value[first[found]]
+                cube['missing'][p][j, i, gates[~found]] = True
+        return cube
+
     def __do_filter__(self, scans, params_to_run_filter=["v", "w_l",
                                                          "p_l", "elv"]):
         """
@@ -424,89 +749,591 @@ class Boxcar(object):
             Object containing SuperDARN scans
         """
         scans = [self.__discard_repeating_beams__(s) for s in scans]
-        if len(scans) == 3:
-            w = self.w
-            oscan = Scan()
-
-            for b in scans[1].beams:
-                bmnum = b.bmnum
-                beam = Beam()
-                beam.copy(b)
-
-                for key in beam.__dict__.keys():
-                    if type(getattr(beam, key)) is np.ndarray:
-                        setattr(beam, key, [])
-
-                for r in range(0, b.nrang):
-                    box = [[[None for j in range(3)]
-                            for k in range(3)] for n in range(3)]
-
-                    # Iterate through time
-                    for j in range(0, 3):
-                        # Iterate through beam
-                        for k in range(-1, 2):
-                            # Iterate through gate
-                            for n in range(-1, 2):
-                                # Get the scan we are working on
-                                s = scans[j]
-                                if s is None:
-                                    continue
-                                # Get the beam we are working on
-                                if s is None:
-                                    continue
-                                # Get the beam we are working on
-                                tbm = None
-                                for bm in s.beams:
-                                    if bm.bmnum == bmnum + k:
-                                        tbm = bm
-                                if tbm is None:
-                                    continue
-                                # Check if target gate number is in the beam
-                                if r + n in tbm.slist:
-                                    ind = np.array(tbm.slist).tolist()\
-                                            .index(r + n)
-                                    box[j][k + 1][n + 1] = Gate(
-                                        tbm, ind, gflg_type=self.gflg_type
-                                    )
-                                else:
-                                    box[j][k + 1][n + 1] = 0
-                    pts = 0.0
-                    tot = 0.0
-                    v, w_l, p_l, elv, gfx = \
-                        list(), list(), list(), list(), list()
-
-                    # Iterate through time
-                    for j in range(0, 3):
-                        # Iterate through beam
-                        for k in range(0, 3):
-                            # Iterate through gate
-                            for n in range(0, 3):
-                                bx = box[j][k][n]
-                                if bx is None:
-                                    continue
-                                wt = w[j][k][n]
-                                tot += wt
-                                if bx != 0:
-                                    pts += wt
-                                    for m in range(0, wt):
-                                        v.append(bx.v)
-                                        w_l.append(bx.w_l)
-                                        p_l.append(bx.p_l)
-                                        elv.append(bx.elv)
-                                        gfx = bx.gflg
-                    # Check if we meet the threshold
-                    if pts / tot >= self.thresh:
-                        beam.slist.append(r)
-                        beam.v.append(np.median(v))
-                        beam.w_l.append(np.median(w_l))
-                        beam.p_l.append(np.median(p_l))
-                        beam.elv.append(np.median(elv))
-                        beam.gflg.append(gfx)
-                oscan.beams.append(beam)
-
-            if len(oscan.beams) > 0:
-                oscan.update_time()
-                sorted(oscan.beams, key=lambda bm: bm.bmnum)
-        else:
-            oscan = Scan()
+        oscan = Scan()
+        if len(scans) != 3 or len(scans[1].beams) == 0:
+            return oscan
+        cube = self.__stack_cube__(scans, params_to_run_filter)
+        filtered = _filter_cube(cube, self.w, self.thresh,
+                                params_to_run_filter)
+        return self.__filtered_scan__(scans[1], filtered,
+                                      params_to_run_filter)
+
+    def __filtered_scan__(self, scan, filtered, params_to_run_filter):
+        """
+        Builds the filtered scan from the centre scan of a stack and the
+        output of _filter_cube
+
+        Parameters
+        ----------
+        scan: Object
+            centre Scan of the stack without repeating beams
+        filtered: dict
+            filtered gates and values of each beam of the scan
+        params_to_run_filter: list
+            List of parameters to run boxcar filter
+
+        Returns
+        -------
+        oscan: Object
+            Object containing SuperDARN scans
+        """
+        oscan = Scan()
+        for q, b in enumerate(scan.beams):
+            beam = Beam()
+            beam.copy(b)
+            for key in beam.fields():
+                if type(getattr(beam, key)) is np.ndarray:
+                    setattr(beam, key, [])
+            slist = filtered['slist'][q]
+            beam.slist = slist
+            for p in [*params_to_run_filter, 'gflg']:
+                values = filtered[p][q, slist]
+                missing = filtered['missing'][p][q, slist]
+                if missing.any():
+                    # NaN for the boxes with a missing value, as the
+                    # medians of a list with a NaN float in it
+                    values = values.astype(np.float64)
+                    values[missing] = np.nan
+                setattr(beam, p, values)
+            oscan.beams.append(beam)
+        oscan.update_time()
         return oscan
+
+def _filter_cube(cube, w, thresh, params_to_run_filter):
+    """
+    Weighted 3x3x3 occupancy threshold and weighted median of the centre
+    scan of a stack cube, see Boxcar.__stack_cube__
+
+    Parameters
+    ----------
+    cube: dict
+        dense arrays of a stack of three scans
+    w: list(list)
+        Weight matrix
+    thresh: float
+        Threshold of the weight matrix
+    params_to_run_filter: list
+        List of parameters to run boxcar filter
+
+    Returns
+    -------
+    filtered: dict
+        'slist': array of the gates kept for each centre beam
+        'missing': (centre beam, gate) bool array for each parameter and
+        gflg of the boxes using a gate without a value
+        and a (centre beam, gate) array of the median of each parameter
+        and the gflg of the last gate with data in each box
+    """
+    w = np.asarray(w)
+    ngates = cube['gates'].shape[2] - 2
+    # (centre beam, gate, scan, beam offset, gate offset) box indices
+    scan = np.arange(3)[:, np.newaxis, np.newaxis]
+    beam = cube['centre'][:, np.newaxis, np.newaxis, np.newaxis,
+                          np.newaxis] + np.arange(-1, 2)[:, np.newaxis]
+    gate = np.arange(ngates)[:, np.newaxis, np.newaxis, np.newaxis] +\
+        np.arange(3)
+    present = cube['gates'][scan, beam, gate]
+    exists = np.broadcast_to(cube['beams'][scan, beam], present.shape)
+    # the weight of a box counts if the beam has data in that scan,
+    # the points if the gate has data
+    tot = np.where(exists, w, 0).sum(axis=(2, 3, 4)).astype(float)
+    weights = np.where(present, w, 0).reshape(*present.shape[:2], 27)
+    pts = weights.sum(axis=-1)
+    keep = (pts > 0) & (pts / tot >= thresh) &\
+        (np.arange(ngates) < cube['nrang'][:, np.newaxis])
+    filtered = {'slist': [np.flatnonzero(row) for row in keep],
+                'missing': {}}
+
+    # Median of the values repeated by their weight, the lower and
+    # upper middle of the sorted values are found from the cumulative
+    # weights
+    lower = ((pts - 1) // 2)[..., np.newaxis]
+    upper = (pts // 2)[..., np.newaxis]
+    for p in params_to_run_filter:
+        values = cube[p][scan, beam, gate].reshape(weights.shape)
+        missing = cube['missing'][p][scan, beam, gate].reshape(weights.shape)
+        filtered['missing'][p] = np.any(missing & (weights > 0), axis=-1)
+        order = np.argsort(values, axis=-1, kind='stable')
+        cumulative = np.take_along_axis(weights, order, axis=-1).cumsum(-1)
+        low = np.take_along_axis(values, np.take_along_axis(
+            order, np.argmax(cumulative > lower, axis=-1)[..., np.newaxis],
+            axis=-1), axis=-1)[..., 0]
+        high = np.take_along_axis(values, np.take_along_axis(
+            order, np.argmax(cumulative > upper, axis=-1)[..., np.newaxis],
+            axis=-1), axis=-1)[..., 0]
+        median = np.where(pts % 2 == 1, low, (low + high) / 2)
+        if np.issubdtype(median.dtype, np.floating):
+            # a NaN in the box gives a NaN median
+            median[np.any(np.isnan(values) & (weights > 0), axis=-1)] = np.nan
+        filtered[p] = median
+    # gflg of the last gate with data in the box
+    last = 26 - np.argmax(weights[..., ::-1] > 0, axis=-1)[..., np.newaxis]
+    gflg = cube['gflg'][scan, beam, gate].reshape(weights.shape)
+    missing = cube['missing']['gflg'][scan, beam, gate].reshape(weights.shape)
+    filtered['gflg'] = np.take_along_axis(gflg, last, axis=-1)[..., 0]
+    filtered['missing']['gflg'] = np.take_along_axis(missing, last,
+                                                     axis=-1)[..., 0]
+    return filtered
+
+
+class FilterCube(object):
+    """
+    Dense (record, gate) arrays of fitacf records shared by the stages of
+    a FilterPipeline, the records are parsed once for all the stages
+
+    Attributes
+    ----------
+    records: List[Dict]
+        SuperDARN fitacf records
+    beams: List[Object]
+        Beam of each record
+    scan: np.ndarray
+        scan number of each record, a scan starts at a record with scan 1
+    bmnum: np.ndarray
+        beam number of each record
+    nrang: np.ndarray
+        number of range gates of each record
+    params: list
+        parameters in the cube, the filtered parameters and gflg
+    gates: np.ndarray
+        (record, gate) bool array of the gates with data
+    values: dict
+        (record, gate) array of each parameter
+    missing: dict
+        (record, gate) bool array for each parameter of the gates with
+        data but without a value of the parameter
+    kept: np.ndarray
+        records with filtered data, the other records lose the filtered
+        fields as records outside of the centre of a Boxcar stack
+
+    Methods
+    -------
+    scalar
+    filtered_records
+    """
+    def __init__(self, beam_sounds,
+                 params_to_run_filter=["v", "w_l", "p_l", "elv"]):
+        """
+        Parses the records into the cube
+
+        Parameters
+        ----------
+        beam_sounds: List[Dict]
+            List of SuperDARN fitacf data
+        params_to_run_filter: list
+            List of parameters to filter
+        """
+        self.records = list(beam_sounds)
+        fd = FetchData(self.records)
+        self.beams = [fd.record_beam(d) for d in self.records]
+        nrecords = len(self.beams)
+        starts = np.array([bm.scan == 1 for bm in self.beams], dtype=bool)
+        starts[:1] = False
+        self.scan = np.cumsum(starts)
+        self.bmnum = np.array([bm.bmnum for bm in self.beams], dtype=int)
+        self.nrang = np.array([bm.nrang for bm in self.beams], dtype=int)
+        self.params = [*params_to_run_filter, 'gflg']
+        self.kept = np.ones(nrecords, dtype=bool)
+        self._scalars = {}
+
+        # a gate listed twice uses the first value
+        slists = [np.unique(np.asarray(bm.slist, dtype=int),
+                            return_index=True) for bm in self.beams]
+        lengths = np.array([len(gates) for gates, _ in slists], dtype=int)
+        rows = np.repeat(np.arange(nrecords), lengths)
+        cols = np.concatenate([gates for gates, _ in slists] + [[]])\
+            .astype(int)
+        first = np.concatenate([first for _, first in slists] + [[]])\
+            .astype(int)
+        ngates = max(self.nrang.max(initial=0), cols.max(initial=-1) + 1)
+        self.gates = np.zeros((nrecords, ngates), dtype=bool)
+        self.gates[rows, cols] = True
+        self.values = {}
+        self.missing = {}
+        for p in self.params:
+            values = [np.asarray(getattr(bm, p)) for bm in self.beams]
+            sizes = np.array([len(value) for value in values], dtype=int)
+            dtypes = [value.dtype for value in values if len(value) > 0]
+            dtype = np.result_type(*dtypes) if dtypes else np.float64
+            flat = np.concatenate([value for value in values
+                                   if len(value) > 0] +
+                                  [np.zeros(0, dtype=dtype)]).astype(dtype)
+            offsets = np.cumsum(sizes) - sizes
+            found = first < sizes[rows]
+            self.values[p] = np.zeros((nrecords, ngates), dtype=dtype)
+            self.values[p][rows[found], cols[found]] =\
+                flat[offsets[rows[found]] + first[found]]
+            self.missing[p] = np.zeros((nrecords, ngates), dtype=bool)
+            self.missing[p][rows[~found], cols[~found]] = True
+
+    def scalar(self, name):
+        """
+        Scalar field of each record as floats, NaN for the records
+        without the field
+
+        Parameters
+        ----------
+        name: str
+            name of the field, e.g. 'noise.sky'
+
+        Returns
+        -------
+        values: np.ndarray
+            value of each record
+        """
+        if name not in self._scalars:
+            self._scalars[name] = np.array(
+                [np.nan if record.get(name) is None else record[name]
+                 for record in self.records], dtype=float)
+        return self._scalars[name]
+
+    def filtered_records(self):
+        """
+        Records with the filtered data, see Boxcar.format_data_for_pydarn
+
+        Returns
+        -------
+        copied_data: List[Dict]
+            shallow copies of the records with the filtered fields
+        """
+        copied_data = []
+        for r, (record, bm) in enumerate(zip(self.records, self.beams)):
+            if not self.kept[r]:
+                copied_data.append(Boxcar.__merge_record__(record, {}))
+                continue
+            slist = np.flatnonzero(self.gates[r])
+            frec = {'slist': slist}
+            for p in self.params:
+                values = self.values[p][r, slist]
+                missing = self.missing[p][r, slist]
+                if missing.any():
+                    values = values.astype(np.float64)
+                    values[missing] = np.nan
+                frec[p] = values
+            filtered_records = {(bm.time, bm.bmnum, bm.channel): frec}
+            copied_data.append(Boxcar.__merge_record__(record,
+                                                       filtered_records))
+        return copied_data
+
+
+class FilterCells(object):
+    """
+    The gates with data of a FilterCube, gathered once for consecutive
+    fusable stages of a FilterPipeline. The stages remove cells from keep
+    and set new values, scatter writes them back to the cube.
+
+    Methods
+    -------
+    missing
+    set
+    scatter
+    """
+    __slots__ = ("cube", "rows", "gates", "keep", "_values", "_updates")
+
+    def __init__(self, cube):
+        """
+        Parameters
+        ----------
+        cube: Object
+            FilterCube to gather the cells from
+        """
+        self.cube = cube
+        self.rows, self.gates = np.nonzero(cube.gates)
+        self.keep = np.ones(len(self.rows), dtype=bool)
+        self._values = {}
+        self._updates = {}
+
+    def __getitem__(self, name):
+        """
+        Values of each cell, 'slist' gives the gate numbers and fields
+        that are not in the cube the scalar of the record of each cell
+        """
+        if name not in self._values:
+            if name == 'slist':
+                value = self.gates
+            elif name in self.cube.values:
+                value = self.cube.values[name][self.rows, self.gates]
+            else:
+                value = self.cube.scalar(name)[self.rows]
+            self._values[name] = value
+        return self._values[name]
+
+    def missing(self, name):
+        """
+        Cells without a value of the parameter
+
+        Parameters
+        ----------
+        name: str
+            name of the parameter
+
+        Returns
+        -------
+        missing: np.ndarray
+            bool array of the cells
+        """
+        if name == 'slist':
+            return np.zeros(len(self.rows), dtype=bool)
+        if name in self.cube.missing:
+            return self.cube.missing[name][self.rows, self.gates]
+        return np.isnan(self[name])
+
+    def set(self, name, values, missing=None):
+        """
+        New values of a parameter of the cube for each cell
+
+        Parameters
+        ----------
+        name: str
+            name of the parameter
+        values: np.ndarray
+            value of each cell
+        missing: np.ndarray
+            cells without a value, missing values are not changed if None
+        """
+        if name not in self.cube.values:
+            raise KeyError("{} is not a parameter of the cube".format(name))
+        self._values[name] = values
+        self._updates[name] = (values, missing)
+
+    def scatter(self):
+        """ Writes the kept cells and new values back to the cube """
+        drop = ~self.keep
+        self.cube.gates[self.rows[drop], self.gates[drop]] = False
+        for name, (values, missing) in self._updates.items():
+            self.cube.values[name][self.rows, self.gates] = values
+            if missing is not None:
+                self.cube.missing[name][self.rows, self.gates] = missing
+        self._updates = {}
+
+
+class ThresholdFilter(object):
+    """
+    Keeps the gates with a value of a parameter between a minimum and
+    maximum, e.g. range gates with 'slist' or velocities with 'v'.
+    Scalar fields of the records such as 'noise.sky' apply to all the
+    gates of a record.
+
+    Methods
+    -------
+    filter_cells
+    """
+    fusable = True
+
+    def __init__(self, param, minimum=None, maximum=None, absolute=False):
+        """
+        Parameters
+        ----------
+        param: str
+            parameter to threshold
+        minimum: float
+            smallest value kept, no minimum if None
+        maximum: float
+            largest value kept, no maximum if None
+        absolute: bool
+            threshold the absolute value
+            Default: False
+        """
+        self.param = param
+        self.minimum = minimum
+        self.maximum = maximum
+        self.absolute = absolute
+        self.name = 'threshold {}'.format(param)
+
+    def filter_cells(self, cells):
+        """
+        Removes the cells outside of the thresholds or without a value
+
+        Parameters
+        ----------
+        cells: Object
+            FilterCells of the cube
+        """
+        values = cells[self.param]
+        if self.absolute:
+            values = np.abs(values)
+        keep = ~cells.missing(self.param)
+        if self.minimum is not None:
+            keep &= values >= self.minimum
+        if self.maximum is not None:
+            keep &= values <= self.maximum
+        cells.keep &= keep
+
+
+class GroundScatterFilter(object):
+    """
+    Reclassifies ground scatter as the gates with
+    abs(v) < v_max - w_l * v_max / w_max (Blanchard et al., 2009),
+    gates without a velocity or spectral width keep their gflg
+
+    Methods
+    -------
+    filter_cells
+    """
+    fusable = True
+    name = 'ground scatter'
+
+    def __init__(self, v_max=30, w_max=90):
+        """
+        Parameters
+        ----------
+        v_max: float
+            velocity limit of ground scatter [m/s]
+            Default: 30
+        w_max: float
+            spectral width limit of ground scatter [m/s]
+            Default: 90
+        """
+        self.v_max = v_max
+        self.w_max = w_max
+
+    def filter_cells(self, cells):
+        """
+        Sets gflg of the cells
+
+        Parameters
+        ----------
+        cells: Object
+            FilterCells of the cube
+        """
+        valid = ~(cells.missing('v') | cells.missing('w_l'))
+        ground = np.abs(cells['v']) <\
+            self.v_max - cells['w_l'] * self.v_max / self.w_max
+        cells.set('gflg', np.where(valid, ground, cells['gflg']),
+                  missing=cells.missing('gflg') & ~valid)
+
+
+class BeamNoiseFilter(object):
+    """
+    Rejects the beams with a sky noise larger than a factor of the
+    median sky noise of their scan
+
+    Methods
+    -------
+    filter_cells
+    """
+    fusable = True
+    name = 'beam noise'
+
+    def __init__(self, factor=3.0):
+        """
+        Parameters
+        ----------
+        factor: float
+            largest ratio of the sky noise of a beam to the median of
+            its scan
+            Default: 3.0
+        """
+        self.factor = factor
+
+    def filter_cells(self, cells):
+        """
+        Removes the cells of the noisy beams
+
+        Parameters
+        ----------
+        cells: Object
+            FilterCells of the cube
+        """
+        cube = cells.cube
+        noise = cube.scalar('noise.sky')
+        reject = np.zeros(len(noise), dtype=bool)
+        # the scan numbers of the records are sorted
+        bounds = np.flatnonzero(np.diff(cube.scan)) + 1
+        for scan in np.split(np.arange(len(noise)), bounds):
+            if np.isnan(noise[scan]).all():
+                continue
+            reject[scan] = noise[scan] >\
+                self.factor * np.nanmedian(noise[scan])
+        cells.keep &= ~reject[cells.rows]
+
+
+class FilterPipeline(object):
+    """
+    Filters fitacf data with a sequence of stages over one FilterCube.
+
+    A stage has a name and either a filter_cube method, which changes
+    the cube (e.g. Boxcar), or is fusable and has a filter_cells method.
+    Consecutive fusable stages (e.g. ThresholdFilter, GroundScatterFilter
+    and BeamNoiseFilter) share the gates with data gathered once from the
+    cube and written back once.
+
+    Methods
+    -------
+    run_filter
+    """
+    def __init__(self, stages, params_to_run_filter=["v", "w_l", "p_l",
+                                                     "elv"]):
+        """
+        Parameters
+        ----------
+        stages: List[Object]
+            stages run in order
+        params_to_run_filter: list
+            List of parameters to filter
+        """
+        self.stages = list(stages)
+        self.params_to_run_filter = params_to_run_filter
+        self.timings = []
+
+    def run_filter(self, beam_sounds):
+        """
+        Runs the stages on the records
+
+        Parameters
+        ----------
+        beam_sounds: List[Dict]
+            List of SuperDARN fitacf data
+
+        Returns
+        -------
+        copied_data: List[Dict]
+            List of dictionaries that contain the new filtered data, see
+            Boxcar.run_filter
+
+        Notes
+        -----
+        timings is a list of (name, seconds) of parsing the cube, each
+        stage and merging the records. Writing a group of fused stages
+        back to the cube is timed with the last stage of the group.
+        """
+        self.timings = []
+        start = time.perf_counter()
+        self.cube = FilterCube(beam_sounds, self.params_to_run_filter)
+        self.timings.append(('parse', time.perf_counter() - start))
+        cells = None
+        for stage in self.stages:
+            fusable = getattr(stage, 'fusable', False)
+            if cells is not None and not fusable:
+                self.__scatter__(cells)
+                cells = None
+            start = time.perf_counter()
+            if fusable:
+                if cells is None:
+                    cells = FilterCells(self.cube)
+                stage.filter_cells(cells)
+            else:
+                stage.filter_cube(self.cube)
+            self.timings.append((getattr(stage, 'name',
+                                         type(stage).__name__),
+                                 time.perf_counter() - start))
+        if cells is not None:
+            self.__scatter__(cells)
+        start = time.perf_counter()
+        copied_data = self.cube.filtered_records()
+        self.timings.append(('merge', time.perf_counter() - start))
+        return copied_data
+
+    def __scatter__(self, cells):
+        """
+        Writes fused stages back to the cube, timed with the last stage
+
+        Parameters
+        ----------
+        cells: Object
+            FilterCells of the fused stages
+        """
+        start = time.perf_counter()
+        cells.scatter()
+        name, seconds = self.timings[-1]
+        self.timings[-1] = (name, seconds + time.perf_counter() - start)
@@ -20,6 +20,9 @@
 #                extra keys are passed in from other functions
 # 2023-01-03 CJM added functions to calculate azimuth from XS and SC existing
 #                codebase, can be expanded and added to when required
+# 2026-10-18 geocentric_coordinates and its helpers accept numpy arrays,
+#            each element iterates until it converges
+# 2026-10-18 calculate_azimuth takes arrays, added calculate_declination
 # Disclaimer:
 # pyDARN is under the LGPL v3 license found in the root directory LICENSE.md
 # Everyone is permitted to copy and distribute verbatim copies of this license
@@ -44,6 +47,8 @@ def geocentric_coordinates(target_range: float, psi: float, boresight: float,
     """
     Calculates the geocentric coordinates of gate cell  point,
     using either the standard or Chisham virtual height model.
+    target_range and psi can be numpy arrays (broadcast against each
+    other), every cell iterates until its own height converges.
 
     Parameters
     ----------
@@ -51,11 +56,11 @@ def geocentric_coordinates(target_range: float, psi: float, boresight: float,
             radars site latitude [rad]
         radar_lon : float
             radars site longitude [lon]
-        target_range: float
+        target_range: float or np.ndarray
             The range from the instrument to the target (echo) [km]
         cell_height : float
             virtual height of the gate cell [km]
-        psi: int
+        psi: float or np.ndarray
             [rad]
         boresight: float
             boresight of the radar beam [rad]
@@ -65,9 +70,9 @@ def geocentric_coordinates(target_range: float, psi: float, boresight: float,
 
     Returns
     -------
-        cell_lat: float
+        cell_lat: float or np.ndarray
             latitude of the range gate in geographic coordinates [rad]
-        cell_lon: float
+        cell_lon: float or np.ndarray
             longitude of the range gate in geographic coordinates [rad]
 
     """
@@ -76,70 +81,85 @@ def geocentric_coordinates(target_range: float, psi: float, boresight: float,
     radars – Part 1: A new empirical virtual height model by
     G. Chisham 2008 (https://doi.org/10.5194/angeo-26-823-2008)
     """
-    x_height = virtual_height_model(target_range=target_range, **kwargs)
+    target_range, psi = np.broadcast_arrays(np.asarray(target_range,
+                                                       dtype=float),
+                                            np.asarray(psi, dtype=float))
+    shape = target_range.shape
+    x_height = np.broadcast_to(
+        virtual_height_model(target_range=target_range, **kwargs),
+        shape).ravel()
+    target_range = target_range.ravel()
+    psi = psi.ravel()
 
     # calculate the radius over the earth underneath
     # the radar and range gate cell
     rlat, rlon, r_radar, delta = geodetic2geocentric(**kwargs)
-    r_cell = r_radar
+    r_cell = np.full(target_range.shape, r_radar)
 
     psi_cos_2 = np.cos(psi)**2
     psi_sin_2 = np.sin(psi)**2
 
-    while_flag = True
-    while while_flag:
+    cell_lat = np.zeros(target_range.shape)
+    cell_lon = np.zeros(target_range.shape)
+    # cells still iterating towards the cell point
+    active = np.ones(target_range.shape, dtype=bool)
+    while np.any(active):
+        i = np.nonzero(active)[0]
         # distance between the gate cell to the earth's centre [km]
-        cell_rho = r_cell + x_height
+        cell_rho = r_cell[i] + x_height[i]
         # elevation angle relative to local horizon [rad]
-        rel_elv = np.arcsin(((cell_rho**2) - (r_radar**2) - target_range**2) /
-                            (2.0 * r_radar * target_range))
+        rel_elv = np.arcsin(((cell_rho**2) - (r_radar**2) -
+                             target_range[i]**2) /
+                            (2.0 * r_radar * target_range[i]))
         # estimate elevation for multi-hop propagation
-        if virtual_height_model == VHModels.CHISHAM and target_range > 2137.5:
-            gamma = np.arccos((r_radar**2 + cell_rho**2 - target_range**2) /
-                              (2.0 * r_radar * cell_rho))
-            beta = np.arcsin(r_radar * np.sin(gamma/3.0) /
-                             (target_range/3.0))
-            # Elevation angle used for estimating off-array normal
-            # azimuth [rad]
-            xelv = (np.pi/2) - beta - (gamma/3.0)
-        else:
-            xelv = rel_elv
+        xelv = rel_elv
+        if virtual_height_model == VHModels.CHISHAM:
+            multi_hop = target_range[i] > 2137.5
+            if np.any(multi_hop):
+                hop_range = target_range[i][multi_hop]
+                hop_rho = cell_rho[multi_hop]
+                gamma = np.arccos((r_radar**2 + hop_rho**2 - hop_range**2) /
+                                  (2.0 * r_radar * hop_rho))
+                beta = np.arcsin(r_radar * np.sin(gamma/3.0) /
+                                 (hop_range/3.0))
+                # Elevation angle used for estimating off-array normal
+                # azimuth [rad]
+                xelv = rel_elv.copy()
+                xelv[multi_hop] = (np.pi/2) - beta - (gamma/3.0)
 
         # Estimate the off-array-normal azimuth in radians
         elv_sin_2 = np.sin(xelv)**2
 
-        est_azimuth = psi_cos_2 - elv_sin_2
-        if est_azimuth < 0:
-            tan_azimuth = 1e32
-        else:
-            # in radians
-            tan_azimuth = np.sqrt(psi_sin_2 /
-                                  (psi_cos_2 - elv_sin_2))
+        est_azimuth = psi_cos_2[i] - elv_sin_2
+        tan_azimuth = np.full(est_azimuth.shape, 1e32)
+        # in radians
+        positive = ~(est_azimuth < 0)
+        tan_azimuth[positive] = np.sqrt(psi_sin_2[i][positive] /
+                                        (psi_cos_2[i][positive] -
+                                         elv_sin_2[positive]))
         # azimuth in [rad]
-        if psi > 0:
-            azimuth = np.arctan(tan_azimuth)
-        else:
-            azimuth = -np.arctan(tan_azimuth)
+        azimuth = np.where(psi[i] > 0, np.arctan(tan_azimuth),
+                           -np.arctan(tan_azimuth))
 
         # azimuth of the gate cell [rad]
         cell_azimuth = azimuth + boresight
         flatten_azimuth = geocentric2flattening(delta=delta,
                                                 azimuth=cell_azimuth,
                                                 elv=xelv)
-        cell_rho, cell_lat, cell_lon = \
+        cell_rho, cell_lat[i], cell_lon[i] = \
             cell_geocentric_coordinates(lat=rlat, lon=rlon,
                                         rho=r_radar,
                                         azimuth=flatten_azimuth,
                                         elv=rel_elv,
-                                        r=target_range)
+                                        r=target_range[i])
 
         # recalculate the radius under the gate cell and centre of earth
-        r_cell = geocentric2geodetic(lat=cell_lat, lon=cell_lon)
-        cell_heightx = cell_rho - r_cell
+        r_cell[i] = geocentric2geodetic(lat=cell_lat[i], lon=cell_lon[i])
+        cell_heightx = cell_rho - r_cell[i]
         # this ensures convergence on the cell point
-        while_flag = abs(cell_heightx - x_height) > 0.5
+        active[i] = abs(cell_heightx - x_height[i]) > 0.5
 
-    return cell_lat, cell_lon
+    return cell_lat.reshape(shape)[()], cell_lon.reshape(shape)[()]
 
 
 # fldpnt
@@ -216,10 +236,8 @@ def cell_geocentric_coordinates(lat: float, lon: float, rho: float,
     # convert Cartesian back to spherical
     rho = np.sqrt(global_x**2 + global_y**2 + global_z**2)
     lat = np.pi/2 - np.arccos(global_z/rho)
-    if global_x == 0 and global_y == 0:
-        lon = 0
-    else:
-        lon = np.arctan2(global_y, global_x)
+    lon = np.where((global_x == 0) & (global_y == 0), 0,
+                   np.arctan2(global_y, global_x))[()]
 
     return rho, lat, lon
 
@@ -300,8 +318,7 @@ def geodetic2geocentric(lat: float, lon: float, **kwargs):
     # glon [rad]
     glon = lon
 
-    if glon > np.pi:
-        glon = glon - 2 * np.pi
+    glon = np.where(glon > np.pi, glon - 2 * np.pi, glon)[()]
     # grho is km?
     rho = EARTH_EQUATORIAL_RADIUS / np.sqrt(1 + e2 * np.sin(glat)**2)
     # delta in [rad]
@@ -657,28 +674,33 @@ def calculate_azimuth(slat, slon, salt, elat, elon, ealt):
     calculates the azimuth between two given points
     Only one method used and only azimuth returned, this can be expanded
     using XS and SC existing codebase
+    All inputs can be numpy arrays, they are broadcast against each other
+    so e.g. the azimuths of a whole beam x gate grid are found in one call
 
     Parameters
     ----------
-    slat : float
+    slat : float or np.ndarray
         origin latitude [degree]
-    slon : float
+    slon : float or np.ndarray
         origin longitude [degree]
-    salt : float
+    salt : float or np.ndarray
         origin altitude [km]
-    elat : float
+    elat : float or np.ndarray
         distant latitude [degree]
-    elon : float
+    elon : float or np.ndarray
         distant longitude [degree]
-    ealt : float
+    ealt : float or np.ndarray
         distant altitude [km]
 
     Returns
     -------
-    azm : float
+    azm : float or np.ndarray
         azimuth between origin location and distant location [degrees]
         in reference to North
     """
+    slat, slon, salt, elat, elon, ealt = \
+        (np.asarray(value, dtype=float)
+         for value in (slat, slon, salt, elat, elon, ealt))
     # Convert point of origin from geodetic to geocentric
     gclat, gclon, srho = geod2geoc(slat, slon)
     # Convert distant point from geodetic to geocentric
@@ -693,3 +715,49 @@ def calculate_azimuth(slat, slon, salt, elat, elon, ealt):
     # Convert pointing azimuth and elevation to geodetic
     (_, _, _, azm, _) = geodetic2geocAzEl(gclat, gclon, gaz, gel, inverse=True)
     return azm
+
+
+def calculate_declination(lat, lon, pole_lat, pole_lon,
+                          north_lat: float = 90.0):
+    """
+    calculates the angle at given points between the directions to the
+    geographic pole and to another (e.g. magnetic) pole, from the great
+    circle distances of the spherical triangle they make
+    All positions can be numpy arrays, they are broadcast against each other
+
+    Parameters
+    ----------
+    lat : float or np.ndarray
+        latitude of the points [degree]
+    lon : float or np.ndarray
+        longitude of the points [degree]
+    pole_lat : float
+        latitude of the other pole [degree]
+    pole_lon : float
+        longitude of the other pole [degree]
+    north_lat : float
+        latitude of the geographic pole, -90 for the southern hemisphere
+        Default: 90
+
+    Returns
+    -------
+    declination : float or np.ndarray
+        unsigned angle between the two directions [radians]
+    """
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    pole_lat = np.radians(pole_lat)
+    pole_lon = np.radians(pole_lon)
+    north_lat = np.radians(north_lat)
+    north_lon = 0.0
+    # great circle distances on the unit sphere, see
+    # GeneralUtils.great_circle
+    a = np.arccos(np.sin(lat) * np.sin(north_lat) +
+                  np.cos(lat) * np.cos(north_lat) * np.cos(lon - north_lon))
+    b = np.arccos(np.sin(lat) * np.sin(pole_lat) +
+                  np.cos(lat) * np.cos(pole_lat) * np.cos(lon - pole_lon))
+    c = np.arccos(np.sin(north_lat) * np.sin(pole_lat) +
+                  np.cos(north_lat) * np.cos(pole_lat) *
+                  np.cos(north_lon - pole_lon))
+    return np.arccos((np.cos(c) - np.cos(a) * np.cos(b)) /
+                     (np.sin(a) * np.sin(b)))
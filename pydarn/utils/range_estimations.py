@@ -14,6 +14,8 @@
 # 2022-08-04 CJM added HALF_SLANT option and gate2halfslant method
 # 2023-09-14 CJM moved GSMR to GSMR_BRISTOW and used new GSMR alg
 # 2023-12-15 RAR added TIME_OF_FLIGHT option and gate2timeofflight method
+# 2026-10-18 gates are calculated as arrays, frang and rsep can be given
+#            per record, GSMR_BRISTOW only warns for non-finite ranges
 
 import enum
 import numpy as np
@@ -32,20 +34,23 @@ def gate2timeofflight(rxrise: int = 0, range_gate: int = 0, frang: int = 180,
 
     Parameters
     ----------
-    frang: int
+    frang: int or np.ndarray
         range from the edge of first the gate to the radar [km]
-        This should be given in fitacf record of the control program
-    rsep: int
-        Radar separation of the gates. Determined by control program.
+        This should be given in fitacf record of the control program,
+        an array gives the value per record
+    rsep: int or np.ndarray
+        Radar separation of the gates. Determined by control program,
+        an array gives the value per record
     rxrise: int
         Use hardware value for this, avoid data file values
-    gate: int
+    gate: int or np.ndarray
         range gate to determine the slant range [km], if nrang
         is None
         default: 0
     nrang: int
         max number of range gates in the list of records. If
-        not None, will calculate all slant ranges
+        not None, will calculate all slant ranges, with a row per record
+        if frang or rsep are arrays
         default: None
     center: boolean
         Calculate the slant range in the center of range gate
@@ -71,13 +76,15 @@ def gate2timeofflight(rxrise: int = 0, range_gate: int = 0, frang: int = 180,
         range_offset = -0.5 * sample_sep
     else:
         range_offset = 0.0
+    if nrang is not None:
+        # All gates at once, one row per record if frang and rsep are
+        # given per record
+        range_gate = np.arange(nrang + 1)
+        lag_first = np.asarray(lag_first)[..., np.newaxis]
+        sample_sep = np.asarray(sample_sep)[..., np.newaxis]
+        range_offset = np.asarray(range_offset)[..., np.newaxis]
     # Now calculate time of flight in ms
-    if nrang is None:
-        tof = lag_first - rxrise + range_gate * sample_sep + range_offset
-    else:
-        tof = np.zeros(nrang + 1)
-        for gate in range(nrang + 1):
-            tof[gate] = lag_first - rxrise + gate * sample_sep + range_offset
+    tof = lag_first - rxrise + range_gate * sample_sep + range_offset
     return tof
 
 
@@ -122,7 +129,7 @@ def gate2gs_bristow(virtual_height: float = 250, **kwargs):
     # give user a warning if so, these values will be dealt with in
     # the individual plotting algs as we need to return the full array
     # of values for the complete beam*range gate array
-    if any(np.isfinite(ground_scatter_mapped_ranges)):
+    if not np.all(np.isfinite(ground_scatter_mapped_ranges)):
         warnings.warn("Warning: Be aware that the range estimation"
                       " you have chosen has calculated some infinite"
                       " values. These values will not be plotted."
@@ -169,20 +176,23 @@ def gate2slant(rxrise: int = 0, range_gate: int = 0, frang: int = 180,
 
     Parameters
     ----------
-        frang: int
+        frang: int or np.ndarray
             range from the edge of first the gate to the radar [km]
-            This should be given in fitacf record of the control program
-        rsep: int
-            Radar separation of the gates. Determined by control program.
+            This should be given in fitacf record of the control program,
+            an array gives the value per record
+        rsep: int or np.ndarray
+            Radar separation of the gates. Determined by control program,
+            an array gives the value per record
         rxrise: int
             Use hardware value for this, avoid data file values
-        gate: int
+        gate: int or np.ndarray
             range gate to determine the slant range [km], if nrang
             is None
             default: 0
         nrang: int
             max number of range gates in the list of records. If
-            not None, will calculate all slant ranges
+            not None, will calculate all slant ranges, with a row per
+            record if frang or rsep are arrays
             default: None
         center: boolean
             Calculate the slant range in the center of range gate
@@ -213,17 +223,17 @@ def gate2slant(rxrise: int = 0, range_gate: int = 0, frang: int = 180,
     else:
         range_offset = -0.5 * rsep
 
+    if nrang is not None:
+        # All gates at once, one row per record if frang and rsep are
+        # given per record
+        range_gate = np.arange(nrang + 1)
+        lag_first = np.asarray(lag_first)[..., np.newaxis]
+        sample_sep = np.asarray(sample_sep)[..., np.newaxis]
+        range_offset = np.asarray(range_offset)[..., np.newaxis]
     # Now calculate slant range in km
-    if nrang is None:
-        slant_ranges = (lag_first - rxrise +
-                        range_gate * sample_sep) * speed_of_light /\
-                distance_factor + range_offset
-    else:
-        slant_ranges = np.zeros(nrang+1)
-        for gate in range(nrang+1):
-            slant_ranges[gate] = (lag_first - rxrise +
-                                  gate * sample_sep) * speed_of_light /\
-                    distance_factor + range_offset
+    slant_ranges = (lag_first - rxrise +
+                    range_gate * sample_sep) * speed_of_light /\
+        distance_factor + range_offset
     return slant_ranges
 
 
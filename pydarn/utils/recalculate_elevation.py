@@ -19,18 +19,25 @@
 #
 # Modifications:
 # 20221221 - Bharat Kunduri: Updated to RST elevation code
+# 20261018 - elevation is calculated for all records at once without
+#            copying the records
+# 20261018 - added calibrate_tdiff to sweep tdiff values
+# 20261018 - the hardware in use on the date of the records is used
 
+import datetime as dt
 import numpy as np
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List
-from copy import deepcopy
 
-from pydarn import (SuperDARNRadars, C, RadarID)
+from pydarn import (SuperDARNRadars, C, RadarID, time2datetime)
 
 
 def recalculate_elevation(dmap_data: List[dict], tdiff: float,
                           overwrite: bool = False,
-                          interferometer_offset: list = None):
+                          interferometer_offset: list = None,
+                          date: dt.datetime = None):
     """
     Recalculates elevation values for a given tdiff Value
 
@@ -47,6 +54,9 @@ def recalculate_elevation(dmap_data: List[dict], tdiff: float,
     interferometer_offset: list
         select position of interferometer array wrt the main array
         needs to be list of [X, Y, Z] e.g. [0.0, 100.0, 1.0]
+    date: datetime
+        date of the hardware information to use
+        Default: time of the first record
 
     Raises
     ------
@@ -55,88 +65,335 @@ def recalculate_elevation(dmap_data: List[dict], tdiff: float,
     -------
     elv_amended: dictionary of lists
         amended elevation values for each record given
+
+    Notes
+    -----
+    The elevation of all the records is calculated at once from the
+    concatenated phi0 arrays. With overwrite the records are shallow copies
+    with a new elv array, the other fields are the arrays of dmap_data.
     """
-    if not overwrite:
-        # Make phi1 output into dictionary
-        elv_amended = {}
-    else:
-        dmap_amended = deepcopy(dmap_data)
+    radar_hdw, int_pos, records, phi0, bmnum, tfreq =\
+        _stack_records(dmap_data, interferometer_offset, date)
+    elv = np.split(elevation(phi0, bmnum, tfreq, tdiff, int_pos,
+                             radar_hdw.beams, radar_hdw.beam_separation),
+                   np.cumsum([len(dmap_data[ind]['phi0'])
+                              for ind in records])[:-1])
+    elv = dict(zip(records, elv))
 
-    # Hardware config for radar
-    # Doesn't have to be in the loop, since we're accessing only the first rec
-    radar_hdw = SuperDARNRadars.radars[RadarID(dmap_data[0]['stid'])].hardware_info
-    if interferometer_offset is not None:
-        int_pos = interferometer_offset
+    if overwrite:
+        # If there is no elevation data, the record is not changed
+        return [dict(record, elv=elv[ind]) if ind in elv else dict(record)
+                for ind, record in enumerate(dmap_data)]
     else:
-        int_pos = radar_hdw.interferometer_offset
+        # If there is no elevation data, the record has an empty list
+        return {ind: elv.get(ind, []) for ind in range(len(dmap_data))}
+
 
+def elevation(phi0: np.ndarray, bmnum: np.ndarray, tfreq: np.ndarray,
+              tdiff: float, int_pos: list, beams: int,
+              beam_separation: float):
+    """
+    Elevation angles of observed phases, the arguments are broadcast
+    together so phases of several records can be given at once
+
+    Parameters
+    -----------
+    phi0: np.ndarray
+        observed phase difference [radians]
+    bmnum: np.ndarray
+        beam number of each phase
+    tfreq: np.ndarray
+        transmit frequency of each phase [kHz]
+    tdiff: float or np.ndarray
+        propagation time from interferometer array to phasing matrix
+        input minus propagation time from main array antenna, microseconds
+    int_pos: list
+        position of interferometer array wrt the main array [X, Y, Z]
+    beams: int
+        number of beams of the radar
+    beam_separation: float
+        angular separation of the beams [degrees]
+
+    Returns
+    -------
+    elv: np.ndarray
+        elevation angles [degrees]
+    """
     # If inteferometer is infront (+1) or behind (-1) main array
     if int_pos[1] < 0:
         sgn = -1.0
     else:
         sgn = 1.0
 
-    boff = (radar_hdw.beams / 2.0) - 0.5
+    boff = (beams / 2.0) - 0.5
 
-    # For each record in data, recalculate the elevation
-    for ind in range(0, len(dmap_data)):
-        # If there is no elevation data, append empty list and skip
-        if 'phi0' not in dmap_data[ind]:
-            print("No elevation data. 'phi0' parameter missing"
-                  " from the record")
-            if not overwrite:
-                elv_amended[ind] = []
+    # Beam direction off boresight in RADIANS
+    phi_beam = np.radians(beam_separation * (bmnum - boff))
+    # Cos and Sin of phi in shape of phi_beam
+    cp0 = np.cos(phi_beam)
+    sp0 = np.sin(phi_beam)
+
+    # Phase delay [radians] due to electrical path difference.
+    psi_ele = (-2.0 * np.pi * tfreq * 1000.0 * tdiff * 1.0e-6)
+    # Elevation angle (a0) where psi (phase difference) is maximum
+    a0 = np.arcsin(sgn * int_pos[2] * cp0
+                   / np.sqrt(int_pos[1]**2 + int_pos[2]**2))
+    a0 = np.maximum(a0, 0)
+    ca0 = np.cos(a0)
+    sa0 = np.sin(a0)
+
+    # maximum phase = psi_ele + psi_geo(a0)
+    psi_max = psi_ele + 2.0 * np.pi * tfreq *\
+        (1e3 / C) * (int_pos[0] * sp0 + int_pos[1]
+                     * np.sqrt(ca0*ca0 - sp0*sp0) + int_pos[2] * sa0)
+
+    # compute the number of 2pi factors necessary to map to correct region
+    dpsi = (psi_max - phi0)
+    if int_pos[1] > 0:
+        n2pi = np.floor(dpsi / (2.0 * np.pi))
+    else:
+        n2pi = np.ceil(dpsi / (2.0 * np.pi))
+    d2pi = n2pi * 2.0 * np.pi
+    # map observed phase to correct extended phase
+    psi_obs = phi0 + d2pi
+    # solve for the elevation angle
+    E = (psi_obs / (2.0*np.pi*tfreq*1.0e3)
+         + tdiff*1e-6) * C - int_pos[0] * sp0
+
+    alpha = np.arcsin((E*int_pos[2]
+                       + np.sqrt(E*E * int_pos[2]**2
+                       - (int_pos[1]**2 + int_pos[2]**2)
+                       * (E*E - int_pos[1]*int_pos[1]*cp0*cp0)))
+                      / (int_pos[1]*int_pos[1] + int_pos[2]*int_pos[2]))
+
+    # Convert theta back to degrees
+    return np.degrees(alpha)
+
+
+def calibrate_tdiff(dmap_data: List[dict], tdiffs: np.ndarray,
+                    interferometer_offset: list = None,
+                    bins: np.ndarray = np.arange(0, 91, 1),
+                    max_elements: int = 2000000, cpus: int = 1,
+                    date: dt.datetime = None):
+    """
+    Elevation distributions of a list of tdiff values, e.g. to find the
+    tdiff of a radar. The elevations of several tdiff values are calculated
+    at once, chunked so at most max_elements elevations are in memory.
+    When the records have more than max_elements phases the phases of
+    each tdiff are chunked as well.
+
+    Parameters
+    -----------
+    dmap_data: list of dictionaries
+        fitacf data
+    tdiffs: np.ndarray
+        tdiff values to calculate the elevations with, microseconds
+    interferometer_offset: list
+        select position of interferometer array wrt the main array
+        needs to be list of [X, Y, Z] e.g. [0.0, 100.0, 1.0]
+    bins: np.ndarray
+        edges of the elevation histogram bins [degrees]
+        Default: 1 degree bins from 0 to 90
+    max_elements: int
+        largest number of elevations calculated at once
+        Default: 2000000
+    cpus: int
+        Number of processes used to calculate the chunks of tdiff values
+        Default: 1
+    date: datetime
+        date of the hardware information to use
+        Default: time of the first record
+
+    Returns
+    -------
+    sweep: dict
+        'tdiff': the tdiff values
+        'bins': edges of the histogram bins
+        'histogram': (tdiff, bin) counts of elevations in each bin
+        'count': number of valid (finite) elevations of each tdiff
+        'mean', 'median', 'std': statistics of the valid elevations of
+        each tdiff [degrees], NaN if there are none
+
+    Notes
+    -----
+    When the phases are chunked the elevations are calculated twice, the
+    second pass only keeps the elevations near the median to find it
+    exactly.
+    """
+    radar_hdw, int_pos, _, phi0, bmnum, tfreq =\
+        _stack_records(dmap_data, interferometer_offset, date)
+    tdiffs = np.atleast_1d(np.asarray(tdiffs, dtype=float))
+    bins = np.asarray(bins, dtype=float)
+    # number of tdiff values in each chunk
+    size = max(1, max_elements // max(1, len(phi0)))
+    chunks = [tdiffs[i:i + size] for i in range(0, len(tdiffs), size)]
+    if len(phi0) > max_elements:
+        # a single tdiff does not fit, its phases are chunked
+        sweep_chunk = partial(_sweep_phases, size=max(1, max_elements))
+    else:
+        sweep_chunk = _sweep_chunk
+    sweep_chunk = partial(sweep_chunk, phi0=phi0, bmnum=bmnum, tfreq=tfreq,
+                          int_pos=int_pos, beams=radar_hdw.beams,
+                          beam_separation=radar_hdw.beam_separation,
+                          bins=bins)
+    if cpus > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=cpus) as pool:
+            results = list(pool.map(sweep_chunk, chunks))
+    else:
+        results = [sweep_chunk(chunk) for chunk in chunks]
+    sweep = {'tdiff': tdiffs, 'bins': bins}
+    for key in ('histogram', 'count', 'mean', 'median', 'std'):
+        sweep[key] = np.concatenate([result[key] for result in results])
+    return sweep
+
+
+def _sweep_chunk(tdiffs, phi0, bmnum, tfreq, int_pos, beams,
+                 beam_separation, bins):
+    """
+    Histogram and statistics of the elevations of a chunk of tdiff
+    values, see calibrate_tdiff
+    """
+    # (tdiff, phase) elevations
+    elv = elevation(phi0, bmnum, tfreq, tdiffs[:, np.newaxis], int_pos,
+                    beams, beam_separation)
+    valid = np.isfinite(elv)
+    count = valid.sum(axis=1)
+    result = {'histogram': _histogram(elv, bins), 'count': count}
+    elv = np.where(valid, elv, np.nan)
+    for key, statistic in (('mean', np.nanmean), ('median', np.nanmedian),
+                           ('std', np.nanstd)):
+        result[key] = np.full(len(tdiffs), np.nan)
+        result[key][count > 0] = statistic(elv[count > 0], axis=1)
+    return result
+
+
+def _sweep_phases(tdiffs, phi0, bmnum, tfreq, int_pos, beams,
+                  beam_separation, bins, size, median_bins=18000):
+    """
+    Histogram and statistics of the elevations of a chunk of tdiff
+    values, the phases of each tdiff are calculated size at a time,
+    see calibrate_tdiff
+    """
+    nbins = len(bins) - 1
+    result = {'histogram': np.zeros((len(tdiffs), nbins), dtype=int),
+              'count': np.zeros(len(tdiffs), dtype=int)}
+    for key in ('mean', 'median', 'std'):
+        result[key] = np.full(len(tdiffs), np.nan)
+    phases = [slice(i, i + size) for i in range(0, len(phi0), size)]
+
+    def elevations(tdiff, phase):
+        elv = elevation(phi0[phase], bmnum[phase], tfreq[phase], tdiff,
+                        int_pos, beams, beam_separation)
+        return elv[np.isfinite(elv)]
+
+    def median_bin(elv):
+        # fine bins over the range of arcsin to locate the median
+        return np.clip(((elv + 90) * (median_bins / 180)).astype(int), 0,
+                       median_bins - 1)
+
+    for row, tdiff in enumerate(tdiffs):
+        count, mean, m2 = 0, 0.0, 0.0
+        fine = np.zeros(median_bins, dtype=int)
+        for phase in phases:
+            elv = elevations(tdiff, phase)
+            if len(elv) == 0:
+                continue
+            result['histogram'][row] += _histogram(elv[np.newaxis], bins)[0]
+            fine += np.bincount(median_bin(elv), minlength=median_bins)
+            # combine the mean and sum of squared deviations of the chunks
+            delta = elv.mean() - mean
+            total = count + len(elv)
+            mean += delta * len(elv) / total
+            m2 += ((elv - elv.mean())**2).sum() + \
+                delta**2 * count * len(elv) / total
+            count = total
+        result['count'][row] = count
+        if count == 0:
             continue
+        result['mean'][row] = mean
+        result['std'][row] = np.sqrt(m2 / count)
+        # the median is the mean of the middle one or two elevations,
+        # only the elevations in their fine bins are kept to find them
+        ranks = np.array([(count - 1) // 2, count // 2])
+        cumulative = np.cumsum(fine)
+        first, last = np.searchsorted(cumulative, ranks, side='right')
+        below = cumulative[first - 1] if first > 0 else 0
+        middle = np.sort(np.concatenate(
+            [elv[(median_bin(elv) >= first) & (median_bin(elv) <= last)]
+             for elv in (elevations(tdiff, phase) for phase in phases)]))
+        result['median'][row] = middle[ranks - below].mean()
+    return result
 
-        # Beam direction off boresight in RADIANS
-        phi0 = np.radians(radar_hdw.beam_separation
-                          * (dmap_data[ind]['bmnum'] - boff))
-        # Cos and Sin of phi in shape of phi0
-        cp0 = np.cos(phi0)
-        sp0 = np.sin(phi0)
-
-        # Phase delay [radians] due to electrical path difference.
-        psi_ele = (-2.0 * np.pi * (dmap_data[ind]['tfreq'])
-                   * 1000.0 * tdiff * 1.0e-6)
-        # Elevation angle (a0) where psi (phase difference) is maximum
-        a0 = np.arcsin(sgn * int_pos[2] * cp0
-                       / np.sqrt(int_pos[1]**2 + int_pos[2]**2))
-        if a0 < 0:
-            a0 = 0
-        ca0 = np.cos(a0)
-        sa0 = np.sin(a0)
-
-        # maximum phase = psi_ele + psi_geo(a0)
-        psi_max = psi_ele + 2.0 * np.pi * (dmap_data[ind]['tfreq']) *\
-            (1e3 / C) * (int_pos[0] * sp0 + int_pos[1]
-                         * np.sqrt(ca0*ca0 - sp0*sp0) + int_pos[2] * sa0)
-
-        # compute the number of 2pi factors necessary to map to correct region
-        dpsi = (psi_max - dmap_data[ind]['phi0'])
-        if int_pos[1] > 0:
-            n2pi = np.floor(dpsi / (2.0 * np.pi))
-        else:
-            n2pi = np.ceil(dpsi / (2.0 * np.pi))
-        d2pi = n2pi * 2.0 * np.pi
-        # map observed phase to correct extended phase
-        psi_obs = dmap_data[ind]['phi0'] + d2pi
-        # solve for the elevation angle
-        E = (psi_obs / (2.0*np.pi*dmap_data[ind]['tfreq']*1.0e3)
-             + tdiff*1e-6) * C - int_pos[0] * sp0
-
-        alpha = np.arcsin((E*int_pos[2]
-                           + np.sqrt(E*E * int_pos[2]**2
-                           - (int_pos[1]**2 + int_pos[2]**2)
-                           * (E*E - int_pos[1]*int_pos[1]*cp0*cp0)))
-                          / (int_pos[1]*int_pos[1] + int_pos[2]*int_pos[2]))
-
-        # Convert theta back to degrees
-        if overwrite:
-            dmap_amended[ind].update({'elv': np.degrees(alpha)})
-        else:
-            elv_amended[ind] = np.degrees(alpha)
 
-    if overwrite:
-        return dmap_amended
+def _histogram(elv, bins):
+    """
+    (tdiff, bin) counts of the finite elevations of each row of elv
+    """
+    nbins = len(bins) - 1
+    # the last bin includes its right edge, as np.histogram
+    index = np.minimum(np.searchsorted(bins, elv, side='right') - 1,
+                       nbins - 1)
+    # NaN is never inside the bins
+    inside = (elv >= bins[0]) & (elv <= bins[-1])
+    rows = np.broadcast_to(np.arange(len(elv))[:, np.newaxis], elv.shape)
+    return np.bincount(rows[inside] * nbins + index[inside],
+                       minlength=len(elv) * nbins).reshape(len(elv), nbins)
+
+
+def _stack_records(dmap_data: List[dict], interferometer_offset: list = None,
+                   date: dt.datetime = None):
+    """
+    Hardware information and the stacked phases of the records with
+    elevation data
+
+    Parameters
+    -----------
+    dmap_data: list of dictionaries
+        fitacf data
+    interferometer_offset: list
+        position of interferometer array wrt the main array, the hardware
+        file offset is used if None
+    date: datetime
+        date of the hardware information to use
+        Default: time of the first record
+
+    Returns
+    -------
+    radar_hdw: _HdwInfo
+        hardware information of the radar of the first record in use on
+        the date
+    int_pos: list
+        position of interferometer array wrt the main array [X, Y, Z]
+    records: list
+        indices of the records with elevation data
+    phi0: np.ndarray
+        concatenated phi0 of the records
+    bmnum: np.ndarray
+        beam number of each phase
+    tfreq: np.ndarray
+        transmit frequency of each phase
+    """
+    # Hardware config for radar
+    # Only the first record is used for the radar and the date
+    if date is None:
+        date = time2datetime(dmap_data[0])
+    radar_hdw = SuperDARNRadars.hardware(RadarID(dmap_data[0]['stid']), date)
+    if interferometer_offset is not None:
+        int_pos = interferometer_offset
     else:
-        return elv_amended
+        int_pos = radar_hdw.interferometer_offset
+
+    # Records with elevation data
+    records = []
+    for ind, record in enumerate(dmap_data):
+        if 'phi0' in record:
+            records.append(ind)
+        else:
+            print("No elevation data. 'phi0' parameter missing"
+                  " from the record")
+    phi0 = [np.asarray(dmap_data[ind]['phi0']) for ind in records]
+    lengths = [len(phi) for phi in phi0]
+    bmnum = np.repeat([dmap_data[ind]['bmnum'] for ind in records], lengths)
+    tfreq = np.repeat([dmap_data[ind]['tfreq'] for ind in records], lengths)
+    return (radar_hdw, int_pos, records, np.concatenate(phi0 + [np.zeros(0)]),
+            bmnum, tfreq)
@@ -11,6 +11,7 @@
 # supplemented by the additional permissions listed below.
 #
 # Modification:
+# 2026-10-18 added build_scan_cube for vectorised scan arrays
 #
 """
 This module is used for sorting a given dmap_data list of dictionaries
@@ -19,8 +20,8 @@ into scans
 
 import datetime
 import numpy as np
-from typing import List
-from pydarn import time2datetime
+from typing import List, Union
+from pydarn import time2datetime, partial_record_warning
 
 
 def build_scan(dmap_data: List[dict]):
@@ -103,4 +104,90 @@ def find_records_by_scan(dmap_data: List[dict], scan_index: int):
     """
     scan_indices = build_scan(dmap_data)
     matches = np.nonzero(scan_indices == scan_index)[0]
-    return [dmap_data[match] for match in matches]
\ No newline at end of file
+    return [dmap_data[match] for match in matches]
+
+def build_scan_cube(data: Union[List[dict], dict],
+                    parameters: List[str] = ('v', 'p_l', 'w_l', 'elv',
+                                             'gflg'),
+                    ranges: List[int] = None, shape: tuple = None,
+                    fill_value: float = np.nan, warn: bool = True):
+    """
+    Assembles gate x beam arrays for several parameters at once from
+    a list of records or a columnar table. When a gate of a beam appears
+    in more than one record the last record is used.
+
+    Parameters
+    ----------
+    data: List(dict) or dict
+        list of records (dictionaries) representing dmap data, or a
+        columnar table: a dictionary of equal length 1D arrays with one
+        row per measured gate, containing 'bmnum', 'slist' and the
+        parameters
+    parameters: List(str)
+        parameter names to build arrays for
+        Default: ('v', 'p_l', 'w_l', 'elv', 'gflg')
+    ranges: List(int)
+        range gates to keep as [lower_bound, upper_bound), the first row
+        of the arrays is the lower bound
+        Default: all gates from 0
+    shape: tuple
+        shape of the arrays as (gates, beams)
+        Default: (upper_bound - lower_bound, largest beam number + 1)
+    fill_value: float
+        value of the cells without data
+        Default: np.nan
+    warn: bool
+        warn once if any partial records were skipped
+        Default: True
+
+    Returns
+    ----------
+    cube: dict
+        gates x beams array for each parameter
+    partial_records: int
+        number of records skipped because they were missing slist or
+        one of the parameters
+    """
+    if isinstance(data, dict):
+        columns = {key: np.asarray(data[key])
+                   for key in ('bmnum', 'slist', *parameters)}
+        partial_records = 0
+    else:
+        keys = ('slist', *parameters)
+        complete = [rec for rec in data if all(key in rec for key in keys)]
+        partial_records = len(data) - len(complete)
+        if complete:
+            columns = {key: np.concatenate([np.atleast_1d(rec[key])
+                                            for rec in complete])
+                       for key in keys}
+            columns['bmnum'] = np.repeat([rec['bmnum'] for rec in complete],
+                                         [len(np.atleast_1d(rec['slist']))
+                                          for rec in complete])
+        else:
+            columns = {key: np.array([], dtype=int)
+                       for key in ('bmnum', *keys)}
+    if partial_records > 0 and warn:
+        partial_record_warning()
+
+    gates = columns['slist'].astype(int)
+    beams = columns['bmnum'].astype(int)
+    if ranges is None:
+        ranges = [0, int(gates.max()) + 1 if gates.size else 0]
+    if shape is None:
+        shape = (ranges[1] - ranges[0],
+                 int(beams.max()) + 1 if beams.size else 0)
+
+    # Exclude ranges larger than the expected maximum as the fitacf files
+    # and the hardware files can disagree
+    good_data = (gates >= ranges[0]) & (gates < ranges[1]) &\
+        (gates - ranges[0] < shape[0]) & (beams >= 0) & (beams < shape[1])
+    cells = (gates[good_data] - ranges[0]) * shape[1] + beams[good_data]
+    # Keep the last occurrence of each cell
+    cells, last = np.unique(cells[::-1], return_index=True)
+    rows = np.nonzero(good_data)[0][::-1][last]
+
+    cube = {}
+    for parameter in parameters:
+        cube[parameter] = np.full(shape, fill_value, dtype=float)
+        cube[parameter].ravel()[cells] = columns[parameter][rows]
+    return cube, partial_records
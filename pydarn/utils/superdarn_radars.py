@@ -15,14 +15,22 @@
 #            the hardware format
 # 2023-01-21 CJM Added ICE and ICW defaults and hdw link
 # 2024-01-24 CJM added NSSC radars and updated hdw link
+# 2026-10-18 added read_hdw_history to read every hardware epoch
+# 2026-10-18 hardware files are read when a radar is first looked up
+# 2026-10-18 added HdwHistory, hardware files are parsed once and
+#            searched by date
+# 2026-10-18 added SuperDARNRadars.hardware, the hardware of a radar on
+#            a date
 """
 This module contains SuperDARN radar information
 """
 import glob
+import numpy as np
 import os
 import pydarn
 import shutil
 
+from collections.abc import MutableMapping
 from typing import NamedTuple
 from enum import Enum
 from datetime import datetime
@@ -74,6 +82,235 @@ def get_hdw_files(force: bool = True, version: str = None):
             shutil.move(hdw_file, hdw_path+os.path.basename(hdw_file))
         # delete the empty folder
         os.removedirs(hdw_path+'/hdw-main/')
+        # the cached hardware histories are out of date
+        HdwHistory.clear()
+
+
+class HdwHistory:
+    """
+    Cache of the parsed hardware files, every radar's file is read once and
+    kept as a sorted array of the epochs (dates the lines become valid) and
+    the _HdwInfo record of each epoch, so the hardware information for any
+    date is found with a binary search.
+
+    Methods
+    -------
+        get
+        lookup
+        clear
+    """
+    _histories = {}
+
+    @classmethod
+    def get(cls, abbrv: str, update: bool = False):
+        """
+        Returns the hardware history of a radar, reading the hardware file
+        the first time the radar is requested
+
+        Parameters
+        ----------
+            abbrv : str
+                Radars 3 letter assigned abbreviation
+            update: bool
+                If True this will update the hardware files again
+                without re-installing pydarn
+                default: False
+
+        Returns
+        -------
+            epochs: np.ndarray
+                datetime64[s] array of the first date each line is valid
+            records: list
+                _HdwInfo object for each epoch
+
+        Raises
+        ------
+        HardwareFileNotFoundError raised when there is no hardware file found
+        for the given abbreviation
+        """
+        try:
+            return cls._histories[abbrv]
+        except KeyError:
+            pass
+        hdw_path = os.path.dirname(__file__)+'/hdw/'
+        hdw_file = "{path}/hdw.dat.{radar}".format(path=hdw_path,
+                                                    radar=abbrv)
+        # if the file does not exist then try
+        # and download it
+        if os.path.exists(hdw_file) is False:
+            get_hdw_files(force=update)
+        try:
+            with open(hdw_file, 'r') as reader:
+                hdw_data = [line.split() for line in reader
+                            if '#' not in line and len(line.split()) > 1]
+        except FileNotFoundError:
+            raise pydarn.radar_exceptions.HardwareFileNotFoundError(abbrv)
+        records = [cls._parse(abbrv, fields) for fields in hdw_data]
+        epochs = np.array([record.date for record in records],
+                          dtype='datetime64[s]')
+        cls._histories[abbrv] = (epochs, records)
+        return epochs, records
+
+    @classmethod
+    def lookup(cls, abbrv: str, dates, update: bool = False):
+        """
+        Returns the index of the hardware epoch in use at the given dates
+
+        Parameters
+        ----------
+            abbrv : str
+                Radars 3 letter assigned abbreviation
+            dates: datetime or np.ndarray
+                date or array of dates (datetime or datetime64)
+            update: bool
+                If True this will update the hardware files again
+                without re-installing pydarn
+                default: False
+
+        Returns
+        -------
+            index: int or np.ndarray
+                index into the records of get, the last epoch that starts on
+                or before each date. Dates before the first epoch use the
+                first epoch.
+        """
+        epochs, _ = cls.get(abbrv, update)
+        index = np.searchsorted(epochs, np.asarray(dates, 'datetime64[s]'),
+                                side='right') - 1
+        return np.maximum(index, 0)
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears the cached hardware histories, the files are read again on
+        the next request
+        """
+        cls._histories.clear()
+
+    @staticmethod
+    def _parse(abbrv: str, hdw_data: list):
+        """
+        Converts the fields of a hardware file line into a _HdwInfo object
+
+        Hardware data array positions definitions:
+            0: Station ID (unique numerical value).
+            1: Status code (1 operational, -1 offline).
+            2: First date that parameter string is valid
+               (YYYYMMDD).
+            3: First time that parameter string is valid
+               (HH:MM:SS).
+            4: Geographic latitude of radar site
+               (Given in decimal degrees to 3
+               decimal places. Southern hemisphere
+               values are negative)
+            5: Geographic longitude of radar site
+               (Given in decimal degrees to
+               3 decimal places.
+               West longitude values are negative)
+            6: Altitude of the radar site (meters)
+            7: Physical scanning boresight
+               (Direction of the center beam, measured in
+               degrees relative to geographic north.
+               CCW rotations are negative.)
+            8: Electronic shift to radar scanning
+               boresight (Degrees relative to
+               physical antenna boresight.
+               Normally 0.0 degrees)
+            9: Beam separation (Angular
+               separation in degrees between adjacent
+               beams. Normally 3.24 degrees)
+            10: Velocity sign (At the radar level,
+                backscattered signals with
+                frequencies above the transmitted
+                frequency are assigned positive
+                Doppler velocities while backscattered
+                signals with frequencies below
+                the transmitted frequency are assigned
+                negative Doppler velocity. This
+                convention can be reversed by changes
+                in receiver design or in the
+                data sampling rate. This parameter
+                is set to +1 or -1 to maintain the
+                convention.)
+            11: Phase sign (Cabling errors can
+                lead to a 180 degree shift of the
+                interferometry phase measurement.
+                +1 indicates that the sign is
+                correct, -1 indicates that it must be flipped.)
+            12: Tdiff [Channel A]
+                (Propagation time from interferometer
+                array antenna to phasing matrix input
+                minus propagation time from main array antenna
+                through transmitter to phasing matrix input.
+                Units are decimal
+                microseconds)
+            13: Tdiff [Channel B]
+                (Propagation time from interferometer
+                array antenna to phasing matrix input minus
+                propagation time from main array antenna
+                through transmitter to phasing matrix input.
+                Units are decimal microseconds)
+            14: Interferometer X offset
+                (Displacement of midpoint of interferometer
+                array from midpoint of main array,
+                along the line of antennas
+                with +X toward higher antenna numbers.
+                Units are meters)
+            15: Interferometer Y offset
+                (Displacement of midpoint of
+                interferometer array from midpoint of
+                main array, along the array
+                normal direction with +Y in the direction of
+                the array normal. Units are meters)
+            16: Interferometer Z offset
+                (Displacement of midpoint of
+                interferometer array from midpoint of
+                main array, in terms of altitude
+                difference with +Z up. Units are meters)
+            17: Analog Rx rise time
+                (Time given in microseconds. Time delays of
+                less than ~10 microseconds can be ignored.
+                If narrow-band filters are
+                used in analog receivers or front-ends,
+                the time delays should be
+                specified.)
+            18: Analog Rx attenuator step (dB)
+            19: Analog attenuation stages (Number of stages.
+                This is used for gain control of an analog
+                receiver or front-end.)
+            20: Maximum of range gates used
+            21: Maximum number of beams
+        """
+        # Hardware files give the date and time the line becomes valid
+        date = datetime(year=int(hdw_data[2][0:4]),
+                        month=int(hdw_data[2][4:6]),
+                        day=int(hdw_data[2][6:8]),
+                        hour=int(hdw_data[3][0:2]),
+                        minute=int(hdw_data[3][3:5]),
+                        second=int(hdw_data[3][6:8]))
+        return _HdwInfo(stid=int(hdw_data[0]),
+                        status=Status(int(hdw_data[1])),
+                        abbrev=abbrv,
+                        date=date,
+                        geographic=_Coord(float(hdw_data[4]),
+                                          float(hdw_data[5]),
+                                          float(hdw_data[6])),
+                        boresight=_Boresight(float(hdw_data[7]),
+                                             float(hdw_data[8])),
+                        beam_separation=float(hdw_data[9]),
+                        velocity_sign=float(hdw_data[10]),
+                        phase_sign=float(hdw_data[11]),
+                        tdiff=_Tdiff(float(hdw_data[12]),
+                                     float(hdw_data[13])),
+                        interferometer_offset=_InterferometerOffset(
+                            float(hdw_data[14]),
+                            float(hdw_data[15]),
+                            float(hdw_data[16])),
+                        rx_rise_time=float(hdw_data[17]),
+                        rx_attenuator=float(hdw_data[18]),
+                        attenuation_stages=int(hdw_data[19]),
+                        gates=int(hdw_data[20]),
+                        beams=int(hdw_data[21]))
 
 
 def read_hdw_file(abbrv, date: datetime = None, update: bool = False):
@@ -100,155 +337,42 @@ def read_hdw_file(abbrv, date: datetime = None, update: bool = False):
     ------
     HardwareFileNotFoundError raised when there is no hardware file found for
     the given abbreviation
+
+    See Also
+    --------
+    HdwHistory : cache of the parsed hardware files
     """
     if date is None:
         date = datetime.now()
+    _, records = HdwHistory.get(abbrv, update)
+    return records[HdwHistory.lookup(abbrv, date)]
 
-    hdw_path = os.path.dirname(__file__)+'/hdw/'
-    hdw_file = "{path}/hdw.dat.{radar}".format(path=hdw_path, radar=abbrv)
-    hdw_data = []
-    hdw_lines_date = []
-    # if the file does not exist then try
-    # and download it
-    if os.path.exists(hdw_file) is False:
-        get_hdw_files(force=update)
-    try:
-        with open(hdw_file, 'r') as reader:
-            lines = reader.readlines()
-            for i in range(len(lines)):
-                if '#' not in lines[i] and len(lines[i].split()) > 1:
-                    hdw_data.append(lines[i].split())
-                    """
-                    Hardware files give the year and seconds from the beginning
-                    of that year. Thus to check the date if it corresponds we
-                    need to convert to a datetime object and then compare.
-                    """
-                    j = len(hdw_data)-1
-                    hdw_lines_date.append(
-                        datetime(year=int(hdw_data[j][2][0:4]),
-                                 month=int(hdw_data[j][2][4:6]),
-                                 day=int(hdw_data[j][2][6:8]),
-                                 hour=int(hdw_data[j][3][0:2]),
-                                 minute=int(hdw_data[j][3][3:5]),
-                                 second=int(hdw_data[j][3][6:8])))
-                    if hdw_lines_date[j] > date:
-                        j = j-1
-                        break
-            """
-            Hardware data array positions definitions:
-                0: Station ID (unique numerical value).
-                1: Status code (1 operational, -1 offline).
-                2: First date that parameter string is valid
-                   (YYYYMMDD).
-                3: First time that parameter string is valid
-                   (HH:MM:SS).
-                4: Geographic latitude of radar site
-                   (Given in decimal degrees to 3
-                   decimal places. Southern hemisphere
-                   values are negative)
-                5: Geographic longitude of radar site
-                   (Given in decimal degrees to
-                   3 decimal places.
-                   West longitude values are negative)
-                6: Altitude of the radar site (meters)
-                7: Physical scanning boresight
-                   (Direction of the center beam, measured in
-                   degrees relative to geographic north.
-                   CCW rotations are negative.)
-                8: Electronic shift to radar scanning
-                   boresight (Degrees relative to
-                   physical antenna boresight.
-                   Normally 0.0 degrees)
-                9: Beam separation (Angular
-                   separation in degrees between adjacent
-                   beams. Normally 3.24 degrees)
-                10: Velocity sign (At the radar level,
-                    backscattered signals with
-                    frequencies above the transmitted
-                    frequency are assigned positive
-                    Doppler velocities while backscattered
-                    signals with frequencies below
-                    the transmitted frequency are assigned
-                    negative Doppler velocity. This
-                    convention can be reversed by changes
-                    in receiver design or in the
-                    data sampling rate. This parameter
-                    is set to +1 or -1 to maintain the
-                    convention.)
-                11: Phase sign (Cabling errors can
-                    lead to a 180 degree shift of the
-                    interferometry phase measurement.
-                    +1 indicates that the sign is
-                    correct, -1 indicates that it must be flipped.)
-                12: Tdiff [Channel A]
-                    (Propagation time from interferometer
-                    array antenna to phasing matrix input
-                    minus propagation time from main array antenna
-                    through transmitter to phasing matrix input.
-                    Units are decimal
-                    microseconds)
-                13: Tdiff [Channel B]
-                    (Propagation time from interferometer
-                    array antenna to phasing matrix input minus
-                    propagation time from main array antenna
-                    through transmitter to phasing matrix input.
-                    Units are decimal microseconds)
-                14: Interferometer X offset
-                    (Displacement of midpoint of interferometer
-                    array from midpoint of main array,
-                    along the line of antennas
-                    with +X toward higher antenna numbers.
-                    Units are meters)
-                15: Interferometer Y offset
-                    (Displacement of midpoint of
-                    interferometer array from midpoint of
-                    main array, along the array
-                    normal direction with +Y in the direction of
-                    the array normal. Units are meters)
-                16: Interferometer Z offset
-                    (Displacement of midpoint of
-                    interferometer array from midpoint of
-                    main array, in terms of altitude
-                    difference with +Z up. Units are meters)
-                17: Analog Rx rise time
-                    (Time given in microseconds. Time delays of
-                    less than ~10 microseconds can be ignored.
-                    If narrow-band filters are
-                    used in analog receivers or front-ends,
-                    the time delays should be
-                    specified.)
-                18: Analog Rx attenuator step (dB)
-                19: Analog attenuation stages (Number of stages.
-                    This is used for gain control of an analog
-                    receiver or front-end.)
-                20: Maximum of range gates used
-                21: Maximum number of beams
-            """
-            return _HdwInfo(stid=int(hdw_data[j][0]),
-                            status=Status(int(hdw_data[j][1])),
-                            abbrev=abbrv,
-                            date=hdw_lines_date[j],
-                            geographic=_Coord(float(hdw_data[j][4]),
-                                              float(hdw_data[j][5]),
-                                              float(hdw_data[j][6])),
-                            boresight=_Boresight(float(hdw_data[j][7]),
-                                                 float(hdw_data[j][8])),
-                            beam_separation=float(hdw_data[j][9]),
-                            velocity_sign=float(hdw_data[j][10]),
-                            phase_sign=float(hdw_data[j][11]),
-                            tdiff=_Tdiff(float(hdw_data[j][12]),
-                                         float(hdw_data[j][13])),
-                            interferometer_offset=_InterferometerOffset(
-                                float(hdw_data[j][14]),
-                                float(hdw_data[j][15]),
-                                float(hdw_data[j][16])),
-                            rx_rise_time=float(hdw_data[j][17]),
-                            rx_attenuator=float(hdw_data[j][18]),
-                            attenuation_stages=int(hdw_data[j][19]),
-                            gates=int(hdw_data[j][20]),
-                            beams=int(hdw_data[j][21]))
-    except FileNotFoundError:
-        raise pydarn.radar_exceptions.HardwareFileNotFoundError(abbrv)
+
+def read_hdw_history(abbrv, update: bool = False):
+    """
+    Reads every entry (hardware epoch) of the hardware file for the
+    associated abbreviation of the radar name.
+
+    Parameters
+    ----------
+        abbrv : str
+            Radars 3 letter assigned abbreviation
+        update: bool
+            If True this will update the hardware files again
+            without re-installing pydarn
+            default: False
+    Return
+    ------
+    list of _HdwInfo objects, one for each line of the hardware file in
+        the order of the file
+
+    Raises
+    ------
+    HardwareFileNotFoundError raised when there is no hardware file found for
+    the given abbreviation
+    """
+    _, records = HdwHistory.get(abbrv, update)
+    return list(records)
 
 
 class Hemisphere(Enum):
@@ -443,7 +567,8 @@ class _Radar(NamedTuple):
     hemisphere: Hemisphere
         Hemisphere the radar belongs to
     hardware_info: _HdwInfo
-        NamedTuple containing all hardware information from hardware files
+        NamedTuple containing all hardware information from hardware files,
+        None until the radar is looked up in SuperDARNRadars.radars
     """
     name: str
     institution: str
@@ -451,7 +576,56 @@ class _Radar(NamedTuple):
     range_gate_45: int
     geo_label: list
     mag_label: list
-    hardware_info: _HdwInfo
+    hardware_info: _HdwInfo = None
+
+
+class _RadarTable(MutableMapping):
+    """
+    Dictionary of _Radar objects keyed by RadarID that reads the hardware
+    file of a radar the first time the radar is looked up, so importing
+    pydarn does not read (or download) any hardware files.
+
+    Parameters
+    ----------
+    radars: dict
+        RadarID keys with _Radar values without hardware information
+
+    Notes
+    -----
+    Once read, the hardware information is kept for the rest of the
+    session, assigning a _Radar to a key replaces the stored radar
+    """
+    def __init__(self, radars: dict):
+        self._radars = dict(radars)
+
+    def __getitem__(self, stid):
+        radar = self._radars[stid]
+        if radar.hardware_info is None:
+            radar = radar._replace(
+                hardware_info=read_hdw_file(stid.name.lower()))
+            self._radars[stid] = radar
+        return radar
+
+    def __setitem__(self, stid, radar):
+        self._radars[stid] = radar
+
+    def __delitem__(self, stid):
+        del self._radars[stid]
+
+    def __iter__(self):
+        return iter(self._radars)
+
+    def __len__(self):
+        return len(self._radars)
+
+    def __contains__(self, stid):
+        return stid in self._radars
+
+    def __repr__(self):
+        loaded = sum(radar.hardware_info is not None
+                     for radar in self._radars.values())
+        return "{}({} radars, {} loaded)".format(type(self).__name__,
+                                                 len(self._radars), loaded)
 
 
 class RadarID(Enum):
@@ -524,159 +698,151 @@ class SuperDARNRadars():
         radars: dict
             dictionary of each SuperDARN radar with key being STID value and
             a _Radar object containing the name, institutional and hardware
-            information of the radar
+            information of the radar. The hardware file of a radar is only
+            read the first time the radar is looked up.
+
+    Methods
+    -------
+        hardware: hardware information of a radar on a date
 
     See Also
     --------
         _Radar : radar object containing radar information
+        _RadarTable : dictionary reading the hardware information on lookup
         read_hdw_file : function to read hardware information for a given radar
     """
-    radars = {RadarID.ADE: _Radar('Adak Island East',
+    radars = _RadarTable({RadarID.ADE: _Radar('Adak Island East',
                           'Penn State University', Hemisphere.North,
-                                  75, [47, -172], [42, -106], read_hdw_file('ade')),
+                                  75, [47, -172], [42, -106]),
               RadarID.ADW: _Radar('Adak Island West', 'Penn State University',
-                                  Hemisphere.North, 75, [47, 178], [42, -116],
-                                  read_hdw_file('adw')),
+                                  Hemisphere.North, 75, [47, 178], [42, -116]),
               RadarID.BKS: _Radar('Blackstone', 'Virginia Tech', Hemisphere.North,
-                                  100, [32, -78], [44, -5], read_hdw_file('bks')),
+                                  100, [32, -78], [44, -5]),
               RadarID.CVE: _Radar('Christmas Valley East', 'Dartmouth College',
-                                  Hemisphere.North, 100, [38, -115], [48, -53],
-                                  read_hdw_file('cve')),
+                                  Hemisphere.North, 100, [38, -115], [48, -53]),
               RadarID.CVW: _Radar('Christmas Valley West', 'Dartmouth College',
-                                  Hemisphere.North, 100, [38, -125], [48, -63],
-                                  read_hdw_file('cvw')),
+                                  Hemisphere.North, 100, [38, -125], [48, -63]),
               RadarID.CLY: _Radar('Clyde River', 'University of Saskatchewan',
-                                  Hemisphere.North, 100, [65, -68], [72, 17],
-                                  read_hdw_file('cly')),
+                                  Hemisphere.North, 100, [65, -68], [72, 17]),
               RadarID.FHE: _Radar('Fort Hays East', 'Virginia Tech', Hemisphere.North,
-                                  100, [34, -94], [45, -25], read_hdw_file('fhe')),
+                                  100, [34, -94], [45, -25]),
               RadarID.FHW: _Radar('Fort Hays West', 'Virginia Tech', Hemisphere.North,
-                                  100, [34, -104], [45, -35], read_hdw_file('fhw')),
+                                  100, [34, -104], [45, -35]),
               RadarID.GBR: _Radar('Goose Bay', 'Virginia Tech', Hemisphere.North,
-                                  100, [48, -60], [54, 23], read_hdw_file('gbr')),
+                                  100, [48, -60], [54, 23]),
               RadarID.HAN: _Radar('Hankasalmi', 'University of Leicester',
-                                  Hemisphere.North, 70, [57, 27], [54, 102],
-                                  read_hdw_file('han')),
+                                  Hemisphere.North, 70, [57, 27], [54, 102]),
               RadarID.HJE: _Radar('Hejing East',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [40, 87], [36, 163],
-                                  read_hdw_file('hje')),
+                                  Hemisphere.North, 100, [40, 87], [36, 163]),
               RadarID.HJW: _Radar('Hejing West',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [40, 81], [36, 153],
-                                  read_hdw_file('hjw')),
+                                  Hemisphere.North, 100, [40, 81], [36, 153]),
               RadarID.HOK: _Radar('Hokkaido East', 'Nagoya University',
-                                  Hemisphere.North, 110, [39, 149], [35, -139],
-                                  read_hdw_file('hok')),
+                                  Hemisphere.North, 110, [39, 149], [35, -139]),
               RadarID.HKW: _Radar('Hokkaido West', 'Nagoya University',
-                                  Hemisphere.North, 110, [39, 139], [35, -149],
-                                  read_hdw_file('hkw')),
+                                  Hemisphere.North, 110, [39, 139], [35, -149]),
               RadarID.ICE: _Radar('Iceland East', 'Dartmouth College',
-                                  Hemisphere.North, 100, [61, -16], [60, 70],
-                                  read_hdw_file('ice')),
+                                  Hemisphere.North, 100, [61, -16], [60, 70]),
               RadarID.ICW: _Radar('Iceland West', 'Dartmouth College',
-                                  Hemisphere.North, 100, [61, -26], [60, 60],
-                                  read_hdw_file('icw')),
+                                  Hemisphere.North, 100, [61, -26], [60, 60]),
               RadarID.INV: _Radar('Inuvik', 'University of Saskatchewan',
-                                  Hemisphere.North, 75, [63, -134], [66, -80],
-                                  read_hdw_file('inv')),
+                                  Hemisphere.North, 75, [63, -134], [66, -80]),
               RadarID.JME: _Radar('Jiamusi East',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [42, 130], [37, -155],
-                                  read_hdw_file('jme')),
+                                  Hemisphere.North, 100, [42, 130], [37, -155]),
               RadarID.KAP: _Radar('Kapuskasing', 'Virginia Tech', Hemisphere.North,
-                                  75, [44, -82], [54, -7], read_hdw_file('kap')),
+                                  75, [44, -82], [54, -7]),
               RadarID.KSR: _Radar('King Salmon',
                          'National Institute of Information and'
                          ' Communications Technology', Hemisphere.North,
-                                  75, [54, -162], [52, -99], read_hdw_file('ksr')),
+                                  75, [54, -162], [52, -99]),
               RadarID.KOD: _Radar('Kodiak', 'Penn State University',
-                                  Hemisphere.North, 110, [53, -152], [52, -92],
-                                  read_hdw_file('kod')),
+                                  Hemisphere.North, 110, [53, -152], [52, -92]),
               RadarID.LJE: _Radar('Longjing East',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [39, 132], [32, -151],
-                                  read_hdw_file('lje')),
+                                  Hemisphere.North, 100, [39, 132], [32, -151]),
               RadarID.LJW: _Radar('Longjing West',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [39, 126], [42, -161],
-                                  read_hdw_file('ljw')),
+                                  Hemisphere.North, 100, [39, 126], [42, -161]),
               RadarID.LYR: _Radar('Longyearbyen', 'University of Centre in Svalbard',
-                                  Hemisphere.North, 70, [73, 16], [71, 108],
-                                  read_hdw_file('lyr')),
+                                  Hemisphere.North, 70, [73, 16], [71, 108]),
               RadarID.PYK: _Radar('Pykkvibaer', 'University of Leicester',
-                                  Hemisphere.North, 70, [58, -19], [56, 75],
-                                  read_hdw_file('pyk')),
+                                  Hemisphere.North, 70, [58, -19], [56, 75]),
               RadarID.PGR: _Radar('Prince George', 'University of Saskatchewan',
-                                  Hemisphere.North, 75, [49, -123], [55, -61],
-                                  read_hdw_file('pgr')),
+                                  Hemisphere.North, 75, [49, -123], [55, -61]),
               RadarID.RKN: _Radar('Rankin Inlet', 'University of Saskatchewan',
-                                  Hemisphere.North, 75, [58, -92], [66, -21],
-                                  read_hdw_file('rkn')),
+                                  Hemisphere.North, 75, [58, -92], [66, -21]),
               RadarID.SAS: _Radar('Saskatoon', 'University of Saskatchewan',
-                                  Hemisphere.North, 75, [47, -107], [56, -41],
-                                  read_hdw_file('sas')),
+                                  Hemisphere.North, 75, [47, -107], [56, -41]),
               RadarID.SCH: _Radar('Schefferville', 'CNRS/LPCE', Hemisphere.North,
-                                  75, [50, -67], [60, 14], read_hdw_file('sch')),
+                                  75, [50, -67], [60, 14]),
               RadarID.SZE: _Radar('Siziwang East',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [38, 115], [37, -169],
-                                  read_hdw_file('sze')),
+                                  Hemisphere.North, 100, [38, 115], [37, -169]),
               RadarID.SZW: _Radar('Siziwang West',
                          'National Space Science Center,'
                          'Chinese Academy of Sciences',
-                                  Hemisphere.North, 100, [38, 109], [37, -179],
-                                  read_hdw_file('szw')),
+                                  Hemisphere.North, 100, [38, 109], [37, -179]),
               RadarID.STO: _Radar('Stokkseyri', 'Lancaster University',
-                                  Hemisphere.North, 75, [58, -29], [56, 65],
-                                  read_hdw_file('sto')),
+                                  Hemisphere.North, 75, [58, -29], [56, 65]),
               RadarID.WAL: _Radar('Wallops Island', 'JHU Applied Physics Laboratory',
-                                  Hemisphere.North, 100, [33, -75], [44, 5],
-                                  read_hdw_file('wal')),
+                                  Hemisphere.North, 100, [33, -75], [44, 5]),
               RadarID.BPK: _Radar('Buckland Park', 'La Trobe University',
-                                  Hemisphere.South, 75, [-30, 138], [-40, -146],
-                                  read_hdw_file('bpk')),
+                                  Hemisphere.South, 75, [-30, 138], [-40, -146]),
               RadarID.DCE: _Radar('Dome C East',
                          'Institute for Space Astrophysics and Planetology',
-                                  Hemisphere.South, 75, [-80, 130], [-83, 0],
-                                  read_hdw_file('dce')),
+                                  Hemisphere.South, 75, [-80, 130], [-83, 0]),
               RadarID.DCN: _Radar('Dome C North',
                          'Institute for Space Astrophysics and Planetology',
-                                  Hemisphere.South, 75, [-75, 112], [-85, 90],
-                                  read_hdw_file('dcn')),
+                                  Hemisphere.South, 75, [-75, 112], [-85, 90]),
               RadarID.FIR: _Radar('Falkland Islands', 'British Antarctic Survey',
-                                  Hemisphere.South, 110, [-47, -59], [-35, 10],
-                                  read_hdw_file('fir')),
+                                  Hemisphere.South, 110, [-47, -59], [-35, 10]),
               RadarID.HAL: _Radar('Halley', 'British Antarctic Survey',
-                                  Hemisphere.South, 100, [-71, -27], [-58, 30],
-                                  read_hdw_file('hal')),
+                                  Hemisphere.South, 100, [-71, -27], [-58, 30]),
               RadarID.KER: _Radar('Kerguelen', 'IRAP/CNRS/IPEV', Hemisphere.South,
-                                  75, [-44, 70], [-53, 124], read_hdw_file('ker')),
+                                  75, [-44, 70], [-53, 124]),
               RadarID.MCM: _Radar('McMurdo', 'Penn State University',
-                                  Hemisphere.South, 75, [-78, 187], [-75, -36],
-                                  read_hdw_file('mcm')),
+                                  Hemisphere.South, 75, [-78, 187], [-75, -36]),
               RadarID.SAN: _Radar('SANAE', 'South African National Space Agency',
-                                  Hemisphere.South, 110, [-67, -3], [-60, 45],
-                                  read_hdw_file('san')),
+                                  Hemisphere.South, 110, [-67, -3], [-60, 45]),
               RadarID.SPS: _Radar('South Pole Station',
                          'Penn State University', Hemisphere.South,
-                                  75, [-87, 12], [-74, 25], read_hdw_file('sps')),
+                                  75, [-87, 12], [-74, 25]),
               RadarID.SYE: _Radar('Syowa East', 'National Institute of Polar Research',
-                                  Hemisphere.South, 75, [-64, 45], [-62, 82],
-                                  read_hdw_file('sye')),
+                                  Hemisphere.South, 75, [-64, 45], [-62, 82]),
               RadarID.SYS: _Radar('Syowa South', 'National Institute of Polar Research',
-                                  Hemisphere.South, 80, [-66, 30], [-62, 68],
-                                  read_hdw_file('sys')),
+                                  Hemisphere.South, 80, [-66, 30], [-62, 68]),
               RadarID.TIG: _Radar('Tiger', 'La Trobe University', Hemisphere.South,
-                                  75, [-38, 147], [-49, -133], read_hdw_file('tig')),
+                                  75, [-38, 147], [-49, -133]),
               RadarID.UNW: _Radar('Unwin', 'La Trobe University', Hemisphere.South,
-                                  75, [-42, 168], [-49, -105], read_hdw_file('unw')),
+                                  75, [-42, 168], [-49, -105]),
               RadarID.ZHO: _Radar('Zhongshan', 'Polar Research Institute of China',
-                                  Hemisphere.South, 70, [-67, 64], [-70, 99],
-                                  read_hdw_file('zho'))}
+                                  Hemisphere.South, 70, [-67, 64], [-70, 99])})
+
+    @classmethod
+    def hardware(cls, stid: RadarID, date: datetime = None):
+        """
+        Hardware information of a radar in use on a date
+
+        Parameters
+        ----------
+            stid: RadarID
+                station id of the radar
+            date: datetime
+                date of the hardware information, e.g. of the data
+                default: None, the current hardware in radars
+
+        Returns
+        -------
+            hardware_info: _HdwInfo
+        """
+        if date is None:
+            return cls.radars[stid].hardware_info
+        return read_hdw_file(RadarID(stid).name.lower(), date)
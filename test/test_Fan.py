@@ -15,6 +15,7 @@
 import bz2
 import datetime as dt
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 import warnings
 
@@ -32,6 +33,60 @@ class TestFan_defaults:
         with warnings.catch_warnings(record=True):
             pydarn.Fan.plot_fan(data)
 
+    @pytest.mark.parametrize('writer', [None, 'frames'])
+    def test_fan_animate(self, writer, tmp_path):
+        """ """
+        if writer == 'frames':
+            filename = str(tmp_path / 'fan_{:02d}.png')
+        else:
+            filename = str(tmp_path / 'fan.gif')
+        with warnings.catch_warnings(record=True):
+            pydarn.Fan.animate(data, scan_indices=[1, 2], filename=filename,
+                               writer=writer, groundscatter=True)
+        assert len(list(tmp_path.iterdir())) == (2 if writer else 1)
+        plt.close('all')
+
+    def test_fan_animate_no_scan(self):
+        """ """
+        with warnings.catch_warnings(record=True):
+            with pytest.raises(pydarn.plot_exceptions.NoDataFoundError):
+                pydarn.Fan.animate(data, scan_indices=[1, 10000])
+        plt.close('all')
+
+    def test_fan_composite_height(self):
+        """ precomputed geometries use the height passed in """
+        pydarn.FOVCache.clear()
+        settings = {pydarn.RadarID.SAS: (180, 45, [0, 75]),
+                    pydarn.RadarID.INV: (180, 45, [0, 75])}
+        date = pydarn.time2datetime(data[0])
+        geometries = pydarn.Fan.__fov_geometries__(
+            settings, pydarn.Coords.GEOGRAPHIC, date, 2, height=250)
+        for stid, (frang, rsep, ranges) in settings.items():
+            key = pydarn.fov_key(stid=stid, frang=frang, rsep=rsep,
+                                 gates=ranges, height=250, date=date)
+            assert pydarn.FOVCache.get(key) is not None
+        pydarn.FOVCache.clear()
+        for stid, (frang, rsep, ranges) in settings.items():
+            lats, lons = pydarn.Coords.GEOGRAPHIC(stid=stid, frang=frang,
+                                                  rsep=rsep, gates=ranges,
+                                                  height=250)
+            assert np.allclose(geometries[stid][0], lats, equal_nan=True)
+            assert np.allclose(geometries[stid][1], lons, equal_nan=True)
+
+    @pytest.mark.parametrize('cpus', [1, 2])
+    def test_fan_composite(self, cpus):
+        """ """
+        pydarn.FOVCache.clear()
+        with warnings.catch_warnings(record=True):
+            # Same records relabelled as a second radar
+            other = [dict(rec, stid=pydarn.RadarID.INV.value)
+                     for rec in data]
+            pydarn.Fan.plot_fan_composite([data, other],
+                                          pydarn.time2datetime(data[40]),
+                                          groundscatter=True, cpus=cpus,
+                                          radar_label=True)
+        plt.close('all')
+
     def test_fov_series(self):
         """ """
         with warnings.catch_warnings(record=True):
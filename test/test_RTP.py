@@ -13,11 +13,15 @@
 # supplemented by the additional permissions listed below.
 
 import bz2
+import copy
 import datetime as dt
 import matplotlib.pyplot as plt
 import pytest
 import warnings
 
+from matplotlib.collections import QuadMesh
+from matplotlib.image import PcolorImage
+
 import pydarn
 
 with bz2.open('test/data/test.fitacf.bz2') as fp:
@@ -32,6 +36,39 @@ class TestRTP_defaults:
         with warnings.catch_warnings(record=True):
             pydarn.RTP.plot_range_time(data)
 
+    @pytest.mark.parametrize('raster, beam_num, artist',
+                             [(True, 7, PcolorImage),
+                              (False, 7, QuadMesh),
+                              # all beams are not on a regular cadence
+                              (True, 'all', QuadMesh)])
+    def test_range_time_raster(self, raster, beam_num, artist):
+        """ raster and pcolormesh draw the same cells """
+        with warnings.catch_warnings(record=True):
+            rtp = pydarn.RTP.plot_range_time(data, beam_num=beam_num,
+                                             groundscatter=True,
+                                             raster=raster)
+        assert isinstance(rtp['data']['plot_data'], artist)
+        z = rtp['data']['z']
+        assert z.shape == (len(rtp['data']['y']) - 1,
+                           len(rtp['data']['x']) - 1)
+        plt.close('all')
+
+    def test_range_time_modes(self):
+        """ a change of rsep mid-file is drawn with its own range axis """
+        mixed = copy.deepcopy(data)
+        for record in mixed[len(mixed) // 2:]:
+            record['rsep'] = 15
+        with warnings.catch_warnings(record=True):
+            rtp = pydarn.RTP.plot_range_time(mixed, beam_num=7)
+        segments = rtp['data']['segments']
+        assert [segment['rsep'] for segment in segments] == [45, 15]
+        assert segments[0]['x'][-1] == segments[1]['x'][0]
+        assert segments[1]['y'][-1] < segments[0]['y'][-1]
+        for segment in segments:
+            assert segment['z'].shape == (len(segment['y']) - 1,
+                                          len(segment['x']) - 1)
+        plt.close('all')
+
     def test_coord_time_defaults(self):
         """ """
         with warnings.catch_warnings(record=True):
@@ -13,6 +13,7 @@
 # supplemented by the additional permissions listed below.
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 import warnings
 
@@ -29,6 +30,24 @@ class TestMap_defaults:
         with warnings.catch_warnings(record=True):
             pydarn.Maps.plot_mapdata(data)
 
+
+class TestMap_legendre:
+
+    def test_legendre_basis(self):
+        x = np.cos(np.linspace(0, np.pi, 11))
+        plm = pydarn.Maps.legendre_basis(x, 6)
+        assert plm.shape == (11, 7, 7)
+        somx2 = np.sqrt(1 - x**2)
+        # closed forms with the Condon-Shortley phase, as scipy
+        assert np.allclose(plm[:, 0, 0], 1)
+        assert np.allclose(plm[:, 0, 2], (3 * x**2 - 1) / 2)
+        assert np.allclose(plm[:, 1, 1], -somx2)
+        assert np.allclose(plm[:, 1, 3], -1.5 * (5 * x**2 - 1) * somx2)
+        assert np.allclose(plm[:, 2, 2], 3 * somx2**2)
+        assert np.allclose(plm[:, 6, 6], 10395 * somx2**6)
+        # m > el is zero
+        assert not plm[:, 3, :3].any()
+
 @pytest.mark.parametrize('colorbar', [False])
 @pytest.mark.parametrize('colorbar_label', 'green')
 @pytest.mark.parametrize('title', [False])
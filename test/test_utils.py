@@ -12,9 +12,13 @@
 # and conditions of version 3 of the GNU General Public License,
 # supplemented by the additional permissions listed below.
 
+import aacgmv2
 import bz2
 import datetime as dt
+import numpy as np
 import pytest
+import subprocess
+import sys
 import warnings
 
 import pydarn
@@ -25,6 +29,28 @@ with bz2.open('test/data/test.fitacf.bz2') as fp:
 data = pydarn.SuperDARNRead(fitacf_stream, True).read_fitacf()
 
 
+class TestUtils_import:
+    def test_lazy_import(self):
+        # import pydarn in a new interpreter, the plotting and coordinate
+        # modules and libraries are only imported when pydarn uses them
+        code = ("import pydarn, sys; "
+                "print('pydarn.plotting.fan' in sys.modules); "
+                "print(' '.join(sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True,
+                                check=True).stdout.splitlines()
+        assert output[0] == 'False'
+        modules = output[1].split()
+        for module in ('matplotlib', 'cartopy', 'shapely', 'scipy',
+                       'aacgmv2', 'pydarnio'):
+            assert module not in modules
+
+    def test_public_names(self):
+        for name in pydarn.__all__:
+            assert getattr(pydarn, name) is not None
+        assert set(pydarn.__all__) <= set(dir(pydarn))
+
+
 class TestUtils_citations:
     def test_citations(self):
         with warnings.catch_warnings(record=True):
@@ -40,6 +66,140 @@ class TestUtils_filters:
             bx = pydarn.Boxcar(thresh=0.7, w=None)
             bx.run_filter(data)
 
+    def test_boxcar_merge(self):
+        bx = pydarn.Boxcar()
+        with warnings.catch_warnings(record=True):
+            filtered = bx.run_filter(data)
+        filtered_beams = {(rec['time'], rec['bmnum'], rec['channel']): rec
+                          for rec in bx.filtered_data['beam_sounds']}
+        for record, filtered_record in zip(data, filtered):
+            # shallow copies, the original records are not changed
+            assert filtered_record is not record
+            assert 'slist' in record
+            assert filtered_record['pwr0'] is record['pwr0']
+            time = dt.datetime(record['time.yr'], record['time.mo'],
+                               record['time.dy'], record['time.hr'],
+                               record['time.mt'], record['time.sc'],
+                               record['time.us'])
+            key = (time, record['bmnum'], record['channel'])
+            if key in filtered_beams and 'slist' in filtered_record:
+                assert np.array_equal(filtered_record['slist'],
+                                      filtered_beams[key]['slist'])
+
+    def test_boxcar_stream(self):
+        with warnings.catch_warnings(record=True):
+            filtered = pydarn.Boxcar().run_filter(data)
+            streamed = pydarn.Boxcar().stream_filter(iter(data))
+            for record in filtered:
+                streamed_record = next(streamed)
+                assert record.keys() == streamed_record.keys()
+                for key in ('slist', 'v', 'w_l', 'p_l', 'elv', 'gflg'):
+                    if key in record:
+                        assert np.array_equal(record[key],
+                                              streamed_record[key],
+                                              equal_nan=True)
+            assert next(streamed, None) is None
+
+    def test_boxcar_cpus(self):
+        with warnings.catch_warnings(record=True):
+            serial = pydarn.Boxcar().run_filter(data)
+            parallel = pydarn.Boxcar().run_filter(data, cpus=2)
+        assert len(serial) == len(parallel)
+        for record, parallel_record in zip(serial, parallel):
+            assert record.keys() == parallel_record.keys()
+            for key in ('slist', 'v', 'w_l', 'p_l', 'elv', 'gflg'):
+                if key in record:
+                    assert np.array_equal(record[key], parallel_record[key],
+                                          equal_nan=True)
+
+    def test_boxcar_median(self):
+        rng = np.random.default_rng(7)
+        records = []
+        for scan in range(3):
+            for bmnum in range(3):
+                slist = np.array([g for g in range(6)
+                                  if rng.random() > 0.3 or g == 2])
+                records.append({'time.yr': 2023, 'time.mo': 10,
+                                'time.dy': 10, 'time.hr': 1,
+                                'time.mt': scan, 'time.sc': bmnum,
+                                'time.us': 0, 'bmnum': bmnum,
+                                'scan': int(bmnum == 0), 'nrang': 6,
+                                'slist': slist,
+                                'gflg': np.ones(len(slist), dtype=np.int8),
+                                **{p: rng.random(len(slist))
+                                   .astype(np.float32)
+                                   for p in ('v', 'w_l', 'p_l', 'elv')}})
+        bx = pydarn.Boxcar(thresh=0.0)
+        with warnings.catch_warnings(record=True):
+            filtered = bx.run_filter(records)
+        # beam 1, gate 2 of the centre scan
+        centre = filtered[4]
+        assert 2 in centre['slist']
+        box = [(rec, gate) for rec in records if 0 <= rec['bmnum'] <= 2
+               for gate in (1, 2, 3)]
+        for p in ('v', 'w_l', 'p_l', 'elv'):
+            values, weights = [], []
+            for rec, gate in box:
+                if gate in rec['slist']:
+                    scan = rec['time.mt']
+                    values.append(rec[p][list(rec['slist']).index(gate)])
+                    weights.append(bx.w[scan][rec['bmnum']][gate - 1])
+            expected = np.median(np.repeat(values, weights))
+            assert centre[p][list(centre['slist']).index(2)] == expected
+
+    def test_boxcar_slots(self):
+        from pydarn.utils.filters import Beam, FetchData, Scan
+        fetch = FetchData(data[:5])
+        fetch.parse_data()
+        beam = fetch.beams[0]
+        assert not hasattr(fetch.scans[0], '__dict__')
+        assert set(Beam.__slots__).isdisjoint(beam.__dict__)
+        # parameters keep the order they were set in
+        assert beam.fields() == tuple(dict.fromkeys([*fetch.s_params,
+                                                     *fetch.v_params,
+                                                     'time']))
+        copied = Beam()
+        copied.copy(beam)
+        assert [k for k, _ in copied.items()] == list(beam.fields())
+        assert getattr(copied, 'noise.sky') == data[0]['noise.sky']
+        with pytest.raises(AttributeError):
+            Scan().extra = 1
+
+    def test_boxcar_gflg_type(self):
+        with pytest.warns(DeprecationWarning):
+            pydarn.Boxcar(gflg_type=0)
+
+    def test_pipeline_boxcar(self):
+        with warnings.catch_warnings(record=True):
+            filtered = pydarn.Boxcar().run_filter(data)
+        pipeline = pydarn.FilterPipeline([pydarn.Boxcar()])
+        piped = pipeline.run_filter(data)
+        assert [name for name, _ in pipeline.timings] == ['parse', 'boxcar',
+                                                          'merge']
+        for a, b in zip(filtered, piped):
+            assert a.keys() == b.keys()
+            for key in ('slist', 'v', 'w_l', 'p_l', 'elv', 'gflg'):
+                if key in a:
+                    assert a[key].dtype == b[key].dtype
+                    assert np.array_equal(a[key], b[key], equal_nan=True)
+
+    def test_pipeline_stages(self):
+        pipeline = pydarn.FilterPipeline([
+            pydarn.ThresholdFilter('slist', minimum=10),
+            pydarn.ThresholdFilter('v', maximum=300, absolute=True),
+            pydarn.GroundScatterFilter(),
+            pydarn.BeamNoiseFilter(factor=1e6)])
+        filtered = pipeline.run_filter(data)
+        assert len(pipeline.timings) == 6
+        for record, frec in zip(data, filtered):
+            if 'slist' not in frec:
+                continue
+            keep = (record['slist'] >= 10) & (np.abs(record['v']) <= 300)
+            assert np.array_equal(frec['slist'], record['slist'][keep])
+            assert np.array_equal(frec['v'], record['v'][keep])
+            ground = np.abs(frec['v']) < 30 - frec['w_l'] / 3
+            assert np.array_equal(frec['gflg'], ground.astype(int))
+
 
 class TestUtils_general:
     def test_greatcircle(self):
@@ -63,6 +223,55 @@ class TestUtils_tdiff:
                                          interferometer_offset)
 
 
+@pytest.mark.parametrize('tdiff', [0.003, -0.003])
+@pytest.mark.parametrize('interferometer_offset', [[0.0, 100.0, 0.0],
+                                                  [1.0, -10.0, 2.0]])
+class TestUtils_elevation:
+    def test_recalcelv_records(self, tdiff, interferometer_offset):
+        records = data[:10] + [{k: v for k, v in data[10].items()
+                                if k != 'phi0'}]
+        with warnings.catch_warnings(record=True):
+            elv = pydarn.recalculate_elevation(records, tdiff=tdiff,
+                                               interferometer_offset=
+                                               interferometer_offset)
+            amended = pydarn.recalculate_elevation(records, tdiff=tdiff,
+                                                   overwrite=True,
+                                                   interferometer_offset=
+                                                   interferometer_offset)
+        assert elv[10] == []
+        assert amended[10] == records[10]
+        for ind in range(10):
+            assert len(elv[ind]) == len(records[ind]['phi0'])
+            assert np.array_equal(amended[ind]['elv'], elv[ind],
+                                  equal_nan=True)
+            # only elv is new
+            assert amended[ind]['v'] is records[ind]['v']
+
+    # the phases of a tdiff are chunked, one tdiff per chunk and every
+    # tdiff in one chunk
+    @pytest.mark.parametrize('max_elements', [100, 2000, 2000000])
+    def test_calibrate_tdiff(self, tdiff, interferometer_offset,
+                             max_elements):
+        tdiffs = [tdiff, 0.0, -tdiff]
+        with warnings.catch_warnings(record=True):
+            sweep = pydarn.calibrate_tdiff(data, tdiffs, interferometer_offset,
+                                           max_elements=max_elements)
+        for i, value in enumerate(tdiffs):
+            with warnings.catch_warnings(record=True):
+                elv = pydarn.recalculate_elevation(data, tdiff=value,
+                                                   interferometer_offset=
+                                                   interferometer_offset)
+            elv = np.concatenate([np.asarray(e, dtype=float)
+                                  for e in elv.values()])
+            elv = elv[np.isfinite(elv)]
+            histogram, _ = np.histogram(elv, bins=sweep['bins'])
+            assert np.array_equal(sweep['histogram'][i], histogram)
+            assert sweep['count'][i] == len(elv)
+            assert sweep['median'][i] == np.median(elv)
+            assert np.isclose(sweep['mean'][i], np.mean(elv))
+            assert np.isclose(sweep['std'][i], np.std(elv))
+
+
 class TestUtils_terminator:
     def test_terminator(self):
         with warnings.catch_warnings(record=True):
@@ -72,4 +281,270 @@ class TestUtils_terminator:
 class TestUtils_calcazi:
     def test_calculateazimuth(self):
         with warnings.catch_warnings(record=True):
-            pydarn.calculate_azimuth(100, 50, 100, 110, 60, 100)
\ No newline at end of file
+            pydarn.calculate_azimuth(100, 50, 100, 110, 60, 100)
+
+    @pytest.mark.parametrize('coords', [pydarn.Coords.GEOGRAPHIC,
+                                        pydarn.Coords.AACGM,
+                                        pydarn.Coords.AACGM_MLT])
+    def test_gate_azimuth_grid(self, coords):
+        date = dt.datetime(2023, 10, 10, 1, 30)
+        lats, lons = np.meshgrid(np.linspace(55, 75, 4),
+                                 np.linspace(-130, -90, 3))
+        azms = pydarn.gate_azimuth(lats, lons, pydarn.RadarID.SAS, coords,
+                                   date)
+        assert azms.shape == lats.shape
+        assert azms[1, 2] == pydarn.gate_azimuth(lats[1, 2], lons[1, 2],
+                                                 pydarn.RadarID.SAS, coords,
+                                                 date)
+
+    def test_declination(self):
+        lats = np.array([60.0, 70.0])
+        lons = np.array([-100.0, 20.0])
+        declinations = pydarn.calculate_declination(lats, lons, 80.6, -72.7)
+        for lat, lon, declination in zip(lats, lons, declinations):
+            a = pydarn.GeneralUtils.great_circle(lon, lat, 0, 90)
+            b = pydarn.GeneralUtils.great_circle(lon, lat, -72.7, 80.6)
+            c = pydarn.GeneralUtils.great_circle(0, 90, -72.7, 80.6)
+            assert declination == np.arccos((np.cos(c) - np.cos(a) *
+                                             np.cos(b)) /
+                                            (np.sin(a) * np.sin(b)))
+
+
+class TestUtils_range_estimations:
+    @pytest.mark.parametrize('range_estimation',
+                             [pydarn.RangeEstimation.SLANT_RANGE,
+                              pydarn.RangeEstimation.HALF_SLANT,
+                              pydarn.RangeEstimation.TIME_OF_FLIGHT,
+                              pydarn.RangeEstimation.GSMR,
+                              pydarn.RangeEstimation.GSMR_BRISTOW])
+    def test_per_record(self, range_estimation):
+        frang = np.array([180, 180, 90])
+        rsep = np.array([45, 15, 15])
+        with warnings.catch_warnings(record=True):
+            ranges = range_estimation(frang=frang, rsep=rsep, nrang=100,
+                                      rxrise=100)
+            assert ranges.shape == (3, 101)
+            for i in range(3):
+                assert np.array_equal(ranges[i],
+                                      range_estimation(frang=frang[i],
+                                                       rsep=rsep[i],
+                                                       nrang=100,
+                                                       rxrise=100),
+                                      equal_nan=True)
+
+    @pytest.mark.parametrize('virtual_height_model',
+                             [pydarn.VHModels.STANDARD,
+                              pydarn.VHModels.CHISHAM])
+    def test_virtual_heights(self, virtual_height_model):
+        target_ranges = np.array([100, 140, 300, 700, 1000, 2500])
+        heights = virtual_height_model(target_range=target_ranges,
+                                       cell_height=300)
+        for target_range, height in zip(target_ranges, heights):
+            assert height == virtual_height_model(target_range=target_range,
+                                                  cell_height=300)
+
+
+class TestUtils_superdarn_radars:
+    def test_lazy_radars(self):
+        radars = pydarn.SuperDARNRadars.radars
+        table = type(radars)({stid: radar._replace(hardware_info=None)
+                              for stid, radar in radars._radars.items()})
+        assert len(table) == len(radars)
+        assert all(radar.hardware_info is None
+                   for radar in table._radars.values())
+        sas = table[pydarn.RadarID.SAS]
+        assert sas.hardware_info == pydarn.read_hdw_file('sas')
+        assert table._radars[pydarn.RadarID.SAS] is sas
+        assert table._radars[pydarn.RadarID.INV].hardware_info is None
+
+    def test_hdw_history(self):
+        pydarn.HdwHistory.clear()
+        epochs, records = pydarn.HdwHistory.get('sas')
+        assert len(epochs) == len(records) > 1
+        assert np.all(np.diff(epochs) > np.timedelta64(0, 's'))
+        dates = [records[0].date - dt.timedelta(days=1), records[1].date,
+                 records[1].date - dt.timedelta(seconds=1)]
+        assert np.array_equal(pydarn.HdwHistory.lookup('sas', dates),
+                              [0, 1, 0])
+        for date in dates:
+            hdw = pydarn.read_hdw_file('sas', date)
+            assert hdw == records[pydarn.HdwHistory.lookup('sas', date)]
+        assert pydarn.read_hdw_history('sas') == records
+
+    def test_hardware_date(self):
+        # Hankasalmi East had 16 beams before 2010-06-27 and 22 after
+        stid = pydarn.RadarID.FHE
+        old = pydarn.SuperDARNRadars.hardware(stid, dt.datetime(2010, 1, 1))
+        new = pydarn.SuperDARNRadars.hardware(stid, dt.datetime(2011, 1, 1))
+        assert (old.beams, new.beams) == (16, 22)
+        assert pydarn.SuperDARNRadars.hardware(stid) == \
+            pydarn.SuperDARNRadars.radars[stid].hardware_info
+        # the FOV and the elevation use the hardware of the date
+        for hdw in (old, new):
+            lats, _ = pydarn.Coords.GEOGRAPHIC(stid=stid, date=hdw.date)
+            assert lats.shape[1] == hdw.beams + 1
+            records = [dict(rec, stid=stid.value) for rec in data[:10]]
+            with warnings.catch_warnings(record=True):
+                elv = pydarn.recalculate_elevation(records, tdiff=0.0,
+                                                   date=hdw.date)
+            phi0 = np.concatenate([rec['phi0'] for rec in records])
+            bmnum = np.repeat([rec['bmnum'] for rec in records],
+                              [len(rec['phi0']) for rec in records])
+            tfreq = np.repeat([rec['tfreq'] for rec in records],
+                              [len(rec['phi0']) for rec in records])
+            expected = pydarn.utils.recalculate_elevation.elevation(
+                phi0, bmnum, tfreq, 0.0, hdw.interferometer_offset,
+                hdw.beams, hdw.beam_separation)
+            assert np.array_equal(np.concatenate(list(elv.values())),
+                                  expected, equal_nan=True)
+        assert pydarn.fov_key(stid, date=old.date) != \
+            pydarn.fov_key(stid, date=new.date)
+
+
+class TestUtils_scan:
+    def test_scan_cube(self):
+        records = pydarn.find_records_by_scan(data, 1)
+        partial = records + [{'bmnum': 0, 'stid': 64}]
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            cube, partial_records = pydarn.build_scan_cube(partial)
+        assert partial_records == 1
+        assert len(w) == 1
+        assert cube['v'].shape == cube['gflg'].shape
+        columns = {key: np.concatenate([rec[key] for rec in records])
+                   for key in ('slist', 'v', 'gflg')}
+        columns['bmnum'] = np.repeat([rec['bmnum'] for rec in records],
+                                     [len(rec['slist']) for rec in records])
+        columnar, _ = pydarn.build_scan_cube(columns, ('v', 'gflg'))
+        assert np.array_equal(columnar['v'], cube['v'], equal_nan=True)
+
+
+class TestUtils_coordinates:
+    def test_fov_cache(self, tmp_path):
+        pydarn.FOVCache.clear()
+        pydarn.FOVCache.set_directory(str(tmp_path))
+        try:
+            lats, lons = pydarn.Coords.GEOGRAPHIC(stid=pydarn.RadarID.SAS)
+            # memory and disk
+            cached = pydarn.Coords.GEOGRAPHIC(stid=pydarn.RadarID.SAS)
+            assert np.array_equal(lats, cached[0])
+            assert len(list(tmp_path.iterdir())) == 1
+            pydarn.FOVCache.clear()
+            stored = pydarn.Coords.GEOGRAPHIC(stid=pydarn.RadarID.SAS)
+            assert np.array_equal(lons, stored[1])
+        finally:
+            pydarn.FOVCache.set_directory(None)
+
+    def test_fov_cache_key(self):
+        key = pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75), 300,
+                                  frang=180, rsep=45)
+        # plot arguments are left out of the key
+        assert key == pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75),
+                                          300, rsep=45, frang=180,
+                                          lowlat=30, alpha=0.5,
+                                          date=dt.datetime(2023, 1, 1))
+        # every other argument can change the geometry
+        assert key != pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75),
+                                          300, frang=180, rsep=45,
+                                          virtual_height=200)
+        assert pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75), 300,
+                                   frang=np.int64(180), rsep=[45]) == \
+            pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75), 300,
+                                frang=180, rsep=(45,))
+
+    def test_fov_atlas(self, tmp_path):
+        filename = str(tmp_path / 'atlas.fov')
+        pydarn.FOVCache.clear()
+        lats, lons = pydarn.Coords.GEOGRAPHIC(stid=pydarn.RadarID.SAS,
+                                              frang=180, rsep=45)
+        entries = pydarn.FOVAtlas.build(filename, stids=[pydarn.RadarID.SAS],
+                                        modes=((180, 45),))
+        assert entries > 0
+        pydarn.FOVCache.clear()
+        pydarn.FOVAtlas.load(filename)
+        try:
+            key = pydarn.FOVCache.key(pydarn.RadarID.SAS, 16, (0, 75), 300,
+                                      frang=180, rsep=45)
+            assert pydarn.FOVAtlas.get(key) is not None
+            atlas = pydarn.Coords.GEOGRAPHIC(stid=pydarn.RadarID.SAS,
+                                             frang=180, rsep=45)
+            assert np.array_equal(lats, atlas[0])
+            assert np.array_equal(lons, atlas[1])
+        finally:
+            pydarn.FOVAtlas.unload()
+            pydarn.FOVCache.clear()
+
+    def test_fov_atlas_epochs(self, tmp_path):
+        filename = str(tmp_path / 'atlas.fov')
+        stid = pydarn.RadarID.FHE
+        radar = pydarn.SuperDARNRadars.radars[stid]
+        pydarn.FOVAtlas.build(filename, stids=[stid], modes=((180, 45),))
+        # the hardware table is left as it is
+        assert pydarn.SuperDARNRadars.radars[stid] is radar
+        pydarn.FOVAtlas.load(filename)
+        try:
+            # 16 beams before 2010-06-27, 22 after
+            boresight = []
+            for hdw in pydarn.read_hdw_history('fhe'):
+                key = pydarn.FOVCache.key(stid, hdw.beams, (0, 75), 300,
+                                          hardware_info=hdw, frang=180,
+                                          rsep=45)
+                lats, lons = pydarn.utils.coordinates._calculate_fov(
+                    stid, hdw.beams, (0, 75), 300, hardware_info=hdw,
+                    frang=180, rsep=45)
+                atlas = pydarn.FOVAtlas.get(key)
+                assert lats.shape == (76, hdw.beams + 1)
+                assert np.array_equal(lats, atlas[0], equal_nan=True)
+                assert np.array_equal(lons, atlas[1], equal_nan=True)
+                boresight.append(lons[:, hdw.beams // 2])
+            # the middle corner of both epochs is on the boresight
+            assert np.allclose(*boresight, equal_nan=True)
+        finally:
+            pydarn.FOVAtlas.unload()
+
+    @pytest.mark.parametrize('virtual_height_model',
+                             [pydarn.VHModels.STANDARD,
+                              pydarn.VHModels.CHISHAM])
+    def test_gate2geographic_location_array(self, virtual_height_model):
+        beams, gates = np.meshgrid(np.arange(0, 17), np.arange(0, 111, 10))
+        lats, lons = pydarn.utils.coordinates.gate2geographic_location(
+            stid=pydarn.RadarID.SAS, beam=beams, range_gate=gates,
+            height=300, virtual_height_model=virtual_height_model)
+        for beam, gate in [(0, 0), (7, 50), (16, 110)]:
+            lat, lon = pydarn.utils.coordinates.gate2geographic_location(
+                stid=pydarn.RadarID.SAS, beam=beam, range_gate=gate,
+                height=300, virtual_height_model=virtual_height_model)
+            assert np.isclose(lats[gate // 10, beam], lat)
+            assert np.isclose(lons[gate // 10, beam], lon)
+
+    def test_aacgm_convert(self):
+        date = dt.datetime(2023, 10, 10, 1, 30)
+        lats = np.array([[52.16, 60.0], [52.16, np.nan]])
+        lons = np.array([[-106.53, -100.0], [-106.53, 10.0]])
+        mlats, mlons = pydarn.aacgm_convert(lats, lons, 250, date)
+        assert mlats.shape == lats.shape
+        assert np.isnan(mlats[1, 1])
+        mlat, mlon, _ = aacgmv2.get_aacgm_coord(60.0, -100.0, 250, date)
+        assert mlats[0, 1] == mlat and mlons[0, 1] == mlon
+        assert mlats[0, 0] == mlats[1, 0]
+
+    def test_aacgm_cache(self):
+        date = dt.datetime(2023, 10, 10, 1, 30, 15, 500)
+        mlons = np.array([-100.0, 0.0, 45.5, np.nan])
+        pydarn.AACGMCache.clear()
+        mlts = pydarn.AACGMCache.convert_mlt(mlons, date)
+        assert np.array_equal(mlts, aacgmv2.convert_mlt(mlons, date),
+                              equal_nan=True)
+        # cached
+        assert np.array_equal(pydarn.AACGMCache.convert_mlt(mlons, date),
+                              mlts, equal_nan=True)
+        assert np.array_equal(
+            pydarn.AACGMCache.convert_mlt(mlts, date, m2a=True),
+            aacgmv2.convert_mlt(mlts, date, m2a=True), equal_nan=True)
+        pydarn.AACGMCache.quantisation = dt.timedelta(hours=1)
+        try:
+            assert pydarn.AACGMCache.convert_mlt(0.0, date)[0] == \
+                aacgmv2.convert_mlt(0.0, dt.datetime(2023, 10, 10, 1))[0]
+        finally:
+            pydarn.AACGMCache.quantisation = dt.timedelta(seconds=1)
+            pydarn.AACGMCache.clear()